@@ -0,0 +1,354 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#include <openPMD/auxiliary/Filesystem.hpp>
+#include <openPMD/openPMD.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+#include <fstream>
+#include <iomanip>
+#include <iostream>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+using namespace openPMD;
+
+namespace
+{
+using Clock = std::chrono::steady_clock;
+
+double secondsSince(Clock::time_point const &start)
+{
+    return std::chrono::duration<double>(Clock::now() - start).count();
+}
+
+std::uintmax_t fileSize(std::string const &path)
+{
+    std::ifstream file(path, std::ios::binary | std::ios::ate);
+    return static_cast<std::uintmax_t>(file.tellg());
+}
+
+/*
+ * Write a smooth 3D field with several HDF5 filter configurations and report
+ * write bandwidth and compression ratio.
+ */
+void benchmarkFilters(std::uint64_t n)
+{
+    std::vector<double> data(n * n * n);
+    for (std::uint64_t i = 0; i < data.size(); ++i)
+    {
+        data[i] = std::sin(1e-3 * double(i)) * std::cos(1e-5 * double(i));
+    }
+    double const megabytes = double(data.size() * sizeof(double)) / 1e6;
+
+    std::map<std::string, std::string> const configs{
+        {"0_none", R"({"filters": []})"},
+        {"1_deflate1", R"({"filters": [{"type": "deflate",
+                                        "parameters": {"level": 1}}]})"},
+        {"2_shuffle_deflate1",
+         R"({"filters": [{"type": "shuffle"},
+                         {"type": "deflate", "parameters": {"level": 1}}]})"},
+        {"3_shuffle_deflate6",
+         R"({"filters": [{"type": "shuffle"},
+                         {"type": "deflate", "parameters": {"level": 6}}]})"},
+        {"4_szip", R"({"filters": [{"type": "szip"}]})"}};
+
+    std::cout << "HDF5 filters, " << megabytes << " MB per dataset\n"
+              << std::setw(22) << "filters" << std::setw(14) << "write [s]"
+              << std::setw(14) << "MB/s" << std::setw(14) << "ratio\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_hdf5_filters_" + label + ".h5";
+        Dataset dataset{Datatype::DOUBLE, {n, n, n}};
+        dataset.options = R"({"hdf5": {"dataset": )" + config + "}}";
+
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE);
+            auto E_x = series.iterations[0].meshes["E"]["x"];
+            E_x.resetDataset(dataset);
+            E_x.storeChunk(data, {0, 0, 0}, {n, n, n});
+            series.flush();
+        }
+        double const seconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << seconds
+                  << std::setw(14) << megabytes / seconds << std::setw(14)
+                  << megabytes * 1e6 / double(fileSize(filename)) << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write a file with many small records and report the time to open and parse
+ * it with a Series for different file space strategies.
+ * Paged aggregation clusters the metadata of many small groups and attributes
+ * into few pages, reducing the number of small reads when opening the file.
+ */
+void benchmarkOpen(std::uint64_t n, size_t records)
+{
+    std::vector<float> data(n);
+    for (std::uint64_t i = 0; i < n; ++i)
+    {
+        data[i] = float(i);
+    }
+
+    std::map<std::string, std::string> const configs{
+        {"0_default", "{}"},
+        {"1_page", R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                         "page_size": 65536}}}})"},
+        {"2_page_buffered",
+         R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                              "page_size": 65536},
+                               "page_buffer_size": 4194304}}})"}};
+
+    std::cout << "HDF5 open and parse, " << records << " records of size " << n
+              << "\n"
+              << std::setw(22) << "file space" << std::setw(14) << "write [s]"
+              << std::setw(14) << "open [s]" << std::setw(14) << "size [kB]\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_hdf5_open_" + label + ".h5";
+
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE, config);
+            auto iteration = series.iterations[0];
+            for (size_t i = 0; i < records; ++i)
+            {
+                auto rc = iteration.meshes["rho_" + std::to_string(i)]
+                                          [MeshRecordComponent::SCALAR];
+                rc.resetDataset({Datatype::FLOAT, {n}});
+                rc.storeChunk(data, {0}, {n});
+            }
+            series.flush();
+        }
+        double const writeSeconds = secondsSince(start);
+
+        start = Clock::now();
+        {
+            Series series(filename, Access::READ_ONLY, config);
+            double sum = 0.;
+            for (auto &[name, mesh] : series.iterations[0].meshes)
+            {
+                sum += mesh.gridSpacing<double>().at(0) +
+                    mesh[MeshRecordComponent::SCALAR].unitSI();
+            }
+            if (sum != 2. * double(records))
+            {
+                throw std::runtime_error("Unexpected metadata in " + filename);
+            }
+        }
+        double const openSeconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << openSeconds << std::setw(14)
+                  << double(fileSize(filename)) / 1e3 << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write and read a particle species in many small chunks and report the
+ * time with and without caching of open dataset handles and coalescing of
+ * queued writes.
+ */
+void benchmarkSmallChunks(std::uint64_t chunks)
+{
+    std::map<std::string, std::string> const configs{
+        {"0_uncached",
+         R"({"hdf5": {"dataset_handle_cache": 0, "coalesce_writes": false}})"},
+        {"1_cached",
+         R"({"hdf5": {"dataset_handle_cache": 32, "coalesce_writes": false}})"},
+        {"2_cached_coalesced",
+         R"({"hdf5": {"dataset_handle_cache": 32, "coalesce_writes": true}})"}};
+    std::vector<double> data(chunks);
+    for (std::uint64_t i = 0; i < chunks; ++i)
+    {
+        data[i] = double(i);
+    }
+
+    std::cout << "HDF5 small chunks, " << chunks
+              << " chunks per record component\n"
+              << std::setw(22) << "config" << std::setw(14) << "write [s]"
+              << std::setw(14) << "read [s]\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_hdf5_small_chunks_" + label + ".h5";
+
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE, config);
+            auto position = series.iterations[0].particles["e"]["position"];
+            for (auto const &component : {"x", "y", "z"})
+            {
+                position[component].resetDataset({Datatype::DOUBLE, {chunks}});
+            }
+            for (std::uint64_t i = 0; i < chunks; ++i)
+            {
+                for (auto const &component : {"x", "y", "z"})
+                {
+                    position[component].storeChunkRaw(
+                        data.data() + i, {i}, {1});
+                }
+            }
+            series.flush();
+        }
+        double const writeSeconds = secondsSince(start);
+
+        start = Clock::now();
+        {
+            Series series(filename, Access::READ_ONLY, config);
+            auto position = series.iterations[0].particles["e"]["position"];
+            std::vector<double> loaded(chunks);
+            for (std::uint64_t i = 0; i < chunks; ++i)
+            {
+                position["x"].loadChunkRaw(loaded.data() + i, {i}, {1});
+            }
+            series.flush();
+            if (loaded != data)
+            {
+                throw std::runtime_error("Unexpected data in " + filename);
+            }
+        }
+        double const readSeconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << readSeconds << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write and read many small attributes of different types and report the
+ * attribute throughput.
+ */
+void benchmarkAttributes(size_t attributes)
+{
+    std::string const filename = "../samples/benchmark_hdf5_attributes.h5";
+    std::vector<double> const vector{1., 2., 3.};
+
+    std::cout << "HDF5 attributes, " << attributes << " per type\n"
+              << std::setw(22) << "type" << std::setw(14) << "write [s]"
+              << std::setw(14) << "read [s]" << std::setw(14) << "attr/s\n";
+    auto run = [&](std::string const &label, auto const &value) {
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE);
+            auto iteration = series.iterations[0];
+            for (size_t i = 0; i < attributes; ++i)
+            {
+                iteration.setAttribute("a_" + std::to_string(i), value);
+            }
+            series.flush();
+        }
+        double const writeSeconds = secondsSince(start);
+
+        start = Clock::now();
+        {
+            Series series(filename, Access::READ_ONLY);
+            auto iteration = series.iterations[0];
+            for (size_t i = 0; i < attributes; ++i)
+            {
+                if (iteration.getAttribute("a_" + std::to_string(i)).dtype ==
+                    Datatype::UNDEFINED)
+                {
+                    throw std::runtime_error(
+                        "Unexpected attribute in " + filename);
+                }
+            }
+        }
+        double const readSeconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << readSeconds << std::setw(14)
+                  << double(attributes) / (writeSeconds + readSeconds) << "\n";
+    };
+    run("int", 42);
+    run("double", 42.);
+    run("vector<double>", vector);
+    run("string", std::string("openPMD"));
+    std::cout << std::endl;
+}
+} // namespace
+
+int main(int argc, char *argv[])
+{
+    if (!getVariants()["hdf5"])
+    {
+        std::cout << "openPMD-api built without HDF5 support, skipping.\n";
+        return 0;
+    }
+
+    // small default size, so this can also run as part of the test suite
+    std::uint64_t n = 32;
+    std::vector<std::string> benchmarks;
+    for (int i = 1; i < argc; ++i)
+    {
+        std::string const arg = argv[i];
+        if ((arg == "-n" || arg == "--size") && i + 1 < argc)
+        {
+            n = std::stoull(argv[++i]);
+        }
+        else if (arg == "-h" || arg == "--help")
+        {
+            std::cout
+                << "Usage: " << argv[0]
+                << " [--size N] [filters] [open] [small_chunks] [attributes]\n"
+                   "Run serial HDF5 benchmarks (default: all):\n"
+                   "  filters:      N^3 sized data (default: N = 32)\n"
+                   "  open:         1000 records of size N\n"
+                   "  small_chunks: 100 * N chunks of size 1\n"
+                   "  attributes:   100 * N attributes per type\n";
+            return 0;
+        }
+        else
+        {
+            benchmarks.push_back(arg);
+        }
+    }
+    auto selected = [&benchmarks](std::string const &name) {
+        return benchmarks.empty() ||
+            std::find(benchmarks.begin(), benchmarks.end(), name) !=
+            benchmarks.end();
+    };
+
+    if (selected("filters"))
+    {
+        benchmarkFilters(n);
+    }
+    if (selected("open"))
+    {
+        benchmarkOpen(n, 1000);
+    }
+    if (selected("small_chunks"))
+    {
+        benchmarkSmallChunks(100 * n);
+    }
+    if (selected("attributes"))
+    {
+        benchmarkAttributes(100 * n);
+    }
+    return 0;
+}
@@ -0,0 +1,412 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#include <openPMD/auxiliary/Filesystem.hpp>
+#include <openPMD/openPMD.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <fstream>
+#include <iomanip>
+#include <iostream>
+#include <map>
+#include <random>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+using namespace openPMD;
+
+namespace
+{
+using Clock = std::chrono::steady_clock;
+
+double secondsSince(Clock::time_point const &start)
+{
+    return std::chrono::duration<double>(Clock::now() - start).count();
+}
+
+std::uintmax_t fileSize(std::string const &path)
+{
+    std::ifstream file(path, std::ios::binary | std::ios::ate);
+    return file ? static_cast<std::uintmax_t>(file.tellg()) : 0;
+}
+
+/*
+ * Write a group-based Series with a large hierarchy (many iterations, each
+ * with many meshes and particle species) and report the time to open and
+ * parse it, once in random-access mode and once in linear read mode.
+ * ADIOS2 has no notion of groups, so the backend reconstructs the hierarchy
+ * from the variable and attribute names while parsing.
+ */
+void benchmarkHierarchy(size_t iterations)
+{
+    constexpr size_t meshes = 20;
+    constexpr size_t species = 10;
+    std::map<std::string, std::string> const configs{
+        {"0_attributes", "{}"},
+        {"1_variables", R"({"adios2": {"schema": 20210209}})"}};
+    std::cout << "ADIOS2 open and parse, " << iterations << " iterations with "
+              << meshes << " meshes and " << species << " species each\n"
+              << std::setw(22) << "attribute layout" << std::setw(14)
+              << "write [s]" << std::setw(14) << "open [s]" << std::setw(14)
+              << "linear [s]\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_adios2_hierarchy_" + label + ".bp";
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE, config);
+            series.setIterationEncoding(IterationEncoding::groupBased);
+            for (size_t i = 0; i < iterations; ++i)
+            {
+                auto iteration = series.writeIterations()[i];
+                for (size_t m = 0; m < meshes; ++m)
+                {
+                    auto rc = iteration.meshes["rho_" + std::to_string(m)]
+                                              [MeshRecordComponent::SCALAR];
+                    rc.resetDataset({Datatype::FLOAT, {1}});
+                    rc.makeConstant(float(m));
+                }
+                for (size_t s = 0; s < species; ++s)
+                {
+                    auto position =
+                        iteration
+                            .particles["e_" + std::to_string(s)]["position"];
+                    for (auto const &component : {"x", "y", "z"})
+                    {
+                        std::vector<float> data{float(s)};
+                        position[component].resetDataset(
+                            {Datatype::FLOAT, {1}});
+                        position[component].storeChunk(data, {0}, {1});
+                    }
+                }
+                iteration.close();
+            }
+        }
+        double const writeSeconds = secondsSince(start);
+        auto check = [&filename](Iteration &iteration) {
+            if (iteration.meshes.size() != meshes ||
+                iteration.particles.size() != species)
+            {
+                throw std::runtime_error("Unexpected hierarchy in " + filename);
+            }
+        };
+        start = Clock::now();
+        {
+            Series series(filename, Access::READ_ONLY, config);
+            for (auto &[index, iteration] : series.iterations)
+            {
+                check(iteration);
+            }
+        }
+        double const openSeconds = secondsSince(start);
+        start = Clock::now();
+        {
+            Series series(filename, Access::READ_LINEAR, config);
+            for (auto iteration : series.readIterations())
+            {
+                check(iteration);
+                iteration.close();
+            }
+        }
+        double const linearSeconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << openSeconds << std::setw(14)
+                  << linearSeconds << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write a variable-based Series of 20 steps with a 3D field of N^3 doubles
+ * each and report the time to read it in linear read mode while processing
+ * every step, with and without reading ahead the next step.
+ */
+void benchmarkPrefetch(std::uint64_t n)
+{
+    constexpr size_t steps = 20;
+    std::string const filename = "../samples/benchmark_adios2_prefetch.bp";
+    std::vector<double> data(n * n * n);
+    for (std::uint64_t i = 0; i < data.size(); ++i)
+    {
+        data[i] = double(i % 1000);
+    }
+    {
+        Series series(filename, Access::CREATE);
+        series.setIterationEncoding(IterationEncoding::variableBased);
+        for (size_t i = 0; i < steps; ++i)
+        {
+            auto iteration = series.writeIterations()[i];
+            auto E_x = iteration.meshes["E"]["x"];
+            E_x.resetDataset({Datatype::DOUBLE, {n, n, n}});
+            E_x.storeChunk(data, {0, 0, 0}, {n, n, n});
+            iteration.close();
+        }
+    }
+    double const megabytes = double(data.size() * sizeof(double)) / 1e6;
+    std::map<std::string, std::string> const configs{
+        {"0_none", "{}"},
+        {"1_prefetch",
+         R"({"adios2": {"prefetch_memory": )" +
+             std::to_string(2 * data.size() * sizeof(double)) + "}}"}};
+    std::cout << "ADIOS2 linear read of " << steps << " steps, " << megabytes
+              << " MB per step\n"
+              << std::setw(22) << "config" << std::setw(14) << "read [s]\n";
+    for (auto const &[label, config] : configs)
+    {
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::READ_LINEAR, config);
+            for (auto iteration : series.readIterations())
+            {
+                auto E_x = iteration.meshes["E"]["x"].loadChunk<double>();
+                iteration.close();
+                // stand-in for the analysis of one step
+                double sum = 0.;
+                for (size_t pass = 0; pass < 10; ++pass)
+                {
+                    for (std::uint64_t i = 0; i < data.size(); ++i)
+                    {
+                        sum += E_x.get()[i] * double(pass);
+                    }
+                }
+                if (sum < 0. || E_x.get()[data.size() - 1] != data.back())
+                {
+                    throw std::runtime_error("Unexpected data in " + filename);
+                }
+            }
+        }
+        std::cout << std::setw(22) << label << std::setw(14)
+                  << secondsSince(start) << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write a particle species in many small chunks, as done by codes storing
+ * one chunk per tile, and report the number of resulting ADIOS2 blocks, the
+ * metadata size and the time to read the data back, with and without
+ * aggregation of contiguous stores.
+ */
+void benchmarkSmallChunks(std::uint64_t chunks)
+{
+    constexpr std::uint64_t chunkSize = 16;
+    std::map<std::string, std::string> const configs{
+        {"0_none", "{}"},
+        {"1_aggregated", R"({"adios2": {"aggregate_puts": true}})"}};
+    std::cout << "ADIOS2 small chunks, " << chunks << " chunks of size "
+              << chunkSize << " per record component\n"
+              << std::setw(22) << "config" << std::setw(14) << "write [s]"
+              << std::setw(14) << "blocks" << std::setw(14) << "md [kB]"
+              << std::setw(14) << "read [s]\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_adios2_small_chunks_" + label + ".bp";
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE, config);
+            auto iteration = series.writeIterations()[0];
+            auto position = iteration.particles["e"]["position"];
+            for (auto const &component : {"x", "y", "z"})
+            {
+                position[component].resetDataset(
+                    {Datatype::DOUBLE, {chunks * chunkSize}});
+            }
+            for (std::uint64_t i = 0; i < chunks; ++i)
+            {
+                for (auto const &component : {"x", "y", "z"})
+                {
+                    std::shared_ptr<double[]> data(new double[chunkSize]);
+                    for (std::uint64_t j = 0; j < chunkSize; ++j)
+                    {
+                        data[j] = double(i * chunkSize + j);
+                    }
+                    position[component].storeChunk(
+                        data, {i * chunkSize}, {chunkSize});
+                }
+            }
+            iteration.close();
+        }
+        double const writeSeconds = secondsSince(start);
+        std::uintmax_t metadata = 0;
+        for (auto const &file : auxiliary::list_directory(filename))
+        {
+            if (file.rfind("md.", 0) == 0 || file.rfind("mmd.", 0) == 0)
+            {
+                metadata += fileSize(filename + "/" + file);
+            }
+        }
+        start = Clock::now();
+        size_t blocks = 0;
+        {
+            Series series(filename, Access::READ_ONLY);
+            auto position = series.iterations[0].particles["e"]["position"];
+            blocks = position["x"].availableChunks().size();
+            auto x = position["x"].loadChunk<double>();
+            series.flush();
+            if (x.get()[chunks * chunkSize - 1] !=
+                double(chunks * chunkSize - 1))
+            {
+                throw std::runtime_error("Unexpected data in " + filename);
+            }
+        }
+        double const readSeconds = secondsSince(start);
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << blocks << std::setw(14)
+                  << double(metadata) / 1e3 << std::setw(14) << readSeconds
+                  << "\n";
+    }
+    std::cout << std::endl;
+}
+
+/*
+ * Write a particle species with integer IDs, smooth positions and noisy
+ * momenta, without compression, with bzip2 for all datasets and with the
+ * operator chosen per dataset by operator type "auto", and report the
+ * time and the size of the written data.
+ */
+void benchmarkOperators(std::uint64_t particles)
+{
+    std::map<std::string, std::string> const configs{
+        {"0_none", "{}"},
+        {"1_bzip2",
+         R"({"adios2": {"dataset": {"operators": [{"type": "bzip2"}]}}})"},
+        {"2_auto",
+         R"({"adios2": {"dataset": {"operators": [{"type": "auto"}]}}})"}};
+    std::vector<std::uint64_t> id(particles);
+    std::vector<double> position(particles);
+    std::vector<double> momentum(particles);
+    std::mt19937_64 engine(0);
+    std::normal_distribution<double> dist;
+    for (std::uint64_t i = 0; i < particles; ++i)
+    {
+        id[i] = i;
+        position[i] = double(i) / double(particles);
+        momentum[i] = dist(engine);
+    }
+    std::cout << "ADIOS2 operators, " << particles << " particles\n"
+              << std::setw(22) << "config" << std::setw(14) << "write [s]"
+              << std::setw(14) << "data [kB]\n";
+    for (auto const &[label, config] : configs)
+    {
+        std::string const filename =
+            "../samples/benchmark_adios2_operators_" + label + ".bp";
+        auto start = Clock::now();
+        {
+            Series series(filename, Access::CREATE, config);
+            auto iteration = series.writeIterations()[0];
+            auto species = iteration.particles["e"];
+            auto idComponent = species["id"][RecordComponent::SCALAR];
+            idComponent.resetDataset(
+                {determineDatatype<std::uint64_t>(), {particles}});
+            idComponent.storeChunk(id, {0}, {particles});
+            for (auto const &component : {"x", "y", "z"})
+            {
+                species["position"][component].resetDataset(
+                    {Datatype::DOUBLE, {particles}});
+                species["position"][component].storeChunk(
+                    position, {0}, {particles});
+                species["momentum"][component].resetDataset(
+                    {Datatype::DOUBLE, {particles}});
+                species["momentum"][component].storeChunk(
+                    momentum, {0}, {particles});
+            }
+            iteration.close();
+        }
+        double const writeSeconds = secondsSince(start);
+        std::uintmax_t data = 0;
+        for (auto const &file : auxiliary::list_directory(filename))
+        {
+            if (file.rfind("data.", 0) == 0)
+            {
+                data += fileSize(filename + "/" + file);
+            }
+        }
+        std::cout << std::setw(22) << label << std::setw(14) << writeSeconds
+                  << std::setw(14) << double(data) / 1e3 << "\n";
+    }
+    std::cout << std::endl;
+}
+} // namespace
+
+int main(int argc, char *argv[])
+{
+    if (!getVariants()["adios2"])
+    {
+        std::cout << "openPMD-api built without ADIOS2 support, skipping.\n";
+        return 0;
+    }
+
+    // small default size, so this can also run as part of the test suite
+    std::uint64_t n = 32;
+    std::vector<std::string> benchmarks;
+    for (int i = 1; i < argc; ++i)
+    {
+        std::string const arg = argv[i];
+        if ((arg == "-n" || arg == "--size") && i + 1 < argc)
+        {
+            n = std::stoull(argv[++i]);
+        }
+        else if (arg == "-h" || arg == "--help")
+        {
+            std::cout << "Usage: " << argv[0]
+                      << " [--size N] [hierarchy] [prefetch] [small_chunks] "
+                         "[operators]\n"
+                         "Run serial ADIOS2 benchmarks (default: all):\n"
+                         "  hierarchy:    N iterations with 20 meshes and 10 "
+                         "species each\n"
+                         "  prefetch:     20 steps of N^3 sized data\n"
+                         "  small_chunks: 100 * N chunks of size 16\n"
+                         "  operators:    N^3 particles\n";
+            return 0;
+        }
+        else
+        {
+            benchmarks.push_back(arg);
+        }
+    }
+    auto selected = [&benchmarks](std::string const &name) {
+        return benchmarks.empty() ||
+            std::find(benchmarks.begin(), benchmarks.end(), name) !=
+            benchmarks.end();
+    };
+
+    if (selected("hierarchy"))
+    {
+        benchmarkHierarchy(n);
+    }
+    if (selected("prefetch"))
+    {
+        benchmarkPrefetch(n);
+    }
+    if (selected("small_chunks"))
+    {
+        benchmarkSmallChunks(100 * n);
+    }
+    if (selected("operators"))
+    {
+        benchmarkOperators(n * n * n);
+    }
+    return 0;
+}
@@ -22,6 +22,7 @@
 
 #include "openPMD/IO/ADIOS/ADIOS2Auxiliary.hpp"
 #include "openPMD/IO/ADIOS/ADIOS2FilePosition.hpp"
+#include "openPMD/IO/ADIOS/ADIOS2PathIndex.hpp"
 #include "openPMD/IO/ADIOS/ADIOS2PreloadAttributes.hpp"
 #include "openPMD/IO/AbstractIOHandler.hpp"
 #include "openPMD/IO/AbstractIOHandlerImpl.hpp"
@@ -31,6 +32,7 @@
 #include "openPMD/IO/InvalidatableFile.hpp"
 #include "openPMD/IterationEncoding.hpp"
 #include "openPMD/auxiliary/JSON_internal.hpp"
+#include "openPMD/auxiliary/ThreadPool.hpp"
 #include "openPMD/backend/Writable.hpp"
 #include "openPMD/config.hpp"
 
@@ -43,13 +45,17 @@
 #include <nlohmann/json.hpp>
 
 #include <array>
+#include <deque>
 #include <exception>
+#include <functional>
 #include <future>
 #include <iostream>
+#include <list>
 #include <memory> // shared_ptr
 #include <optional>
 #include <set>
 #include <string>
+#include <tuple>
 #include <unordered_map>
 #include <utility> // pair
 #include <vector>
@@ -66,6 +72,10 @@ namespace detail
     struct DatasetHelper;
     struct GetSpan;
     struct DatasetReader;
+    struct ReadByBlocks;
+    struct PrefetchVariable;
+    struct ReadPrefetched;
+    struct SelectOperator;
     struct AttributeReader;
     struct AttributeWriter;
     struct OldAttributeReader;
@@ -112,6 +122,9 @@ class ADIOS2IOHandlerImpl
     friend struct detail::DatasetHelper;
     friend struct detail::GetSpan;
     friend struct detail::DatasetReader;
+    friend struct detail::ReadByBlocks;
+    friend struct detail::ReadPrefetched;
+    friend struct detail::SelectOperator;
     friend struct detail::AttributeReader;
     friend struct detail::AttributeWriter;
     friend struct detail::OldAttributeReader;
@@ -124,6 +137,7 @@ class ADIOS2IOHandlerImpl
     friend struct detail::DatasetTypes;
     friend struct detail::WriteDataset;
     friend struct detail::BufferedActions;
+    friend struct detail::BufferedGet;
     friend struct detail::BufferedAttributeRead;
     friend struct detail::RunUniquePtrPut;
 
@@ -201,6 +215,9 @@ public:
     void
     getBufferView(Writable *, Parameter<Operation::GET_BUFFER_VIEW> &) override;
 
+    void readBufferView(
+        Writable *, Parameter<Operation::READ_BUFFER_VIEW> &) override;
+
     void readAttribute(Writable *, Parameter<Operation::READ_ATT> &) override;
 
     void listPaths(Writable *, Parameter<Operation::LIST_PATHS> &) override;
@@ -268,6 +285,71 @@ private:
 
     UseSpan m_useSpanBasedPutByDefault = UseSpan::Auto;
 
+    /*
+     * Read datasets by loading the intersecting blocks as written and keeping
+     * them in the block cache for later loads.
+     * Configured via adios2.read_by_blocks.
+     */
+    bool m_readByBlocks = false;
+
+    /*
+     * adios2.read_threads, zero for the number of hardware threads.
+     * Empty if not specified, leaving the parallelization of reads to ADIOS2.
+     */
+    std::optional<unsigned> m_readThreads;
+    // created upon first use, see readThreadPool()
+    std::unique_ptr<auxiliary::ThreadPool> m_readThreadPool;
+
+    unsigned readThreads() const;
+    auxiliary::ThreadPool &readThreadPool();
+
+    /*
+     * adios2.prefetch_memory: Upon ending a step in a stream opened for
+     * reading, begin the next step in the background and read its global
+     * variables in full, as long as they fit into this many bytes.
+     * Zero for no prefetching.
+     */
+    size_t m_prefetchMemory = 0;
+    size_t m_prefetchedSteps = 0;
+    size_t m_prefetchedBytes = 0;
+    // loads served from prefetched data
+    size_t m_prefetchHits = 0;
+
+    /*
+     * adios2.aggregate_puts: Merge contiguous one-dimensional stores to the
+     * same dataset within one flush into a single ADIOS2 block.
+     */
+    bool m_aggregatePuts = false;
+    // stores that were merged and the blocks that they were merged into
+    size_t m_aggregatedPuts = 0;
+    size_t m_aggregatedBlocks = 0;
+
+    // operators chosen by AutoOperatorPolicy, and how often
+    std::map<std::string, size_t> m_selectedOperators;
+
+    /*
+     * adios2.engine.auto_buffer_size: Preallocate the engine buffer of files
+     * opened for writing from the largest amount of data put per step within
+     * the last few steps.
+     */
+    bool m_autoBufferSize = false;
+    // bytes put per step, most recent step last
+    std::deque<size_t> m_recentStepSizes;
+    size_t m_stepsWritten = 0;
+    size_t m_largestStep = 0;
+    // steps that needed more than the engine buffer held at their beginning
+    size_t m_bufferGrowths = 0;
+
+    void recordStepSize(size_t bytes, bool bufferGrew);
+    // empty if there is no step to go by yet
+    std::optional<size_t> predictedStepSize() const;
+
+    /*
+     * Print backend-internal counters to stderr upon destruction.
+     * Configured via OPENPMD_ADIOS2_REPORT.
+     */
+    bool m_printReport = false;
+
     enum class AttributeLayout : char
     {
         ByAdiosAttributes,
@@ -305,12 +387,61 @@ private:
         throw std::runtime_error("Unreachable!");
     }
 
+    /*
+     * Operator type "auto" in dataset.operators: Instead of a fixed operator,
+     * try the available compressors on a sample of the data first stored to
+     * the dataset and apply the one with the best compression ratio among
+     * those fast enough.
+     */
+    struct AutoOperatorPolicy
+    {
+        // bytes from the beginning of the first stored chunk
+        size_t sampleSize = 256 * 1024;
+        // seconds, no further candidates are tried once exceeded
+        double timeBudget = 0.5;
+        // MB/s, compressors slower than this on the sample are not chosen
+        double minThroughput = 100.;
+    };
+
     struct ParameterizedOperator
     {
         adios2::Operator op;
         adios2::Params params;
+        // set instead of op for type "auto"
+        std::optional<AutoOperatorPolicy> autoPolicy;
+    };
+
+    // outcome of an AutoOperatorPolicy trial, empty type for no operator
+    struct AutoOperatorChoice
+    {
+        std::string label;
+        std::string type;
+        adios2::Params params;
     };
 
+    /*
+     * Choices made by AutoOperatorPolicy, keyed by autoOperatorKey() so that
+     * the trials run once per dataset and not once per iteration or file.
+     * Under MPI, every rank decides for its own data.
+     */
+    std::map<std::string, AutoOperatorChoice> m_autoOperatorChoices;
+
+    // variable name without the iteration prefix
+    static std::string autoOperatorKey(std::string const &varName);
+
+    /*
+     * The operators to add to a variable for a choice, and recording that
+     * choice as an attribute of the variable.
+     * The attribute is skipped under MPI since the ranks might have chosen
+     * differently.
+     */
+    std::vector<ParameterizedOperator>
+    autoOperators(AutoOperatorChoice const &);
+    void recordAutoOperator(
+        detail::BufferedActions &,
+        std::string const &varName,
+        AutoOperatorChoice const &);
+
     std::vector<ParameterizedOperator> defaultOperators;
 
     json::TracingJSON m_config;
@@ -350,6 +481,9 @@ private:
     // use m_config
     std::optional<std::vector<ParameterizedOperator>> getOperators();
 
+    // parameters of operator type "auto"
+    static AutoOperatorPolicy getAutoOperatorPolicy(adios2::Params const &);
+
     std::string fileSuffix(bool verbose = true) const;
 
     /*
@@ -379,6 +513,34 @@ private:
 
     std::map<std::string, adios2::Operator> m_operators;
 
+    /*
+     * LRU cache of blocks loaded in full when reading by blocks, shared by
+     * all open files and bounded by adios2.block_cache_size in bytes.
+     * Most recently used blocks come first.
+     * Blocks are identified by file, variable, step and block ID.
+     */
+    using BlockCacheKey = std::tuple<std::string, std::string, size_t, size_t>;
+    struct CachedBlock
+    {
+        BlockCacheKey key;
+        std::shared_ptr<void> data;
+        size_t size;
+    };
+    std::list<CachedBlock> m_blockCache;
+    std::map<BlockCacheKey, std::list<CachedBlock>::iterator> m_blockCacheIndex;
+    size_t m_blockCacheMaxSize = 1024ul * 1024ul * 1024ul;
+    size_t m_blockCacheSize = 0;
+    size_t m_blockCacheHits = 0;
+    size_t m_blockCacheMisses = 0;
+    size_t m_blockCacheEvictions = 0;
+
+    // empty if not cached, counts as hit or miss
+    std::shared_ptr<void> cachedBlock(BlockCacheKey const &);
+    // evicts least recently used blocks if exceeding the size limit
+    void cacheBlock(BlockCacheKey, std::shared_ptr<void> data, size_t size);
+    // drop all cached blocks of a file, e.g. when closing it or a step
+    void dropCachedBlocks(std::string const &file);
+
     // Overrides from AbstractIOHandlerImplCommon.
 
     std::string
@@ -454,12 +616,16 @@ namespace ADIOS2Defaults
     constexpr const_str str_params = "parameters";
     constexpr const_str str_usesteps = "usesteps";
     constexpr const_str str_flushtarget = "preferred_flush_target";
+    constexpr const_str str_autoBufferSize = "auto_buffer_size";
     constexpr const_str str_usesstepsAttribute = "__openPMD_internal/useSteps";
     constexpr const_str str_adios2Schema =
         "__openPMD_internal/openPMD2_adios2_schema";
     constexpr const_str str_isBooleanOldLayout = "__is_boolean__";
     constexpr const_str str_isBooleanNewLayout =
         "__openPMD_internal/is_boolean";
+    constexpr const_str str_autoOperator = "auto";
+    constexpr const_str str_selectedOperatorAttribute =
+        "__openPMD_internal/operator";
 } // namespace ADIOS2Defaults
 
 namespace detail
@@ -484,6 +650,42 @@ namespace detail
         static constexpr char const *errorMsg = "ADIOS2: readDataset()";
     };
 
+    struct ReadByBlocks
+    {
+        template <typename T>
+        static void call(BufferedGet &bp, BufferedActions &ba);
+
+        static constexpr char const *errorMsg = "ADIOS2: readDataset()";
+    };
+
+    struct PrefetchVariable
+    {
+        template <typename T>
+        static void
+        call(BufferedActions &ba, std::string const &name, size_t &budget);
+
+        static constexpr char const *errorMsg = "ADIOS2: prefetch()";
+    };
+
+    struct ReadPrefetched
+    {
+        template <typename T>
+        static void call(BufferedGet &bp, BufferedActions &ba);
+
+        static constexpr char const *errorMsg = "ADIOS2: readDataset()";
+    };
+
+    struct SelectOperator
+    {
+        template <typename T>
+        static void call(
+            BufferedActions &ba,
+            BufferedPut const &bp,
+            ADIOS2IOHandlerImpl::AutoOperatorPolicy const &policy);
+
+        static constexpr char const *errorMsg = "ADIOS2: selectOperator()";
+    };
+
     struct OldAttributeReader
     {
         template <typename T>
@@ -967,6 +1169,17 @@ namespace detail
         void *update() override;
     };
 
+    /*
+     * Backend-owned memory that loaded chunks are read into when the frontend
+     * asks for a read view instead of providing its own buffer.
+     */
+    struct ReadViewBuffer
+    {
+        std::shared_ptr<char[]> data;
+        size_t size = 0;
+        bool usedInStep = false;
+    };
+
     /*
      * Manages per-file information about
      * (1) the file's IO and Engine objects
@@ -975,6 +1188,10 @@ namespace detail
     struct BufferedActions
     {
         friend struct BufferedGet;
+        friend struct ReadByBlocks;
+        friend struct PrefetchVariable;
+        friend struct ReadPrefetched;
+        friend struct SelectOperator;
         friend struct BufferedPut;
         friend struct RunUniquePtrPut;
         friend struct WriteDataset;
@@ -1058,6 +1275,71 @@ namespace detail
          * This map is cleared upon flush points.
          */
         std::map<unsigned, std::unique_ptr<I_UpdateSpan>> m_updateSpans;
+        /**
+         * Buffers handed out to the frontend as read views.
+         * A buffer is reused for another view as soon as the frontend has
+         * dropped all references to it, so repeated loads of same-sized chunks
+         * in a stream do not allocate anew in each step.
+         * Buffers that have not been needed during a step are released from
+         * the pool at the end of that step, or at each flush if reading
+         * without steps. Buffers more than twice the requested size are not
+         * reused.
+         */
+        std::vector<ReadViewBuffer> m_readViewBuffers;
+        /**
+         * Copies from loaded blocks into the user buffers if reading by
+         * blocks. Must run after the Gets have been performed.
+         * The entries may run concurrently, so the copies of a load from
+         * overlapping blocks are bundled into a single entry.
+         */
+        std::vector<std::function<void()>> m_blockCopies;
+        /**
+         * Background task started upon ENDSTEP if adios2.prefetch_memory is
+         * set. It begins the next step and fills m_prefetching, its result is
+         * the status of BeginStep(). The engine and IO belong to the task
+         * while it runs, see awaitPrefetch().
+         */
+        std::future<adios2::StepStatus> m_prefetch;
+        struct PrefetchedVariable
+        {
+            std::shared_ptr<void> data;
+            adios2::Dims shape;
+            size_t bytes = 0;
+        };
+        // filled by the background task
+        std::map<std::string, PrefetchedVariable> m_prefetching;
+        // prefetched variables of the current step
+        std::map<std::string, PrefetchedVariable> m_prefetched;
+
+        void startPrefetch();
+        /**
+         * Wait for the background task if one is running and make its data
+         * available in m_prefetched.
+         *
+         * @return The status of the step begun by the background task, or
+         *     empty if no task was running.
+         */
+        std::optional<adios2::StepStatus> awaitPrefetch();
+        /**
+         * Variables defined with operator type "auto" whose operator has not
+         * been chosen yet, since no data has been stored to them.
+         */
+        std::map<std::string, ADIOS2IOHandlerImpl::AutoOperatorPolicy>
+            m_autoOperators;
+        /**
+         * Bytes put in the current step, for adios2.engine.auto_buffer_size.
+         */
+        size_t m_bytesPutInStep = 0;
+        /**
+         * Estimated size of the engine buffer: The preallocated size at first,
+         * then the size of the largest step written so far.
+         */
+        size_t m_bufferCapacity = 0;
+        /**
+         * Report the bytes put in the current step to the ADIOS2IOHandlerImpl
+         * and start counting anew.
+         */
+        void recordStepSize();
         PreloadAdiosAttributes preloadAttributes;
 
         /*
@@ -1098,6 +1380,12 @@ namespace detail
         adios2::Engine &getEngine();
         adios2::Engine &requireActiveStep();
 
+        /**
+         * Get a buffer of at least the requested size from
+         * m_readViewBuffers, allocating a new one if none is free.
+         */
+        std::shared_ptr<void> getReadViewBuffer(size_t size);
+
         template <typename BA>
         void enqueue(BA &&ba);
 
@@ -1174,11 +1462,30 @@ namespace detail
          */
         void drop();
 
+        /*
+         * For adios2.aggregate_puts: Replace runs of contiguous
+         * one-dimensional BufferedPuts to the same variable in m_buffer by a
+         * single BufferedPut, copying their data into one staging buffer.
+         */
+        void aggregatePuts();
+
+        /*
+         * For operator type "auto": Choose and add the operators of the
+         * variables in m_autoOperators that BufferedPuts in m_buffer store to.
+         */
+        void selectOperators();
+
         AttributeMap_t const &availableAttributes();
 
         std::vector<std::string>
         availableAttributesPrefixed(std::string const &prefix);
 
+        /*
+         * Hierarchical index over availableAttributes(), for listing the
+         * attributes of a group without visiting its whole subtree.
+         */
+        PathIndex const &attributeIndex();
+
         /*
          * See description below.
          */
@@ -1186,8 +1493,12 @@ namespace detail
 
         AttributeMap_t const &availableVariables();
 
-        std::vector<std::string>
-        availableVariablesPrefixed(std::string const &prefix);
+        /*
+         * Hierarchical index over availableVariables(), for listing the
+         * datasets and subgroups of a group without visiting its whole
+         * subtree.
+         */
+        PathIndex const &variableIndex();
 
         /*
          * See description below.
@@ -1306,7 +1617,11 @@ namespace detail
          * IO::Available(Attributes|Variables).
          */
         std::optional<AttributeMap_t> m_availableAttributes;
+        // built from m_availableAttributes, invalidated along with it
+        std::optional<PathIndex> m_attributeIndex;
         std::optional<AttributeMap_t> m_availableVariables;
+        // built from m_availableVariables, invalidated along with it
+        std::optional<PathIndex> m_variableIndex;
 
         /*
          * Cannot write attributes right after opening the engine
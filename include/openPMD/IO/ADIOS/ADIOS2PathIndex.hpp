@@ -0,0 +1,92 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include "openPMD/config.hpp"
+#if openPMD_HAVE_ADIOS2
+
+#include <adios2.h>
+#include <functional>
+#include <map>
+#include <string>
+#include <string_view>
+#include <vector>
+
+namespace openPMD
+{
+namespace detail
+{
+    /**
+     * Hierarchical index over '/'-separated ADIOS2 attribute or variable
+     * names, built in one pass over the maps returned by
+     * IO::Available(Attributes|Variables).
+     *
+     * The flat maps returned by ADIOS2 can only be searched by prefix, so
+     * listing the contents of one group visits the whole subtree below it.
+     * Parsing a Series lists every group, resulting in a runtime of
+     * O(groups x names). Looking up a group in this index visits only its
+     * path components and its direct children instead.
+     *
+     * Prefixes are treated like in
+     * BufferedActions::available(Attributes|Variables)Prefixed, i.e. a
+     * trailing slash is optional and the empty prefix denotes the root
+     * group "/".
+     */
+    class PathIndex
+    {
+    public:
+        explicit PathIndex(std::map<std::string, adios2::Params> const &names);
+
+        /**
+         * Names found directly below the group at prefix.
+         */
+        std::vector<std::string> entries(std::string const &prefix) const;
+
+        /**
+         * Groups found directly below the group at prefix, i.e. those
+         * path components that are followed by further components in at
+         * least one name.
+         */
+        std::vector<std::string> groups(std::string const &prefix) const;
+
+        /**
+         * Whether the index contains exactly this name.
+         */
+        bool contains(std::string const &name) const;
+
+    private:
+        struct Node
+        {
+            // std::less<> for lookups by std::string_view
+            std::map<std::string, size_t, std::less<>> children;
+            // true if a name ends at this node
+            bool isEntry = false;
+        };
+        // root node at index 0
+        std::vector<Node> m_nodes;
+
+        void insert(std::string_view name);
+        Node const *find(std::string_view prefix) const;
+    };
+} // namespace detail
+} // namespace openPMD
+
+#endif // openPMD_HAVE_ADIOS2
@@ -29,6 +29,7 @@
 #include <mpi.h>
 #endif
 
+#include <deque>
 #include <future>
 #include <memory>
 #include <queue>
@@ -213,7 +214,7 @@ public:
      */
     virtual void enqueue(IOTask const &iotask)
     {
-        m_work.push(iotask);
+        m_work.push_back(iotask);
     }
 
     /** Process operations in queue according to FIFO.
@@ -233,6 +234,16 @@ public:
     /** The currently used backend */
     virtual std::string backendName() const = 0;
 
+    /** Whether the backend implements Operation::READ_ALL_ATTS.
+     *
+     * Otherwise, the frontend lists the attributes of an object and reads
+     * them one by one.
+     */
+    virtual bool supportsReadAllAttributes() const
+    {
+        return false;
+    }
+
     std::string const directory;
     /*
      * Originally, the reason for distinguishing these two was that during
@@ -252,7 +263,11 @@ public:
     Access const m_backendAccess;
     Access const m_frontendAccess;
     internal::SeriesStatus m_seriesStatus = internal::SeriesStatus::Default;
-    std::queue<IOTask> m_work;
+    /*
+     * A deque instead of a queue, so backends may look ahead at the tasks
+     * still pending within the current flush.
+     */
+    std::deque<IOTask> m_work;
 }; // AbstractIOHandler
 
 } // namespace openPMD
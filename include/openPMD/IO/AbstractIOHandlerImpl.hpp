@@ -160,6 +160,12 @@ public:
                         deref_dynamic_cast<Parameter<O::GET_BUFFER_VIEW> >(
                             i.parameter.get()));
                     break;
+                case O::READ_BUFFER_VIEW:
+                    readBufferView(
+                        i.writable,
+                        deref_dynamic_cast<Parameter<O::READ_BUFFER_VIEW> >(
+                            i.parameter.get()));
+                    break;
                 case O::READ_ATT:
                     readAttribute(
                         i.writable,
@@ -184,6 +190,12 @@ public:
                         deref_dynamic_cast<Parameter<O::LIST_ATTS> >(
                             i.parameter.get()));
                     break;
+                case O::READ_ALL_ATTS:
+                    readAllAttributes(
+                        i.writable,
+                        deref_dynamic_cast<Parameter<O::READ_ALL_ATTS> >(
+                            i.parameter.get()));
+                    break;
                 case O::ADVANCE:
                     advance(
                         i.writable,
@@ -219,11 +231,11 @@ public:
                           << std::endl;
                 while (!m_handler->m_work.empty())
                 {
-                    m_handler->m_work.pop();
+                    m_handler->m_work.pop_front();
                 }
                 throw;
             }
-            (*m_handler).m_work.pop();
+            (*m_handler).m_work.pop_front();
         }
         return std::future<void>();
     }
@@ -489,6 +501,28 @@ public:
         // default implementation: operation unsupported by backend
         parameters.out->backendManagedBuffer = false;
     }
+    /** Get a read-only view into dataset data held by the backend.
+     *
+     * The dataset should be associated with the Writable.
+     * The operation should fail if the dataset does not exist.
+     * The operation should fail if chunk positions
+     * parameters.offset+parameters.extent do not reside inside the dataset.
+     * The dataset should match the datatype parameters.dtype.
+     * The view should be stored in parameters.out->ptr as a pointer to the
+     * flattened, row-major chunk that keeps the backend's buffer alive.
+     * Its content must be available not later than the next flush point.
+     *
+     * This IOTask is optional and should either (1) not be implemented by a
+     * backend at all, leaving the frontend to load the chunk into a buffer
+     * of its own, or (2) be implemented as indicated above and set
+     * parameters.out->backendManagedBuffer = true.
+     */
+    virtual void readBufferView(
+        Writable *, Parameter<Operation::READ_BUFFER_VIEW> &parameters)
+    {
+        // default implementation: operation unsupported by backend
+        parameters.out->backendManagedBuffer = false;
+    }
     /** Create a single attribute and fill the value, possibly overwriting an
      * existing attribute.
      *
@@ -563,6 +597,18 @@ public:
      */
     virtual void
     listAttributes(Writable *, Parameter<Operation::LIST_ATTS> &) = 0;
+    /** Read the names and values of all attributes associated with an object.
+     *
+     * Only used by the frontend if
+     * AbstractIOHandler::supportsReadAllAttributes() is true, otherwise
+     * attributes are listed and read one by one.
+     * The operation should fail if the Writable was not marked written.
+     * The attributes should be stored by name in the location indicated by
+     * the pointer parameters.attributes, as by readAttribute().
+     * The default implementation throws an error.
+     */
+    virtual void
+    readAllAttributes(Writable *, Parameter<Operation::READ_ALL_ATTS> &);
 
     /** Treat the current Writable as equivalent to that in the parameter object
      *
@@ -35,6 +35,10 @@ enum class Format
     ADIOS2_SST,
     ADIOS2_SSC,
     JSON,
+    JSON_CBOR,
+    JSON_MSGPACK,
+    JSON_UBJSON,
+    JSON_BSON,
     DUMMY
 };
 
@@ -26,24 +26,72 @@
 
 #include <hdf5.h>
 
+#include <array>
+#include <condition_variable>
 #include <map>
+#include <mutex>
 #include <string>
 #include <unordered_map>
 #include <utility>
 
 namespace openPMD
 {
-struct GetH5DataType
+/*
+ * HDF5 memory datatypes of the openPMD datatypes, looked up once per IO
+ * handler instead of on every dataset and attribute access.
+ */
+class GetH5DataType
 {
-    std::unordered_map<std::string, hid_t> m_userTypes;
+public:
+    // no types yet, to be assigned
+    GetH5DataType();
+    // h5py compatible user types for bool and complex, owned by the caller
+    GetH5DataType(
+        hid_t boolType,
+        hid_t cfloatType,
+        hid_t cdoubleType,
+        hid_t clongDoubleType);
+
+    /*
+     * HDF5 datatype for the attribute, a new type that must be closed by
+     * the caller.
+     */
+    hid_t operator()(Attribute const &att) const;
+
+    /*
+     * HDF5 datatype for datasets and attributes of the given type, not to
+     * be closed by the caller.
+     * Strings have no fixed HDF5 datatype, a negative value is returned for
+     * them and for undefined types.
+     */
+    hid_t native(Datatype) const;
+
+private:
+    std::array<hid_t, static_cast<size_t>(Datatype::UNDEFINED)> m_types;
+};
 
-    GetH5DataType(std::unordered_map<std::string, hid_t> userTypes)
-        : m_userTypes{std::move(userTypes)}
-    {}
+/*
+ * Unless built thread-safe, the HDF5 library must not be called from
+ * multiple threads at once. All HDF5 calls of the openPMD-api are serialized
+ * by hdf5Lock(), since HDF5 handlers may write in the background.
+ * Unlike a std::mutex, this lock may be released by another thread than the
+ * one that acquired it, so a flush can hand it over to the thread issuing its
+ * writes in the background.
+ */
+class HDF5Lock
+{
+public:
+    void lock();
+    void unlock();
 
-    hid_t operator()(Attribute const &att);
+private:
+    std::mutex m_mutex;
+    std::condition_variable m_released;
+    bool m_locked = false;
 };
 
+HDF5Lock &hdf5Lock();
+
 hid_t getH5DataSpace(Attribute const &att);
 
 std::string concrete_h5_file_position(Writable *w);
@@ -59,8 +107,12 @@ std::string concrete_h5_file_position(Writable *w);
  *
  * @param[in] dims dimensions of dataset to get chunk dims for
  * @param[in] typeSize size of each element in bytes
+ * @param[in] targetChunkSize target chunk size in bytes, overriding the
+ *            heuristic between 64KByte and 4MB if non-zero
  * @return array for resulting chunk dimensions
  */
-std::vector<hsize_t>
-getOptimalChunkDims(std::vector<hsize_t> const dims, size_t const typeSize);
+std::vector<hsize_t> getOptimalChunkDims(
+    std::vector<hsize_t> const dims,
+    size_t const typeSize,
+    size_t const targetChunkSize = 0);
 } // namespace openPMD
@@ -0,0 +1,94 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include "openPMD/config.hpp"
+
+#if openPMD_HAVE_HDF5
+#include <hdf5.h>
+
+#include <cstdint>
+#include <memory>
+#include <optional>
+#include <vector>
+
+namespace openPMD::detail
+{
+/*
+ * Direct chunk I/O, i.e. H5Dwrite_chunk() and H5Dread_chunk(), bypasses the
+ * HDF5 filter pipeline. openPMD then applies the filters itself, which allows
+ * compressing multiple chunks in parallel.
+ * Only the shuffle and deflate filters are supported.
+ */
+struct DirectChunkFilter
+{
+    enum class Type
+    {
+        Shuffle,
+        Deflate
+    };
+    Type type;
+    // shuffle: size of an element in bytes, deflate: compression level
+    unsigned parameter;
+};
+
+/*
+ * The filter pipeline of a dataset creation property list, or an empty
+ * optional if it contains filters that openPMD cannot apply itself.
+ */
+std::optional<std::vector<DirectChunkFilter>> directChunkFilters(hid_t dcpl);
+
+// apply the filters in order to the raw data of a chunk
+std::vector<char>
+encodeChunk(std::vector<DirectChunkFilter> const &, std::vector<char> chunk);
+
+/*
+ * Undo the filters in reverse order, skipping those that were not applied
+ * according to filterMask (as returned by H5Dread_chunk()).
+ * rawSize is the size of the unfiltered chunk in bytes.
+ */
+std::vector<char> decodeChunk(
+    std::vector<DirectChunkFilter> const &,
+    uint32_t filterMask,
+    std::vector<char> chunk,
+    size_t rawSize);
+
+/*
+ * Copy the part of a row-major block that falls into a chunk to the
+ * row-major chunk buffer and back, the chunk starts at chunkOffset within the
+ * block. Elements of the chunk outside the block are not touched.
+ */
+void copyBlockToChunk(
+    char const *block,
+    std::vector<hsize_t> const &blockExtent,
+    char *chunk,
+    std::vector<hsize_t> const &chunkExtent,
+    std::vector<hsize_t> const &chunkOffset,
+    size_t elementSize);
+void copyChunkToBlock(
+    char const *chunk,
+    std::vector<hsize_t> const &chunkExtent,
+    std::vector<hsize_t> const &chunkOffset,
+    char *block,
+    std::vector<hsize_t> const &blockExtent,
+    size_t elementSize);
+} // namespace openPMD::detail
+#endif
@@ -42,6 +42,11 @@ public:
         return "HDF5";
     }
 
+    bool supportsReadAllAttributes() const override
+    {
+        return true;
+    }
+
     std::future<void> flush(internal::ParsedFlushParams &) override;
 
 private:
@@ -23,13 +23,25 @@
 #include "openPMD/config.hpp"
 #if openPMD_HAVE_HDF5
 #include "openPMD/IO/AbstractIOHandlerImpl.hpp"
+#include "openPMD/IO/FlushParametersInternal.hpp"
+#include "openPMD/IO/HDF5/HDF5Auxiliary.hpp"
+#include "openPMD/IO/HDF5/HDF5DirectChunk.hpp"
 
 #include "openPMD/auxiliary/JSON_internal.hpp"
+#include "openPMD/auxiliary/ThreadPool.hpp"
 
+#include <exception>
+#include <future>
 #include <hdf5.h>
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
 #include <optional>
+#include <thread>
 #include <unordered_map>
 #include <unordered_set>
+#include <vector>
 #endif
 
 namespace openPMD
@@ -41,6 +53,8 @@ public:
     HDF5IOHandlerImpl(AbstractIOHandler *, json::TracingJSON config);
     ~HDF5IOHandlerImpl() override;
 
+    std::future<void> flush(internal::ParsedFlushParams &);
+
     void
     createFile(Writable *, Parameter<Operation::CREATE_FILE> const &) override;
     void checkFile(Writable *, Parameter<Operation::CHECK_FILE> &) override;
@@ -70,7 +84,13 @@ public:
     void writeAttribute(
         Writable *, Parameter<Operation::WRITE_ATT> const &) override;
     void readDataset(Writable *, Parameter<Operation::READ_DATASET> &) override;
+    void
+    getBufferView(Writable *, Parameter<Operation::GET_BUFFER_VIEW> &) override;
+    void readBufferView(
+        Writable *, Parameter<Operation::READ_BUFFER_VIEW> &) override;
     void readAttribute(Writable *, Parameter<Operation::READ_ATT> &) override;
+    void readAllAttributes(
+        Writable *, Parameter<Operation::READ_ALL_ATTS> &) override;
     void listPaths(Writable *, Parameter<Operation::LIST_PATHS> &) override;
     void
     listDatasets(Writable *, Parameter<Operation::LIST_DATASETS> &) override;
@@ -89,13 +109,47 @@ public:
 
     hbool_t m_hdf5_collective_metadata = 1;
 
+    /*
+     * Dataset transfer property lists for datasets or flushes that override
+     * the transfer mode of m_datasetTransferProperty.
+     * Created by ParallelHDF5IOHandlerImpl, H5P_DEFAULT in serial HDF5.
+     */
+    hid_t m_collectiveTransferProperty = H5P_DEFAULT;
+    hid_t m_independentTransferProperty = H5P_DEFAULT;
+
     // h5py compatible types for bool and complex
     hid_t m_H5T_BOOL_ENUM;
     hid_t m_H5T_CFLOAT;
     hid_t m_H5T_CDOUBLE;
     hid_t m_H5T_CLONG_DOUBLE;
+    // HDF5 datatypes per openPMD datatype, including the types above
+    GetH5DataType m_getH5DataType;
 
 protected:
+    /*
+     * Apply the file access options from the hdf5.file configuration.
+     * Used by the constructors, ParallelHDF5IOHandlerImpl calls this again
+     * after setting up its own file access property list.
+     */
+    void setFileAccessProperties(hid_t fapl) const;
+    /*
+     * Apply the file creation options from the hdf5.file configuration,
+     * analogous to setFileAccessProperties().
+     */
+    void setFileCreationProperties(hid_t fcpl) const;
+
+    /*
+     * Close all cached dataset handles, or only those within the given file.
+     * Must be called before closing the file.
+     */
+    void closeDatasets(std::optional<hid_t> fileID = std::nullopt);
+
+    /*
+     * MPI-IO hints from hdf5.mpi_info, passed via MPI_Info to
+     * H5Pset_fapl_mpio() by ParallelHDF5IOHandlerImpl.
+     */
+    std::map<std::string, std::string> m_mpiHints;
+
 #if openPMD_HAVE_MPI
     /*
      * Not defined in ParallelHDF5IOHandlerImpl, so we don't have to write
@@ -106,13 +160,340 @@ protected:
 
 private:
     json::TracingJSON m_config;
-    std::string m_chunks = "auto";
+
+    /*
+     * Read the datatype and value of an open attribute,
+     * writable and attribute name are used in error messages.
+     */
+    Attribute
+    readAttributeValue(Writable *, hid_t attr_id, std::string const &attr_name);
+
+    enum class ChunkingStrategy
+    {
+        Auto, //!< heuristic, see getOptimalChunkDims()
+        None, //!< contiguous layout
+        StoreChunk, //!< align chunks with the blocks written by storeChunk()
+        Explicit //!< user-provided chunk shape
+    };
+
+    /*
+     * Raw data chunk cache, see H5Pset_cache() and H5Pset_chunk_cache().
+     * Members left at H5D_CHUNK_CACHE_*_DEFAULT keep the value inherited from
+     * the file access property list (or from the library defaults).
+     */
+    struct ChunkCache
+    {
+        size_t slots = H5D_CHUNK_CACHE_NSLOTS_DEFAULT;
+        size_t size = H5D_CHUNK_CACHE_NBYTES_DEFAULT;
+        double w0 = H5D_CHUNK_CACHE_W0_DEFAULT;
+    };
+
+    // MPI-IO data transfer mode, see H5Pset_dxpl_mpio()
+    enum class TransferMode
+    {
+        Collective,
+        Independent
+    };
+
+    static TransferMode parseTransferMode(
+        nlohmann::json const &, std::vector<std::string> errorPath);
+
+    enum class FileSpaceStrategy
+    {
+        FsmAggr, //!< HDF5 default: free-space managers and aggregators
+        Page, //!< paged aggregation
+        Aggr, //!< aggregators only
+        None //!< neither
+    };
+
+    /*
+     * File access and creation options, specified via hdf5.file in the Series
+     * configuration and applied to every file opened or created by this
+     * handler.
+     */
+    struct FileConfig
+    {
+        std::optional<ChunkCache> chunkCache;
+
+        struct MetadataCache
+        {
+            std::optional<size_t> initialSize;
+            std::optional<size_t> minSize;
+            std::optional<size_t> maxSize;
+            std::optional<bool> evictions;
+        };
+        std::optional<MetadataCache> metadataCache;
+
+        // in bytes, only effective for files with paged file space strategy
+        std::optional<size_t> pageBufferSize;
+
+        struct Alignment
+        {
+            hsize_t threshold = 0;
+            hsize_t boundary = 1;
+        };
+        std::optional<Alignment> alignment;
+
+        // file creation options, see H5Pset_file_space_strategy()
+        struct FileSpace
+        {
+            FileSpaceStrategy strategy = FileSpaceStrategy::FsmAggr;
+            bool persist = false;
+            hsize_t threshold = 1;
+            // in bytes, only for FileSpaceStrategy::Page
+            std::optional<hsize_t> pageSize;
+        };
+        std::optional<FileSpace> fileSpace;
+
+        bool empty() const;
+    };
+    FileConfig m_fileConfig;
+
+    static void parseFileConfig(json::TracingJSON &config, FileConfig &);
+    static void parseMPIHints(
+        nlohmann::json const &config, std::map<std::string, std::string> &);
+    static void parseChunkCache(
+        json::TracingJSON &config,
+        ChunkCache &,
+        std::vector<std::string> const &errorPath);
+
+    /*
+     * Options that may be specified globally via hdf5.dataset in the Series
+     * configuration or per dataset via Dataset::options.
+     * Per-dataset options overwrite the global ones.
+     */
+    struct DatasetConfig
+    {
+        ChunkingStrategy chunking = ChunkingStrategy::Auto;
+        // only for ChunkingStrategy::Explicit
+        std::vector<hsize_t> chunkShape;
+        // in bytes, zero for the built-in heuristics
+        size_t targetChunkSize = 0;
+
+        struct Filter
+        {
+            H5Z_filter_t id;
+            unsigned int flags;
+            std::vector<unsigned int> cdValues;
+        };
+        // applied in this order, requires chunking
+        std::vector<Filter> filters;
+        std::optional<ChunkCache> chunkCache;
+        // only effective in parallel HDF5
+        std::optional<TransferMode> transfer;
+    };
+    DatasetConfig m_globalDatasetConfig;
+    // per-dataset chunk cache configurations given at dataset creation
+    std::unordered_map<Writable *, ChunkCache> m_datasetChunkCaches;
+    // per-dataset transfer modes given at dataset creation
+    std::unordered_map<Writable *, TransferMode> m_datasetTransferModes;
+    // transfer mode for the running flush, given in the flush configuration
+    std::optional<TransferMode> m_flushTransferMode;
+
+    /*
+     * Dataset transfer property list for reading or writing the dataset,
+     * depending on the transfer modes specified for the running flush, for
+     * the dataset or globally, in this order of precedence.
+     * Owned by this class, the caller must not close it.
+     */
+    hid_t datasetTransferProperty(Writable *) const;
+
+    static void
+    parseDatasetConfig(json::TracingJSON &config, DatasetConfig &datasetConfig);
+
+    static std::vector<DatasetConfig::Filter>
+    parseFilters(nlohmann::json const &filters);
+
+    std::vector<hsize_t> getChunkDims(
+        Writable *,
+        DatasetConfig const &,
+        std::vector<hsize_t> const &dims,
+        size_t typeSize,
+        bool resizable) const;
+
+    /*
+     * Dataset access property list carrying the chunk cache configuration of
+     * the dataset, or H5P_DEFAULT if none is configured.
+     * Unless H5P_DEFAULT, the caller must close the returned property list.
+     */
+    hid_t datasetAccessProperty(Writable *) const;
+
+    /*
+     * Page buffering (hdf5.file.page_buffer_size) is only possible for files
+     * with paged file space strategy, so it is not part of
+     * m_fileAccessProperty, but applied when creating or opening files.
+     */
+    bool usePageBuffer() const;
+    // must be closed by the caller
+    hid_t pageBufferedFileAccessProperty() const;
+    // H5Fopen(), falls back to no page buffering for non-paged files
+    hid_t openH5File(std::string const &name, unsigned flags);
+    bool m_warnedPageBuffer = false;
+
     struct File
     {
         std::string name;
         hid_t id;
     };
     std::optional<File> getFile(Writable *);
+
+    /*
+     * LRU cache of open dataset handles, avoids H5Dopen()/H5Dclose() and the
+     * associated path lookups for every single read or write of a dataset.
+     * Most recently used handles come first.
+     */
+    struct CachedDataset
+    {
+        Writable *writable;
+        hid_t fileID;
+        hid_t datasetID;
+    };
+    std::list<CachedDataset> m_datasetHandles;
+    std::unordered_map<Writable *, std::list<CachedDataset>::iterator>
+        m_datasetHandleIndex;
+    // hdf5.dataset_handle_cache, see datasetHandleCacheSize() for defaults
+    std::optional<size_t> m_datasetHandleCacheSize;
+
+    size_t datasetHandleCacheSize() const;
+    /*
+     * Open the dataset, or return its cached handle.
+     * Pair each successful call with releaseDataset().
+     */
+    hid_t acquireDataset(Writable *, File const &);
+    void releaseDataset(hid_t dataset_id);
+    // drop the dataset from the handle cache, closing the handle
+    void closeDataset(Writable *);
+
+    // hdf5.coalesce_writes, see coalesceWrites() for defaults
+    std::optional<bool> m_coalesceWrites;
+
+    bool coalesceWrites() const;
+    /*
+     * Look ahead in the IO queue for writes that can be merged with
+     * writes.front(), i.e. writes to the same dataset that are disjoint in
+     * the slowest varying dimension and equal in all others.
+     * Appends them to writes and sorts writes by offset.
+     */
+    void collectCoalescableWrites(
+        Writable *, std::vector<Parameter<Operation::WRITE_DATASET> *> &writes);
+
+    /*
+     * Direct chunk I/O (hdf5.direct_chunk_io): chunk-aligned writes and reads
+     * bypass the HDF5 filter pipeline, openPMD filters the chunks itself on
+     * m_directChunkThreads threads.
+     */
+    bool m_directChunkIO = false;
+    // hdf5.direct_chunk_threads, zero for the number of hardware threads
+    unsigned m_directChunkThreads = 0;
+    std::unique_ptr<auxiliary::ThreadPool> m_chunkThreadPool;
+
+    struct DirectChunkLayout
+    {
+        Datatype dtype;
+        size_t elementSize;
+        std::vector<hsize_t> chunkDims;
+        std::vector<detail::DirectChunkFilter> filters;
+    };
+    /*
+     * Per dataset, the layout if the dataset qualifies for direct chunk I/O,
+     * i.e. it is chunked, filtered with supported filters only and its file
+     * datatype is the native memory datatype.
+     */
+    std::unordered_map<Writable *, std::optional<DirectChunkLayout>>
+        m_directChunkLayouts;
+
+    bool directChunkIO() const;
+    std::optional<DirectChunkLayout> const &
+    directChunkLayout(Writable *, hid_t dataset_id, Datatype);
+    auxiliary::ThreadPool &chunkThreadPool();
+    /*
+     * Write parameters and upcoming chunk-aligned writes to the same dataset
+     * with H5Dwrite_chunk(), or return false if parameters is not
+     * chunk-aligned.
+     */
+    bool writeDirectChunks(
+        Writable *, hid_t dataset_id, Parameter<Operation::WRITE_DATASET> &);
+    /*
+     * Read with H5Dread_chunk(), or return false if parameters is not
+     * chunk-aligned or not all chunks are allocated in the file.
+     */
+    bool readDirectChunks(
+        Writable *, hid_t dataset_id, Parameter<Operation::READ_DATASET> &);
+
+    /*
+     * Asynchronous writes (hdf5.async_write): H5Dwrite() calls are queued
+     * during a flush and issued on a background thread once the flush
+     * returns. The next flush and the destructor wait for them.
+     */
+    bool m_asyncWrite = false;
+
+    struct AsyncWrite
+    {
+        hid_t dataset; // own reference to the dataset, closed after writing
+        hid_t memoryType; // owned by the handler
+        hid_t memspace;
+        hid_t filespace;
+        hid_t transferProperty; // owned by the handler
+        std::shared_ptr<void const> data; // owned or copied buffer
+        std::string position; // for error messages
+    };
+    // writes queued in the running flush
+    std::vector<AsyncWrite> m_asyncWrites;
+    // issues the writes queued in the last flush
+    std::thread m_asyncWriter;
+    std::exception_ptr m_asyncError;
+
+    bool asyncWrite() const;
+    /*
+     * Issue the queued writes on a background thread, the returned future
+     * becomes ready once they are done.
+     * The thread takes over the lock on hdf5Lock() held by the flush and
+     * releases it once done.
+     */
+    std::future<void> startAsyncWrites(std::unique_lock<HDF5Lock>);
+    /*
+     * Wait for the background writes of the last flush and issue the writes
+     * queued so far, rethrowing the first error.
+     * Called with hdf5Lock() held, i.e. after the background writes are done.
+     * Needed before operations that must see the written data or that
+     * invalidate the queued writes, e.g. reading and closing files.
+     */
+    void finishAsyncWrites();
+    static void issueAsyncWrites(std::vector<AsyncWrite> &);
+
+    /*
+     * Span-based storeChunk() (hdf5.use_span_based_put): getBufferView()
+     * hands out buffers owned by the handler, the user fills them in place
+     * and they are written at the next flush point or when closing the file.
+     * The buffers are passed on to writeDataset() without copying, so
+     * asynchronous writes take them over as well.
+     */
+    bool m_useSpanBasedPut = true;
+
+    struct SpanBuffer
+    {
+        Writable *writable;
+        Offset offset;
+        Extent extent;
+        Datatype dtype;
+        UniquePtrWithLambda<void> data;
+    };
+    // by view index, indexes are not reused so stale views are detected
+    std::map<unsigned, SpanBuffer> m_spanBuffers;
+    unsigned m_nextSpanIndex = 0;
+
+    bool useSpanBasedPut() const;
+    /*
+     * Write the span buffers handed out so far, only those of the given file
+     * if specified.
+     */
+    void writeSpanBuffers(std::optional<std::string> const &fileName = {});
+    /*
+     * Drop the span buffers of deleted objects, those of the given file or
+     * those of the given Writable and of the Writables below it.
+     */
+    void discardSpanBuffers(std::string const &fileName);
+    void discardSpanBuffers(Writable *);
 }; // HDF5IOHandlerImpl
 #else
 class HDF5IOHandlerImpl
@@ -48,6 +48,11 @@ public:
         return "MPI_HDF5";
     }
 
+    bool supportsReadAllAttributes() const override
+    {
+        return true;
+    }
+
     std::future<void> flush(internal::ParsedFlushParams &) override;
 
 private:
@@ -67,11 +67,13 @@ OPENPMDAPI_EXPORT_ENUM_CLASS(Operation){
     READ_DATASET,
     LIST_DATASETS,
     GET_BUFFER_VIEW,
+    READ_BUFFER_VIEW, //!< Read-only view into data held by the backend
 
     DELETE_ATT,
     WRITE_ATT,
     READ_ATT,
     LIST_ATTS,
+    READ_ALL_ATTS, //!< Read all attributes of an object at once
 
     ADVANCE,
     AVAILABLE_CHUNKS, //!< Query chunks that can be loaded in a dataset
@@ -518,6 +520,36 @@ struct OPENPMDAPI_EXPORT Parameter<Operation::GET_BUFFER_VIEW>
     std::shared_ptr<OutParameters> out = std::make_shared<OutParameters>();
 };
 
+template <>
+struct OPENPMDAPI_EXPORT Parameter<Operation::READ_BUFFER_VIEW>
+    : public AbstractParameter
+{
+    Parameter() = default;
+    Parameter(Parameter &&) = default;
+    Parameter(Parameter const &) = default;
+    Parameter &operator=(Parameter &&) = default;
+    Parameter &operator=(Parameter const &) = default;
+
+    std::unique_ptr<AbstractParameter> to_heap() && override
+    {
+        return std::unique_ptr<AbstractParameter>(
+            new Parameter<Operation::READ_BUFFER_VIEW>(std::move(*this)));
+    }
+
+    // in parameters
+    Offset offset;
+    Extent extent;
+    Datatype dtype = Datatype::UNDEFINED;
+    // out parameters
+    struct OutParameters
+    {
+        bool backendManagedBuffer = false;
+        // keeps the backend's buffer alive
+        std::shared_ptr<void const> ptr;
+    };
+    std::shared_ptr<OutParameters> out = std::make_shared<OutParameters>();
+};
+
 template <>
 struct OPENPMDAPI_EXPORT Parameter<Operation::DELETE_ATT>
     : public AbstractParameter
@@ -607,6 +639,27 @@ struct OPENPMDAPI_EXPORT Parameter<Operation::LIST_ATTS>
         std::make_shared<std::vector<std::string>>();
 };
 
+template <>
+struct OPENPMDAPI_EXPORT Parameter<Operation::READ_ALL_ATTS>
+    : public AbstractParameter
+{
+    Parameter() = default;
+    Parameter(Parameter &&) = default;
+    Parameter(Parameter const &) = default;
+    Parameter &operator=(Parameter &&) = default;
+    Parameter &operator=(Parameter const &) = default;
+
+    std::unique_ptr<AbstractParameter> to_heap() && override
+    {
+        return std::unique_ptr<AbstractParameter>(
+            new Parameter<Operation::READ_ALL_ATTS>(std::move(*this)));
+    }
+
+    //! output parameter: all attributes of the object by name
+    std::shared_ptr<std::map<std::string, Attribute>> attributes =
+        std::make_shared<std::map<std::string, Attribute>>();
+};
+
 template <>
 struct OPENPMDAPI_EXPORT Parameter<Operation::ADVANCE>
     : public AbstractParameter
@@ -26,6 +26,7 @@
 #include "openPMD/IO/Access.hpp"
 #include "openPMD/IO/JSON/JSONFilePosition.hpp"
 #include "openPMD/auxiliary/Filesystem.hpp"
+#include "openPMD/auxiliary/JSON_internal.hpp"
 #include "openPMD/config.hpp"
 
 #include <nlohmann/json.hpp>
@@ -153,7 +154,25 @@ class JSONIOHandlerImpl : public AbstractIOHandlerImpl
     using json = nlohmann::json;
 
 public:
-    explicit JSONIOHandlerImpl(AbstractIOHandler *);
+    /**
+     * On-disk encoding of the JSON value.
+     * Next to plain text JSON, the binary encodings natively supported by
+     * nlohmann::json may be used. The object model stays the same.
+     */
+    enum class FileFormat
+    {
+        Json,
+        CBOR,
+        MessagePack,
+        UBJSON,
+        BSON
+    };
+
+    JSONIOHandlerImpl(
+        AbstractIOHandler *,
+        openPMD::json::TracingJSON config,
+        FileFormat,
+        std::string originalExtension);
 
     ~JSONIOHandlerImpl() override;
 
@@ -220,6 +239,12 @@ public:
 private:
     using FILEHANDLE = std::fstream;
 
+    FileFormat m_fileFormat;
+
+    // filename extension to be used for files opened by this handler,
+    // including the dot
+    std::string m_originalExtension;
+
     // map each Writable to its associated file
     // contains only the filename, without the OS path
     std::unordered_map<Writable *, File> m_files;
@@ -239,6 +264,9 @@ private:
         Access access); //, Access
                         // m_frontendAccess=this->m_handler->m_frontendAccess);
 
+    // append the filename extension unless already present
+    std::string withExtension(std::string name) const;
+
     // full operating system path of the given file
     std::string fullPath(File);
 
@@ -259,6 +259,26 @@ public:
     template <typename T>
     void loadChunkRaw(T *data, Offset offset, Extent extent);
 
+    /** Load a chunk of data as a read-only view into memory held by the
+     *  backend.
+     *
+     * Backends that support it return a buffer of their own instead of
+     * copying into one allocated by openPMD, e.g. HDF5 maps contiguous,
+     * uncompressed datasets of files opened read-only into memory.
+     * Otherwise, this falls back to loadChunk().
+     * As with loadChunk(), the data is available after the next <a
+     * href="https://openpmd-api.readthedocs.io/en/latest/usage/workflow.html#deferred-data-api-contract">
+     * flush point</a>.
+     *
+     * @param offset Offset within the dataset. Set to {0u} for full selection.
+     * @param extent Extent within the dataset, counted from the offset.
+     *               Set to {-1u} for full selection.
+     *               If offset is non-zero and extent is {-1u} the leftover
+     *               extent in the record component will be selected.
+     */
+    template <typename T>
+    std::shared_ptr<T const> loadChunkView(Offset = {0u}, Extent = {-1u});
+
     /** Store a chunk of data from a chunk of memory.
      *
      * @param data   Preallocated, contiguous buffer, large enough to read the
@@ -190,6 +190,64 @@ inline void RecordComponent::loadChunkRaw(T *ptr, Offset offset, Extent extent)
     loadChunk(auxiliary::shareRaw(ptr), std::move(offset), std::move(extent));
 }
 
+template <typename T>
+inline std::shared_ptr<T const>
+RecordComponent::loadChunkView(Offset o, Extent e)
+{
+    uint8_t dim = getDimensionality();
+
+    // default arguments
+    //   offset = {0u}: expand to right dim {0u, 0u, ...}
+    Offset offset = o;
+    if (o.size() == 1u && o.at(0) == 0u && dim > 1u)
+        offset = Offset(dim, 0u);
+
+    //   extent = {-1u}: take full size
+    Extent extent(dim, 1u);
+    if (e.size() == 1u && e.at(0) == -1u)
+    {
+        extent = getExtent();
+        for (uint8_t i = 0u; i < dim; ++i)
+            extent[i] -= offset[i];
+    }
+    else
+        extent = e;
+
+    // views hold the data as stored, without conversion
+    bool const sameType = determineDatatype<T>() == getDatatype() ||
+        isSameInteger<T>(getDatatype()) ||
+        isSameFloatingPoint<T>(getDatatype()) ||
+        isSameComplexFloatingPoint<T>(getDatatype());
+    bool inBounds = extent.size() == dim && offset.size() == dim;
+    if (inBounds)
+    {
+        Extent dse = getExtent();
+        for (uint8_t i = 0; i < dim; ++i)
+            inBounds = inBounds && dse[i] >= offset[i] + extent[i];
+    }
+    if (constant() || !sameType || !inBounds)
+    {
+        // error handling as for loadChunk()
+        return loadChunk<T>(std::move(offset), std::move(extent));
+    }
+
+    // the backend might not yet know about this dataset
+    seriesFlush({FlushLevel::SkeletonOnly});
+
+    Parameter<Operation::READ_BUFFER_VIEW> readBufferView;
+    readBufferView.offset = offset;
+    readBufferView.extent = extent;
+    readBufferView.dtype = getDatatype();
+    IOHandler()->enqueue(IOTask(this, readBufferView));
+    IOHandler()->flush(internal::defaultFlushParams);
+    auto &out = *readBufferView.out;
+    if (!out.backendManagedBuffer)
+    {
+        return loadChunk<T>(std::move(offset), std::move(extent));
+    }
+    return std::static_pointer_cast<T const>(std::move(out.ptr));
+}
+
 template <typename T>
 inline void
 RecordComponent::storeChunk(std::shared_ptr<T> data, Offset o, Extent e)
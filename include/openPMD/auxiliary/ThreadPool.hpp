@@ -0,0 +1,78 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace openPMD
+{
+namespace auxiliary
+{
+    /*
+     * Persistent worker threads for processing independent tasks in parallel,
+     * e.g. filtering chunks or copying blocks.
+     * The calling thread takes part in the work, so a pool of n threads starts
+     * n - 1 workers.
+     */
+    class ThreadPool
+    {
+    public:
+        explicit ThreadPool(unsigned threads);
+        ~ThreadPool();
+
+        ThreadPool(ThreadPool const &) = delete;
+        ThreadPool &operator=(ThreadPool const &) = delete;
+
+        /*
+         * Run task(i) for all i in [0, n) and wait for completion.
+         * Rethrows the first exception thrown by a task.
+         */
+        void parallelFor(size_t n, std::function<void(size_t)> const &task);
+
+    private:
+        struct Batch
+        {
+            std::function<void(size_t)> const *task;
+            size_t n;
+            std::atomic<size_t> next{0};
+            size_t done = 0; // guarded by m_mutex
+            std::exception_ptr error; // guarded by m_mutex
+        };
+
+        void run(Batch &);
+        void work();
+
+        std::vector<std::thread> m_workers;
+        std::mutex m_mutex;
+        std::condition_variable m_wake;
+        std::condition_variable m_done;
+        std::shared_ptr<Batch> m_batch;
+        bool m_stop = false;
+    };
+} // namespace auxiliary
+} // namespace openPMD
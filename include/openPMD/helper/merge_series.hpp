@@ -0,0 +1,42 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <string>
+
+namespace openPMD
+{
+namespace helper
+{
+    /** Merge a file-based HDF5 series into a single HDF5 file without copying
+     *
+     * Creates a group-based series whose iterations are HDF5 external links
+     * to the iterations in the files of the source series, so only metadata
+     * is written. The result stays valid only as long as the source files
+     * exist. Source files are referenced by their path relative to the
+     * directory of the target.
+     *
+     * @param source a file-based HDF5 series, e.g. "data_%T.h5"
+     * @param target the HDF5 file to create, e.g. "data.h5"
+     */
+    void mergeSeries(std::string const &source, std::string const &target);
+} // namespace helper
+} // namespace openPMD
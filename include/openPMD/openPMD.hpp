@@ -63,6 +63,7 @@ namespace openPMD
 #include "openPMD/auxiliary/Variant.hpp"
 
 #include "openPMD/helper/list_series.hpp"
+#include "openPMD/helper/merge_series.hpp"
 
 #include "openPMD/config.hpp"
 #include "openPMD/version.hpp"
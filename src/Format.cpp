@@ -43,6 +43,14 @@ Format determineFormat(std::string const &filename)
         return Format::ADIOS2_SSC;
     if (auxiliary::ends_with(filename, ".json"))
         return Format::JSON;
+    if (auxiliary::ends_with(filename, ".cbor"))
+        return Format::JSON_CBOR;
+    if (auxiliary::ends_with(filename, ".msgpack"))
+        return Format::JSON_MSGPACK;
+    if (auxiliary::ends_with(filename, ".ubjson"))
+        return Format::JSON_UBJSON;
+    if (auxiliary::ends_with(filename, ".bson"))
+        return Format::JSON_BSON;
 
     // Format might still be specified via JSON
     return Format::DUMMY;
@@ -66,6 +74,14 @@ std::string suffix(Format f)
         return ".ssc";
     case Format::JSON:
         return ".json";
+    case Format::JSON_CBOR:
+        return ".cbor";
+    case Format::JSON_MSGPACK:
+        return ".msgpack";
+    case Format::JSON_UBJSON:
+        return ".ubjson";
+    case Format::JSON_BSON:
+        return ".bson";
     default:
         return "";
     }
@@ -33,11 +33,17 @@
 
 #include <algorithm>
 #include <cctype> // std::tolower
+#include <chrono>
+#include <cstring>
+#include <fstream>
 #include <iostream>
 #include <iterator>
 #include <memory>
+#include <numeric>
+#include <random>
 #include <set>
 #include <string>
+#include <thread>
 #include <type_traits>
 
 namespace openPMD
@@ -134,6 +140,40 @@ ADIOS2IOHandlerImpl::~ADIOS2IOHandlerImpl()
         // std::unique_ptr interface
         file.reset();
     }
+    if (m_printReport && m_readByBlocks)
+    {
+        std::cerr << "[ADIOS2] Block cache: " << m_blockCacheHits << " hits, "
+                  << m_blockCacheMisses << " misses, " << m_blockCacheEvictions
+                  << " evictions" << std::endl;
+    }
+    if (m_printReport && m_prefetchMemory > 0)
+    {
+        std::cerr << "[ADIOS2] Prefetch: " << m_prefetchedSteps << " steps, "
+                  << m_prefetchedBytes << " bytes, " << m_prefetchHits
+                  << " loads served from prefetched data" << std::endl;
+    }
+    if (m_printReport && m_aggregatePuts)
+    {
+        std::cerr << "[ADIOS2] Put aggregation: " << m_aggregatedPuts
+                  << " stores merged into " << m_aggregatedBlocks << " blocks"
+                  << std::endl;
+    }
+    if (m_printReport && !m_selectedOperators.empty())
+    {
+        std::cerr << "[ADIOS2] Operator selection:";
+        for (auto const &[op, count] : m_selectedOperators)
+        {
+            std::cerr << " " << op << " (" << count << "x)";
+        }
+        std::cerr << std::endl;
+    }
+    if (m_printReport && m_stepsWritten > 0)
+    {
+        std::cerr << "[ADIOS2] Engine buffer: " << m_stepsWritten
+                  << " steps written, largest step " << m_largestStep
+                  << " bytes, buffer grew during " << m_bufferGrowths
+                  << " steps" << std::endl;
+    }
 }
 
 void ADIOS2IOHandlerImpl::init(json::TracingJSON cfg)
@@ -148,6 +188,7 @@ void ADIOS2IOHandlerImpl::init(json::TracingJSON cfg)
         [](unsigned char c) { return std::tolower(c); });
 
     // environment-variable based configuration
+    m_printReport = auxiliary::getEnvNum("OPENPMD_ADIOS2_REPORT", 0) != 0;
     if (int schemaViaEnv = auxiliary::getEnvNum("OPENPMD2_ADIOS2_SCHEMA", -1);
         schemaViaEnv != -1)
     {
@@ -170,6 +211,64 @@ void ADIOS2IOHandlerImpl::init(json::TracingJSON cfg)
                                                                   : UseSpan::No;
         }
 
+        if (m_config.json().contains("read_by_blocks"))
+        {
+            auto const &readByBlocks = m_config["read_by_blocks"].json();
+            if (!readByBlocks.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "read_by_blocks"}, "Must be a boolean.");
+            }
+            m_readByBlocks = readByBlocks.get<bool>();
+        }
+
+        if (m_config.json().contains("block_cache_size"))
+        {
+            auto const &cacheSize = m_config["block_cache_size"].json();
+            if (!cacheSize.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "block_cache_size"},
+                    "Must be a non-negative integer (size in bytes).");
+            }
+            m_blockCacheMaxSize = cacheSize.get<size_t>();
+        }
+
+        if (m_config.json().contains("aggregate_puts"))
+        {
+            auto const &aggregatePuts = m_config["aggregate_puts"].json();
+            if (!aggregatePuts.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "aggregate_puts"}, "Must be a boolean.");
+            }
+            m_aggregatePuts = aggregatePuts.get<bool>();
+        }
+
+        if (m_config.json().contains("prefetch_memory"))
+        {
+            auto const &prefetchMemory = m_config["prefetch_memory"].json();
+            if (!prefetchMemory.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "prefetch_memory"},
+                    "Must be a non-negative integer (size in bytes).");
+            }
+            m_prefetchMemory = prefetchMemory.get<size_t>();
+        }
+
+        if (m_config.json().contains("read_threads"))
+        {
+            auto const &threads = m_config["read_threads"].json();
+            if (!threads.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "read_threads"},
+                    "Must be a non-negative integer (number of threads).");
+            }
+            m_readThreads = threads.get<unsigned>();
+        }
+
         auto engineConfig = config(ADIOS2Defaults::str_engine);
         if (!engineConfig.json().is_null())
         {
@@ -192,6 +291,20 @@ void ADIOS2IOHandlerImpl::init(json::TracingJSON cfg)
                         "Must be convertible to string type.");
                 }
             }
+            auto autoBufferSize =
+                config(ADIOS2Defaults::str_autoBufferSize, engineConfig);
+            if (!autoBufferSize.json().is_null())
+            {
+                if (!autoBufferSize.json().is_boolean())
+                {
+                    throw error::BackendConfigSchema(
+                        {"adios2",
+                         "engine",
+                         ADIOS2Defaults::str_autoBufferSize},
+                        "Must be a boolean.");
+                }
+                m_autoBufferSize = autoBufferSize.json().get<bool>();
+            }
         }
         auto operators = getOperators();
         if (operators)
@@ -245,12 +358,25 @@ ADIOS2IOHandlerImpl::getOperators(json::TracingJSON cfg)
                 }
             }
         }
+        if (type == ADIOS2Defaults::str_autoOperator)
+        {
+            if (operators.size() != 1)
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "dataset", "operators"},
+                    "Operator type 'auto' cannot be combined with other "
+                    "operators.");
+            }
+            res.emplace_back(ParameterizedOperator{
+                adios2::Operator(), {}, getAutoOperatorPolicy(adiosParams)});
+            continue;
+        }
         std::optional<adios2::Operator> adiosOperator =
             getCompressionOperator(type);
         if (adiosOperator)
         {
             res.emplace_back(ParameterizedOperator{
-                adiosOperator.value(), std::move(adiosParams)});
+                adiosOperator.value(), std::move(adiosParams), std::nullopt});
         }
     }
     _operators.declareFullyRead();
@@ -263,6 +389,53 @@ ADIOS2IOHandlerImpl::getOperators()
     return getOperators(m_config);
 }
 
+ADIOS2IOHandlerImpl::AutoOperatorPolicy
+ADIOS2IOHandlerImpl::getAutoOperatorPolicy(adios2::Params const &params)
+{
+    AutoOperatorPolicy res;
+    for (auto const &[key, value] : params)
+    {
+        auto parse = [&key = key, &value = value](auto parser) {
+            try
+            {
+                if (value.find('-') != std::string::npos)
+                {
+                    throw std::invalid_argument(value);
+                }
+                return parser(value);
+            }
+            catch (std::logic_error const &)
+            {
+                throw error::BackendConfigSchema(
+                    {"adios2", "dataset", "operators", key},
+                    "Must be a non-negative number.");
+            }
+        };
+        if (key == "sample_size")
+        {
+            res.sampleSize =
+                parse([](std::string const &s) { return std::stoull(s); });
+        }
+        else if (key == "time_budget")
+        {
+            res.timeBudget =
+                parse([](std::string const &s) { return std::stod(s); });
+        }
+        else if (key == "min_throughput")
+        {
+            res.minThroughput =
+                parse([](std::string const &s) { return std::stod(s); });
+        }
+        else
+        {
+            throw error::BackendConfigSchema(
+                {"adios2", "dataset", "operators", key},
+                "Unknown parameter for operator type 'auto'.");
+        }
+    }
+    return res;
+}
+
 using AcceptedEndingsForEngine = std::map<std::string, std::string>;
 
 std::string ADIOS2IOHandlerImpl::fileSuffix(bool verbose) const
@@ -645,8 +818,29 @@ void ADIOS2IOHandlerImpl::createDataset(
             parameters.extent.begin(), parameters.extent.end());
 
         auto &fileData = getFileData(file, IfFileNotOpen::ThrowError);
+        std::optional<AutoOperatorChoice> autoChoice;
+        if (operators.size() == 1 && operators[0].autoPolicy.has_value() &&
+            fileData.m_IO.VariableType(varName).empty())
+        {
+            auto it = m_autoOperatorChoices.find(autoOperatorKey(varName));
+            if (it != m_autoOperatorChoices.end())
+            {
+                autoChoice = it->second;
+                operators = autoOperators(it->second);
+            }
+            else
+            {
+                // operator chosen upon first store, see selectOperators()
+                fileData.m_autoOperators.emplace(
+                    varName, operators[0].autoPolicy.value());
+            }
+        }
         switchAdios2VariableType<detail::VariableDefiner>(
             parameters.dtype, fileData.m_IO, varName, operators, shape);
+        if (autoChoice.has_value())
+        {
+            recordAutoOperator(fileData, varName, *autoChoice);
+        }
         fileData.invalidateVariablesMap();
         writable->written = true;
         m_dirty.emplace(file);
@@ -746,6 +940,7 @@ void ADIOS2IOHandlerImpl::closeFile(
                 },
                 /* writeLatePuts = */ true,
                 /* flushUnconditionally = */ false);
+            dropCachedBlocks(it->second->m_file);
             m_fileData.erase(it);
         }
         m_dirty.erase(fileIterator->second);
@@ -826,6 +1021,11 @@ void ADIOS2IOHandlerImpl::writeDataset(
     detail::BufferedActions &ba = getFileData(file, IfFileNotOpen::ThrowError);
     detail::BufferedPut bp;
     bp.name = nameOfVariable(writable);
+    ba.m_bytesPutInStep += toBytes(parameters.dtype) *
+        std::accumulate(parameters.extent.begin(),
+                        parameters.extent.end(),
+                        size_t(1),
+                        std::multiplies<size_t>());
     bp.param = std::move(parameters);
     ba.enqueue(std::move(bp));
     m_dirty.emplace(std::move(file));
@@ -985,7 +1185,8 @@ void ADIOS2IOHandlerImpl::getBufferView(
         parameters.out->backendManagedBuffer = false;
         return;
     case UseSpan::Auto:
-        if (switchAdios2VariableType<detail::HasOperators>(
+        if (ba.m_autoOperators.find(name) != ba.m_autoOperators.end() ||
+            switchAdios2VariableType<detail::HasOperators>(
                 parameters.dtype, name, ba.m_IO))
         {
             parameters.out->backendManagedBuffer = false;
@@ -993,6 +1194,8 @@ void ADIOS2IOHandlerImpl::getBufferView(
         }
         break;
     case UseSpan::Yes:
+        // no data to sample, keep the variable uncompressed
+        ba.m_autoOperators.erase(name);
         break;
     }
 
@@ -1009,9 +1212,50 @@ void ADIOS2IOHandlerImpl::getBufferView(
     {
         switchAdios2VariableType<detail::GetSpan>(
             parameters.dtype, this, parameters, ba, name);
+        ba.m_bytesPutInStep += toBytes(parameters.dtype) *
+            std::accumulate(parameters.extent.begin(),
+                            parameters.extent.end(),
+                            size_t(1),
+                            std::multiplies<size_t>());
     }
 }
 
+void ADIOS2IOHandlerImpl::readBufferView(
+    Writable *writable, Parameter<Operation::READ_BUFFER_VIEW> &parameters)
+{
+    if (!access::readOnly(m_handler->m_backendAccess))
+    {
+        parameters.out->backendManagedBuffer = false;
+        return;
+    }
+    setAndGetFilePosition(writable);
+    auto file = refreshFileFromParent(writable, /* preferParentFile = */ false);
+    detail::BufferedActions &ba = getFileData(file, IfFileNotOpen::ThrowError);
+
+    size_t size = toBytes(parameters.dtype);
+    for (auto ext : parameters.extent)
+    {
+        size *= ext;
+    }
+
+    /*
+     * ADIOS2 only exposes pointers into its own buffers for the inline
+     * engine, so load into memory owned by the backend instead.
+     * The frontend flushes right after this task, so the data is ready
+     * by the time the view is handed to the user.
+     */
+    detail::BufferedGet bg;
+    bg.name = nameOfVariable(writable);
+    bg.param.offset = parameters.offset;
+    bg.param.extent = parameters.extent;
+    bg.param.dtype = parameters.dtype;
+    bg.param.data = ba.getReadViewBuffer(size);
+    parameters.out->ptr = bg.param.data;
+    parameters.out->backendManagedBuffer = true;
+    ba.enqueue(std::move(bg));
+    m_dirty.emplace(std::move(file));
+}
+
 namespace detail
 {
     template <typename T>
@@ -1093,70 +1337,36 @@ void ADIOS2IOHandlerImpl::listPaths(
      */
     std::vector<std::string> delete_me;
 
+    auto const &variables = fileData.variableIndex();
     switch (attributeLayout())
     {
         using AL = AttributeLayout;
     case AL::ByAdiosVariables: {
-        std::vector<std::string> vars =
-            fileData.availableVariablesPrefixed(myName);
-        for (auto var : vars)
+        // datasets and attributes alike are stored as variables
+        for (auto &group : variables.groups(myName))
         {
             // since current Writable is a group and no dataset,
-            // var == "__data__" is not possible
-            if (auxiliary::ends_with(var, "/__data__"))
-            {
-                // here be datasets
-                var = auxiliary::replace_last(var, "/__data__", "");
-                auto firstSlash = var.find_first_of('/');
-                if (firstSlash != std::string::npos)
-                {
-                    var = var.substr(0, firstSlash);
-                    subdirs.emplace(std::move(var));
-                }
-                else
-                { // var is a dataset at the current level
-                    delete_me.push_back(std::move(var));
-                }
-            }
-            else
-            {
-                // here be attributes
-                auto firstSlash = var.find_first_of('/');
-                if (firstSlash != std::string::npos)
-                {
-                    var = var.substr(0, firstSlash);
-                    subdirs.emplace(std::move(var));
-                }
+            // a variable "__data__" at this level is not possible
+            if (variables.contains(myName + group + "/__data__"))
+            { // group is a dataset at the current level
+                delete_me.push_back(group);
             }
+            subdirs.emplace(std::move(group));
         }
         break;
     }
     case AL::ByAdiosAttributes: {
-        std::vector<std::string> vars =
-            fileData.availableVariablesPrefixed(myName);
-        for (auto var : vars)
+        for (auto &group : variables.groups(myName))
         {
-            auto firstSlash = var.find_first_of('/');
-            if (firstSlash != std::string::npos)
-            {
-                var = var.substr(0, firstSlash);
-                subdirs.emplace(std::move(var));
-            }
-            else
-            { // var is a dataset at the current level
-                delete_me.push_back(std::move(var));
-            }
+            subdirs.emplace(std::move(group));
         }
-        std::vector<std::string> attributes =
-            fileData.availableAttributesPrefixed(myName);
-        for (auto attr : attributes)
+        for (auto &var : variables.entries(myName))
+        { // var is a dataset at the current level
+            delete_me.push_back(std::move(var));
+        }
+        for (auto &group : fileData.attributeIndex().groups(myName))
         {
-            auto firstSlash = attr.find_first_of('/');
-            if (firstSlash != std::string::npos)
-            {
-                attr = attr.substr(0, firstSlash);
-                subdirs.emplace(std::move(attr));
-            }
+            subdirs.emplace(std::move(group));
         }
         break;
     }
@@ -1196,33 +1406,28 @@ void ADIOS2IOHandlerImpl::listDatasets(
     auto &fileData = getFileData(file, IfFileNotOpen::ThrowError);
     fileData.requireActiveStep();
 
-    std::unordered_set<std::string> subdirs;
-    for (auto var : fileData.availableVariablesPrefixed(myName))
+    // we only want datasets contained directly within the current group
+    auto const &variables = fileData.variableIndex();
+    switch (attributeLayout())
     {
-        if (attributeLayout() == AttributeLayout::ByAdiosVariables)
+        using AL = AttributeLayout;
+    case AL::ByAdiosVariables:
+        // since current Writable is a group and no dataset,
+        // a variable "__data__" at this level is not possible
+        for (auto &group : variables.groups(myName))
         {
-            // since current Writable is a group and no dataset,
-            // var == "__data__" is not possible
-            if (!auxiliary::ends_with(var, "/__data__"))
+            if (variables.contains(myName + group + "/__data__"))
             {
-                continue;
+                parameters.datasets->emplace_back(std::move(group));
             }
-            // variable is now definitely a dataset, let's strip the suffix
-            var = auxiliary::replace_last(var, "/__data__", "");
         }
-        // if string still contains a slash, variable is a dataset below the
-        // current group
-        // we only want datasets contained directly within the current group
-        // let's ensure that
-        auto firstSlash = var.find_first_of('/');
-        if (firstSlash == std::string::npos)
+        break;
+    case AL::ByAdiosAttributes:
+        for (auto &var : variables.entries(myName))
         {
-            subdirs.emplace(std::move(var));
+            parameters.datasets->emplace_back(std::move(var));
         }
-    }
-    for (auto &dataset : subdirs)
-    {
-        parameters.datasets->emplace_back(std::move(dataset));
+        break;
     }
 }
 
@@ -1248,10 +1453,11 @@ void ADIOS2IOHandlerImpl::listAttributes(
     {
         using AL = AttributeLayout;
     case AL::ByAdiosAttributes:
-        attrs = ba.availableAttributesPrefixed(attributePrefix);
+        // only the attributes directly below attributePrefix
+        attrs = ba.attributeIndex().entries(attributePrefix);
         break;
     case AL::ByAdiosVariables:
-        attrs = ba.availableVariablesPrefixed(attributePrefix);
+        attrs = ba.variableIndex().entries(attributePrefix);
         break;
     }
     for (auto &rawAttr : attrs)
@@ -1433,6 +1639,66 @@ ADIOS2IOHandlerImpl::getCompressionOperator(std::string const &compression)
     return std::make_optional(adios2::Operator(res));
 }
 
+std::string ADIOS2IOHandlerImpl::autoOperatorKey(std::string const &varName)
+{
+    /*
+     * "/data/100/particles/e/id" -> "particles/e/id", such that the
+     * dataset's choice carries over to later iterations, also across files
+     * with file-based iteration encoding.
+     */
+    auto components = auxiliary::split(varName, "/");
+    auto iteration = std::find_if(
+        components.begin(), components.end(), [](std::string const &c) {
+            return std::all_of(c.begin(), c.end(), [](char ch) {
+                return std::isdigit(static_cast<unsigned char>(ch));
+            });
+        });
+    if (iteration == components.end())
+    {
+        return varName;
+    }
+    std::string res;
+    for (auto it = std::next(iteration); it != components.end(); ++it)
+    {
+        res += res.empty() ? *it : "/" + *it;
+    }
+    return res;
+}
+
+std::vector<ADIOS2IOHandlerImpl::ParameterizedOperator>
+ADIOS2IOHandlerImpl::autoOperators(AutoOperatorChoice const &choice)
+{
+    std::vector<ParameterizedOperator> res;
+    if (!choice.type.empty())
+    {
+        if (auto op = getCompressionOperator(choice.type); op.has_value())
+        {
+            res.push_back(
+                ParameterizedOperator{op.value(), choice.params, std::nullopt});
+        }
+    }
+    return res;
+}
+
+void ADIOS2IOHandlerImpl::recordAutoOperator(
+    detail::BufferedActions &ba,
+    std::string const &varName,
+    AutoOperatorChoice const &choice)
+{
+#if openPMD_HAVE_MPI
+    if (m_communicator.has_value())
+    {
+        // ranks decide independently, so there is no common value
+        return;
+    }
+#endif
+    ba.m_IO.DefineAttribute<std::string>(
+        ADIOS2Defaults::str_selectedOperatorAttribute,
+        choice.label,
+        varName,
+        "/");
+}
+
 std::string ADIOS2IOHandlerImpl::nameOfVariable(Writable *writable)
 {
     auto filepos = setAndGetFilePosition(writable);
@@ -1511,10 +1777,107 @@ void ADIOS2IOHandlerImpl::dropFileData(InvalidatableFile file)
     if (it != m_fileData.end())
     {
         it->second->drop();
+        dropCachedBlocks(it->second->m_file);
         m_fileData.erase(it);
     }
 }
 
+std::shared_ptr<void> ADIOS2IOHandlerImpl::cachedBlock(BlockCacheKey const &key)
+{
+    auto it = m_blockCacheIndex.find(key);
+    if (it == m_blockCacheIndex.end())
+    {
+        ++m_blockCacheMisses;
+        return nullptr;
+    }
+    ++m_blockCacheHits;
+    m_blockCache.splice(m_blockCache.begin(), m_blockCache, it->second);
+    return it->second->data;
+}
+
+void ADIOS2IOHandlerImpl::cacheBlock(
+    BlockCacheKey key, std::shared_ptr<void> data, size_t size)
+{
+    if (size > m_blockCacheMaxSize)
+    {
+        return;
+    }
+    while (m_blockCacheSize + size > m_blockCacheMaxSize)
+    {
+        auto &last = m_blockCache.back();
+        m_blockCacheSize -= last.size;
+        m_blockCacheIndex.erase(last.key);
+        m_blockCache.pop_back();
+        ++m_blockCacheEvictions;
+    }
+    m_blockCache.push_front(CachedBlock{key, std::move(data), size});
+    m_blockCacheIndex.emplace(std::move(key), m_blockCache.begin());
+    m_blockCacheSize += size;
+}
+
+unsigned ADIOS2IOHandlerImpl::readThreads() const
+{
+    unsigned threads = m_readThreads.value_or(1);
+    if (threads == 0)
+    {
+        threads = std::max(1u, std::thread::hardware_concurrency());
+    }
+    return threads;
+}
+
+auxiliary::ThreadPool &ADIOS2IOHandlerImpl::readThreadPool()
+{
+    if (!m_readThreadPool)
+    {
+        m_readThreadPool =
+            std::make_unique<auxiliary::ThreadPool>(readThreads());
+    }
+    return *m_readThreadPool;
+}
+
+void ADIOS2IOHandlerImpl::recordStepSize(size_t bytes, bool bufferGrew)
+{
+    // window of the moving maximum
+    constexpr size_t stepsToConsider = 8;
+    m_recentStepSizes.push_back(bytes);
+    if (m_recentStepSizes.size() > stepsToConsider)
+    {
+        m_recentStepSizes.pop_front();
+    }
+    ++m_stepsWritten;
+    m_largestStep = std::max(m_largestStep, bytes);
+    if (bufferGrew)
+    {
+        ++m_bufferGrowths;
+    }
+}
+
+std::optional<size_t> ADIOS2IOHandlerImpl::predictedStepSize() const
+{
+    if (m_recentStepSizes.empty())
+    {
+        return std::nullopt;
+    }
+    size_t max =
+        *std::max_element(m_recentStepSizes.begin(), m_recentStepSizes.end());
+    // headroom for metadata and slightly growing steps
+    return max + max / 16;
+}
+
+void ADIOS2IOHandlerImpl::dropCachedBlocks(std::string const &file)
+{
+    auto begin =
+        m_blockCacheIndex.lower_bound(BlockCacheKey{file, std::string(), 0, 0});
+    auto end = begin;
+    for (; end != m_blockCacheIndex.end() && std::get<0>(end->first) == file;
+         ++end)
+    {
+        m_blockCacheSize -= end->second->size;
+        m_blockCache.erase(end->second);
+    }
+    m_blockCacheIndex.erase(begin, end);
+}
+
 template <typename T>
 adios2::Variable<T> ADIOS2IOHandlerImpl::verifyDataset(
     Offset const &offset,
@@ -1584,6 +1947,271 @@ namespace detail
         engine.Get(var, ptr);
     }
 
+    namespace
+    {
+        /*
+         * Copy the intersection of two boxes in row-major layout.
+         * All offsets are global, the intersection must be non-empty.
+         */
+        template <typename T>
+        void copyIntersection(
+            T const *src,
+            adios2::Dims const &srcOffset,
+            adios2::Dims const &srcExtent,
+            T *dst,
+            adios2::Dims const &dstOffset,
+            adios2::Dims const &dstExtent,
+            adios2::Dims const &offset,
+            adios2::Dims const &extent)
+        {
+            auto dim = extent.size();
+            // position inside the intersection, last index stays at zero
+            adios2::Dims index(dim, 0);
+            auto linearIndex = [&](adios2::Dims const &boxOffset,
+                                   adios2::Dims const &boxExtent) {
+                size_t res = 0;
+                for (size_t i = 0; i < dim; ++i)
+                {
+                    res = res * boxExtent[i] + offset[i] + index[i] -
+                        boxOffset[i];
+                }
+                return res;
+            };
+            while (true)
+            {
+                std::copy_n(
+                    src + linearIndex(srcOffset, srcExtent),
+                    extent[dim - 1],
+                    dst + linearIndex(dstOffset, dstExtent));
+                size_t i = dim - 1;
+                for (; i > 0; --i)
+                {
+                    if (++index[i - 1] < extent[i - 1])
+                    {
+                        break;
+                    }
+                    index[i - 1] = 0;
+                }
+                if (i == 0)
+                {
+                    return;
+                }
+            }
+        }
+
+        // whether any two of the given (offset, extent) boxes intersect
+        bool
+        overlapping(std::vector<std::pair<adios2::Dims, adios2::Dims>> regions)
+        {
+            if (!regions.empty() && regions.front().first.empty())
+            {
+                // scalars, each block covers everything
+                return regions.size() > 1;
+            }
+            // sweep along the first dimension
+            std::sort(
+                regions.begin(),
+                regions.end(),
+                [](auto const &left, auto const &right) {
+                    return left.first[0] < right.first[0];
+                });
+            for (size_t i = 0; i < regions.size(); ++i)
+            {
+                auto const &[offset, extent] = regions[i];
+                for (size_t j = i + 1; j < regions.size() &&
+                     regions[j].first[0] < offset[0] + extent[0];
+                     ++j)
+                {
+                    auto const &[otherOffset, otherExtent] = regions[j];
+                    bool intersects = true;
+                    for (size_t d = 1; d < offset.size() && intersects; ++d)
+                    {
+                        intersects = std::max(offset[d], otherOffset[d]) <
+                            std::min(offset[d] + extent[d],
+                                     otherOffset[d] + otherExtent[d]);
+                    }
+                    if (intersects)
+                    {
+                        return true;
+                    }
+                }
+            }
+            return false;
+        }
+    } // namespace
+
+    template <typename T>
+    void ReadByBlocks::call(BufferedGet &bp, BufferedActions &ba)
+    {
+        auto impl = ba.m_impl;
+        auto &engine = ba.getEngine();
+        adios2::Variable<T> var = impl->verifyDataset<T>(
+            bp.param.offset, bp.param.extent, ba.m_IO, bp.name);
+        auto ptr = std::static_pointer_cast<T>(bp.param.data);
+
+        std::vector<typename adios2::Variable<T>::Info> blocks;
+        if (impl->m_handler->m_frontendAccess != Access::READ_LINEAR &&
+            ba.streamStatus == BufferedActions::StreamStatus::NoStream)
+        {
+            auto allSteps = var.AllStepsBlocksInfo();
+            if (allSteps.size() == 1)
+            {
+                blocks = std::move(allSteps.front());
+            }
+        }
+        else
+        {
+            blocks = engine.BlocksInfo(var, engine.CurrentStep());
+        }
+
+        adios2::Dims offset(bp.param.offset.begin(), bp.param.offset.end());
+        adios2::Dims extent(bp.param.extent.begin(), bp.param.extent.end());
+        auto dim = extent.size();
+        if (blocks.empty() ||
+            std::any_of(blocks.begin(), blocks.end(), [dim](auto const &b) {
+                return b.Start.size() != dim || b.Count.size() != dim;
+            }))
+        {
+            // no usable block structure, let ADIOS2 do the work
+            engine.Get(var, ptr.get());
+            return;
+        }
+
+        // copies into ptr and the regions that they write to
+        std::vector<std::function<void()>> copies;
+        std::vector<std::pair<adios2::Dims, adios2::Dims>> regions;
+        for (auto const &block : blocks)
+        {
+            adios2::Dims interOffset(dim), interExtent(dim);
+            bool intersects = true;
+            for (size_t i = 0; i < dim && intersects; ++i)
+            {
+                auto begin = std::max(offset[i], block.Start[i]);
+                auto end = std::min(
+                    offset[i] + extent[i], block.Start[i] + block.Count[i]);
+                intersects = begin < end;
+                interOffset[i] = begin;
+                interExtent[i] = end - begin;
+            }
+            if (!intersects)
+            {
+                continue;
+            }
+
+            ADIOS2IOHandlerImpl::BlockCacheKey key{
+                ba.m_file, bp.name, block.Step, block.BlockID};
+            auto cached = impl->cachedBlock(key);
+            if (!cached)
+            {
+                size_t size = std::accumulate(
+                    block.Count.begin(),
+                    block.Count.end(),
+                    size_t(1),
+                    std::multiplies<size_t>());
+                std::shared_ptr<T[]> data(new T[size]);
+                var.SetBlockSelection(block.BlockID);
+                engine.Get(var, data.get());
+                cached = std::move(data);
+                impl->cacheBlock(std::move(key), cached, size * sizeof(T));
+            }
+            regions.emplace_back(interOffset, interExtent);
+            // the block might still be pending, so copy after the Gets
+            copies.emplace_back(
+                [src = std::static_pointer_cast<T const[]>(cached),
+                 ptr,
+                 blockOffset = block.Start,
+                 blockExtent = block.Count,
+                 offset,
+                 extent,
+                 interOffset = std::move(interOffset),
+                 interExtent = std::move(interExtent)]() {
+                    copyIntersection(
+                        src.get(),
+                        blockOffset,
+                        blockExtent,
+                        ptr.get(),
+                        offset,
+                        extent,
+                        interOffset,
+                        interExtent);
+                });
+        }
+
+        if (overlapping(regions))
+        {
+            /*
+             * Written blocks may overlap, then the later block wins as with a
+             * plain Get. Copy in block order and not concurrently.
+             */
+            ba.m_blockCopies.emplace_back([copies = std::move(copies)]() {
+                for (auto const &copy : copies)
+                {
+                    copy();
+                }
+            });
+        }
+        else
+        {
+            std::move(
+                copies.begin(),
+                copies.end(),
+                std::back_inserter(ba.m_blockCopies));
+        }
+    }
+
+    template <typename T>
+    void PrefetchVariable::call(
+        BufferedActions &ba, std::string const &name, size_t &budget)
+    {
+        auto var = ba.m_IO.InquireVariable<T>(name);
+        if (!var || var.ShapeID() != adios2::ShapeID::GlobalArray)
+        {
+            return;
+        }
+        auto shape = var.Shape();
+        size_t size = std::accumulate(
+            shape.begin(), shape.end(), size_t(1), std::multiplies<size_t>());
+        if (size == 0 || size * sizeof(T) > budget)
+        {
+            return;
+        }
+        budget -= size * sizeof(T);
+        std::shared_ptr<T[]> data(new T[size]);
+        var.SetSelection({adios2::Dims(shape.size(), 0), shape});
+        ba.m_engine->Get(var, data.get());
+        ba.m_prefetching.emplace(
+            name,
+            BufferedActions::PrefetchedVariable{
+                std::static_pointer_cast<void>(
+                    std::shared_ptr<T>(data, data.get())),
+                std::move(shape),
+                size * sizeof(T)});
+    }
+
+    template <typename T>
+    void ReadPrefetched::call(BufferedGet &bp, BufferedActions &ba)
+    {
+        auto const &prefetched = ba.m_prefetched.at(bp.name);
+        adios2::Dims offset(bp.param.offset.begin(), bp.param.offset.end());
+        adios2::Dims extent(bp.param.extent.begin(), bp.param.extent.end());
+        // validates the selection against the variable
+        ba.m_impl->verifyDataset<T>(
+            bp.param.offset, bp.param.extent, ba.m_IO, bp.name);
+        if (std::find(extent.begin(), extent.end(), 0) == extent.end())
+        {
+            copyIntersection(
+                static_cast<T const *>(prefetched.data.get()),
+                adios2::Dims(prefetched.shape.size(), 0),
+                prefetched.shape,
+                std::static_pointer_cast<T>(bp.param.data).get(),
+                offset,
+                extent,
+                offset,
+                extent);
+        }
+        ++ba.m_impl->m_prefetchHits;
+    }
+
     template <typename T>
     Datatype OldAttributeReader::call(
         adios2::IO &IO,
@@ -1997,6 +2625,190 @@ namespace detail
         throw std::runtime_error("[ADIOS2] WRITE_DATASET: Invalid datatype.");
     }
 
+    namespace
+    {
+        struct OperatorCandidate
+        {
+            std::string label;
+            std::string type;
+            adios2::Params params;
+        };
+
+        /*
+         * Compressors tried by operator type "auto", roughly from the fastest
+         * to the slowest.
+         */
+        std::vector<OperatorCandidate> operatorCandidates()
+        {
+            std::vector<OperatorCandidate> res;
+#if defined(ADIOS2_HAVE_BLOSC2) || defined(ADIOS2_HAVE_BLOSC)
+            for (char const *codec : {"lz4", "blosclz", "zstd", "zlib"})
+            {
+                res.push_back(
+                    {std::string("blosc:") + codec,
+                     "blosc",
+                     {{"compressor", codec},
+                      {"clevel", "5"},
+                      {"doshuffle", "BLOSC_SHUFFLE"}}});
+            }
+#endif
+#if defined(ADIOS2_HAVE_BZIP2)
+            res.push_back({"bzip2", "bzip2", {{"blockSize100k", "9"}}});
+#endif
+            return res;
+        }
+    } // namespace
+
+    template <typename T>
+    void SelectOperator::call(
+        BufferedActions &ba,
+        BufferedPut const &bp,
+        ADIOS2IOHandlerImpl::AutoOperatorPolicy const &policy)
+    {
+        using clock = std::chrono::steady_clock;
+        auto const begin = clock::now();
+
+        size_t const elements = std::accumulate(
+            bp.param.extent.begin(),
+            bp.param.extent.end(),
+            size_t(1),
+            std::multiplies<size_t>());
+        size_t const sampleElements = std::max<size_t>(
+            1, std::min(elements, policy.sampleSize / sizeof(T)));
+        double const sampleBytes = double(sampleElements * sizeof(T));
+        auto sample = static_cast<T const *>(bp.param.data.get());
+
+        /*
+         * The ADIOS2 API offers no way to run an operator on a buffer, so
+         * write the sample to a small file with each candidate and compare
+         * the sizes of the data files.
+         * Use a serial ADIOS instance since the trials are not collective.
+         */
+        auto &impl = *ba.m_impl;
+        auto const key = ADIOS2IOHandlerImpl::autoOperatorKey(bp.name);
+        if (auto it = impl.m_autoOperatorChoices.find(key);
+            it != impl.m_autoOperatorChoices.end())
+        {
+            // decided for another iteration within the same flush
+            for (auto const &op : impl.autoOperators(it->second))
+            {
+                ba.m_IO.InquireVariable<T>(bp.name).AddOperation(
+                    op.op, op.params);
+            }
+            impl.recordAutoOperator(ba, bp.name, it->second);
+            return;
+        }
+
+        // node-local, keep the trials off the parallel filesystem
+        std::string directory = auxiliary::getEnvString("TMPDIR", "");
+#ifdef _WIN32
+        if (directory.empty())
+        {
+            directory = auxiliary::getEnvString("TEMP", ".");
+        }
+#else
+        if (directory.empty())
+        {
+            directory = "/tmp";
+        }
+#endif
+        std::string const prefix = directory + "/openPMD_operator_trial." +
+            std::to_string(std::random_device()());
+        adios2::ADIOS adios;
+        unsigned trials = 0;
+        // bytes in the data file and seconds taken, empty if failed
+        auto trial = [&](OperatorCandidate const *candidate)
+            -> std::optional<std::pair<size_t, double>> {
+            std::string const name =
+                prefix + "." + std::to_string(trials++) + ".bp";
+            std::optional<std::pair<size_t, double>> res;
+            try
+            {
+                adios2::IO IO = adios.DeclareIO(name);
+                IO.SetEngine("bp4");
+                auto var = IO.DefineVariable<T>(
+                    "sample", {sampleElements}, {0}, {sampleElements});
+                if (candidate)
+                {
+                    var.AddOperation(adios.DefineOperator(
+                        name, candidate->type, candidate->params));
+                }
+                auto const start = clock::now();
+                adios2::Engine engine = IO.Open(name, adios2::Mode::Write);
+                engine.Put(var, sample, adios2::Mode::Sync);
+                engine.Close();
+                std::chrono::duration<double> const seconds =
+                    clock::now() - start;
+                std::ifstream dataFile(
+                    name + "/data.0", std::ios::binary | std::ios::ate);
+                if (dataFile)
+                {
+                    res = std::make_pair(
+                        size_t(dataFile.tellg()), seconds.count());
+                }
+            }
+            catch (std::exception const &)
+            {
+                // e.g. a compressor not supporting this datatype
+            }
+            adios.RemoveIO(name);
+            if (auxiliary::directory_exists(name))
+            {
+                auxiliary::remove_directory(name);
+            }
+            return res;
+        };
+
+        OperatorCandidate const *best = nullptr;
+        auto candidates = operatorCandidates();
+        if (auto baseline = trial(nullptr); baseline.has_value())
+        {
+            double bestRatio = 1.;
+            for (auto const &candidate : candidates)
+            {
+                std::chrono::duration<double> const elapsed =
+                    clock::now() - begin;
+                if (elapsed.count() > policy.timeBudget)
+                {
+                    break;
+                }
+                auto result = trial(&candidate);
+                if (!result.has_value() || result->first == 0)
+                {
+                    continue;
+                }
+                double ratio = double(baseline->first) / result->first;
+                // subtract the engine's own overhead
+                double seconds =
+                    std::max(result->second - baseline->second, 1e-6);
+                double throughput = sampleBytes / seconds / 1e6;
+                if (throughput >= policy.minThroughput && ratio > bestRatio)
+                {
+                    best = &candidate;
+                    bestRatio = ratio;
+                }
+            }
+        }
+
+        ADIOS2IOHandlerImpl::AutoOperatorChoice choice{"none", "", {}};
+        if (best)
+        {
+            choice = {best->label, best->type, best->params};
+        }
+        auto operators = impl.autoOperators(choice);
+        if (operators.empty())
+        {
+            choice = {"none", "", {}};
+        }
+        for (auto const &op : operators)
+        {
+            ba.m_IO.InquireVariable<T>(bp.name).AddOperation(op.op, op.params);
+        }
+        impl.recordAutoOperator(ba, bp.name, choice);
+        ++impl.m_selectedOperators[choice.label];
+        impl.m_autoOperatorChoices.emplace(key, std::move(choice));
+    }
+
     template <typename T>
     void VariableDefiner::call(
         adios2::IO &IO,
@@ -2418,8 +3230,26 @@ namespace detail
 
     void BufferedGet::run(BufferedActions &ba)
     {
-        switchAdios2VariableType<detail::DatasetReader>(
-            param.dtype, ba.m_impl, *this, ba.m_IO, ba.getEngine(), ba.m_file);
+        if (ba.m_prefetched.find(name) != ba.m_prefetched.end())
+        {
+            switchAdios2VariableType<detail::ReadPrefetched>(
+                param.dtype, *this, ba);
+        }
+        else if (ba.m_impl->m_readByBlocks)
+        {
+            switchAdios2VariableType<detail::ReadByBlocks>(
+                param.dtype, *this, ba);
+        }
+        else
+        {
+            switchAdios2VariableType<detail::DatasetReader>(
+                param.dtype,
+                ba.m_impl,
+                *this,
+                ba.m_IO,
+                ba.getEngine(),
+                ba.m_file);
+        }
     }
 
     void BufferedPut::run(BufferedActions &ba)
@@ -2536,6 +3366,11 @@ namespace detail
         {
             return;
         }
+        // the prefetching task might have begun a step
+        if (awaitPrefetch() == adios2::StepStatus::OK)
+        {
+            streamStatus = StreamStatus::DuringStep;
+        }
         // if write accessing, ensure that the engine is opened
         // and that all attributes are written
         // (attributes and unique_ptr datasets are written upon closing a step
@@ -2566,6 +3401,11 @@ namespace detail
                 }
                 engine.Close();
                 m_ADIOS.RemoveIO(m_IOName);
+                // without steps, the whole file counts as one step
+                if (m_bytesPutInStep > 0)
+                {
+                    recordStepSize();
+                }
             }
         }
         finalized = true;
@@ -3044,6 +3884,47 @@ namespace detail
                 auxiliary::getEnvNum("OPENPMD_ADIOS2_STATS_LEVEL", 0);
             m_IO.SetParameter("StatsLevel", std::to_string(stats_level));
         }
+        if (m_impl->m_autoBufferSize &&
+            (m_mode == adios2::Mode::Write || m_mode == adios2::Mode::Append) &&
+            std::any_of(
+                std::begin(supportsUpfrontParsingInRandomAccessMode),
+                std::end(supportsUpfrontParsingInRandomAccessMode),
+                [this](char const *engine) { return engine == m_engineType; }))
+        {
+            if (auto predicted = m_impl->predictedStepSize();
+                predicted.has_value())
+            {
+                // BP4: one contiguous buffer, grows by reallocation
+                if (notYetConfigured("InitialBufferSize"))
+                {
+                    m_bufferCapacity = std::max<size_t>(*predicted, 16384);
+                    m_IO.SetParameter(
+                        "InitialBufferSize", std::to_string(m_bufferCapacity));
+                }
+                // BP5: list of chunks, a step should fit into one if possible
+                constexpr size_t defaultChunkSize = 128ul * 1024ul * 1024ul;
+                constexpr size_t maxChunkSize = 2147381248ul;
+                // OPENPMD_ADIOS2_BP5_BufferChunkMB takes precedence, too
+                if (notYetConfigured("BufferChunkSize") &&
+                    m_IO.Parameters().count("BufferChunkSize") == 0 &&
+                    *predicted > defaultChunkSize)
+                {
+                    m_IO.SetParameter(
+                        "BufferChunkSize",
+                        std::to_string(std::min(*predicted, maxChunkSize)));
+                }
+            }
+        }
+        if (m_impl->m_readThreads.has_value() && notYetConfigured("Threads") &&
+            m_mode != adios2::Mode::Write && m_mode != adios2::Mode::Append)
+        {
+            /*
+             * The BP5 reader distributes the read requests of PerformGets()
+             * to this many threads, each one also decompressing its requests.
+             * Other engines ignore the parameter.
+             */
+            m_IO.SetParameter("Threads", std::to_string(m_impl->readThreads()));
+        }
         if (m_engineType == "sst" && notYetConfigured("QueueLimit"))
         {
             /*
@@ -3352,6 +4233,15 @@ namespace detail
                 requireActiveStep();
             }
         }
+        if (m_impl->m_aggregatePuts &&
+            (m_mode == adios2::Mode::Write || m_mode == adios2::Mode::Append))
+        {
+            aggregatePuts();
+        }
+        if (!m_autoOperators.empty())
+        {
+            selectOperators();
+        }
         for (auto &ba : m_buffer)
         {
             ba->run(*this);
@@ -3390,6 +4280,32 @@ namespace detail
         {
         case FlushLevel::UserFlush:
             performPutGets(*this, eng);
+            if (m_impl->m_readThreads.has_value() && m_blockCopies.size() > 1)
+            {
+                m_impl->readThreadPool().parallelFor(
+                    m_blockCopies.size(),
+                    [this](size_t i) { m_blockCopies[i](); });
+            }
+            else
+            {
+                for (auto &copy : m_blockCopies)
+                {
+                    copy();
+                }
+            }
+            m_blockCopies.clear();
+            if (streamStatus == StreamStatus::NoStream)
+            {
+                // no end of step that would release unneeded view buffers
+                m_readViewBuffers.erase(
+                    std::remove_if(
+                        m_readViewBuffers.begin(),
+                        m_readViewBuffers.end(),
+                        [](ReadViewBuffer const &buffer) {
+                            return buffer.data.use_count() == 1;
+                        }),
+                    m_readViewBuffers.end());
+            }
             m_updateSpans.clear();
             m_buffer.clear();
             m_alreadyEnqueued.clear();
@@ -3508,6 +4424,8 @@ namespace detail
     AdvanceStatus
     BufferedActions::advance(AdvanceMode mode, bool calledExplicitly)
     {
+        // the prefetching task might have begun a step, see startPrefetch()
+        auto const prefetchStatus = awaitPrefetch();
         if (streamStatus == StreamStatus::Undecided)
         {
             // stream status gets decided on upon opening an engine
@@ -3561,7 +4479,10 @@ namespace detail
              */
             if (streamStatus == StreamStatus::OutsideOfStep)
             {
-                if (getEngine().BeginStep() != adios2::StepStatus::OK)
+                auto status = prefetchStatus.has_value()
+                    ? *prefetchStatus
+                    : getEngine().BeginStep();
+                if (status != adios2::StepStatus::OK)
                 {
                     throw std::runtime_error(
                         "[ADIOS2] Trying to close a step that cannot be "
@@ -3575,7 +4496,27 @@ namespace detail
                 /* flushUnconditionally = */ true);
             uncommittedAttributes.clear();
             m_updateSpans.clear();
+            m_prefetched.clear();
+            m_impl->dropCachedBlocks(m_file);
+            if (m_mode == adios2::Mode::Write || m_mode == adios2::Mode::Append)
+            {
+                recordStepSize();
+            }
+            m_readViewBuffers.erase(
+                std::remove_if(
+                    m_readViewBuffers.begin(),
+                    m_readViewBuffers.end(),
+                    [](ReadViewBuffer &buffer) {
+                        bool unused = !buffer.usedInStep;
+                        buffer.usedInStep = false;
+                        return unused;
+                    }),
+                m_readViewBuffers.end());
             streamStatus = StreamStatus::OutsideOfStep;
+            if (m_mode == adios2::Mode::Read && m_impl->m_prefetchMemory > 0)
+            {
+                startPrefetch();
+            }
             return AdvanceStatus::OK;
         }
         case AdvanceMode::BEGINSTEP: {
@@ -3583,7 +4524,14 @@ namespace detail
 
             if (streamStatus != StreamStatus::DuringStep)
             {
-                adiosStatus = getEngine().BeginStep();
+                if (prefetchStatus.has_value())
+                {
+                    adiosStatus = *prefetchStatus;
+                }
+                else
+                {
+                    adiosStatus = getEngine().BeginStep();
+                }
                 if (adiosStatus == adios2::StepStatus::OK &&
                     m_mode == adios2::Mode::Read &&
                     attributeLayout() == AttributeLayout::ByAdiosVariables)
@@ -3625,6 +4573,182 @@ namespace detail
         m_buffer.clear();
     }
 
+    void BufferedActions::aggregatePuts()
+    {
+        std::map<std::string, std::vector<BufferedPut *>> candidates;
+        for (auto &action : m_buffer)
+        {
+            auto put = dynamic_cast<BufferedPut *>(action.get());
+            if (put && put->param.extent.size() == 1 &&
+                put->param.extent[0] > 0)
+            {
+                candidates[put->name].push_back(put);
+            }
+        }
+        // puts merged into another one, to be removed from m_buffer
+        std::set<BufferedAction const *> merged;
+        for (auto &[name, puts] : candidates)
+        {
+            if (puts.size() < 2)
+            {
+                continue;
+            }
+            std::sort(puts.begin(), puts.end(), [](auto left, auto right) {
+                return left->param.offset[0] < right->param.offset[0];
+            });
+            for (size_t begin = 0; begin < puts.size();)
+            {
+                auto const &first = puts[begin]->param;
+                size_t end = begin + 1;
+                size_t extent = first.extent[0];
+                for (; end < puts.size() &&
+                     puts[end]->param.offset[0] == first.offset[0] + extent &&
+                     puts[end]->param.dtype == first.dtype;
+                     ++end)
+                {
+                    extent += puts[end]->param.extent[0];
+                }
+                if (end - begin > 1)
+                {
+                    size_t elementSize = toBytes(first.dtype);
+                    std::shared_ptr<char[]> staging(
+                        new char[extent * elementSize]);
+                    for (size_t i = begin; i < end; ++i)
+                    {
+                        auto const &param = puts[i]->param;
+                        std::memcpy(
+                            staging.get() +
+                                (param.offset[0] - first.offset[0]) *
+                                    elementSize,
+                            param.data.get(),
+                            param.extent[0] * elementSize);
+                        if (i > begin)
+                        {
+                            merged.emplace(puts[i]);
+                        }
+                    }
+                    puts[begin]->param.extent = {extent};
+                    puts[begin]->param.data = std::shared_ptr<void const>(
+                        staging, static_cast<void const *>(staging.get()));
+                    m_impl->m_aggregatedPuts += end - begin;
+                    ++m_impl->m_aggregatedBlocks;
+                }
+                begin = end;
+            }
+        }
+        m_buffer.erase(
+            std::remove_if(
+                m_buffer.begin(),
+                m_buffer.end(),
+                [&merged](auto const &action) {
+                    return merged.find(action.get()) != merged.end();
+                }),
+            m_buffer.end());
+    }
+
+    void BufferedActions::selectOperators()
+    {
+        for (auto &action : m_buffer)
+        {
+            auto put = dynamic_cast<BufferedPut *>(action.get());
+            if (!put || put->param.extent.empty() ||
+                std::find(
+                    put->param.extent.begin(), put->param.extent.end(), 0) !=
+                    put->param.extent.end())
+            {
+                continue;
+            }
+            auto it = m_autoOperators.find(put->name);
+            if (it == m_autoOperators.end())
+            {
+                continue;
+            }
+            switchAdios2VariableType<SelectOperator>(
+                put->param.dtype, *this, *put, it->second);
+            m_autoOperators.erase(it);
+        }
+    }
+
+    void BufferedActions::startPrefetch()
+    {
+        m_prefetch = std::async(std::launch::async, [this]() {
+            auto status = m_engine->BeginStep();
+            if (status != adios2::StepStatus::OK)
+            {
+                return status;
+            }
+            size_t budget = m_impl->m_prefetchMemory;
+            for (auto const &pair :
+                 m_IO.AvailableVariables(/* namesOnly = */ true))
+            {
+                auto dtype = fromADIOS2Type(
+                    m_IO.VariableType(pair.first), /* verbose = */ false);
+                if (dtype == Datatype::UNDEFINED || dtype == Datatype::STRING)
+                {
+                    continue;
+                }
+                switchAdios2VariableType<PrefetchVariable>(
+                    dtype, *this, pair.first, budget);
+            }
+            m_engine->PerformGets();
+            return status;
+        });
+    }
+
+    std::optional<adios2::StepStatus> BufferedActions::awaitPrefetch()
+    {
+        if (!m_prefetch.valid())
+        {
+            return std::nullopt;
+        }
+        // rethrows errors from the background task
+        auto status = m_prefetch.get();
+        auto prefetching = std::move(m_prefetching);
+        m_prefetching.clear();
+        if (status == adios2::StepStatus::OK)
+        {
+            ++m_impl->m_prefetchedSteps;
+            for (auto const &pair : prefetching)
+            {
+                m_impl->m_prefetchedBytes += pair.second.bytes;
+            }
+            m_prefetched = std::move(prefetching);
+        }
+        return status;
+    }
+
+    void BufferedActions::recordStepSize()
+    {
+        bool grew = m_bytesPutInStep > m_bufferCapacity;
+        m_bufferCapacity = std::max(m_bufferCapacity, m_bytesPutInStep);
+        m_impl->recordStepSize(m_bytesPutInStep, grew);
+        m_bytesPutInStep = 0;
+    }
+
+    std::shared_ptr<void> BufferedActions::getReadViewBuffer(size_t size)
+    {
+        // best fit among the buffers no longer referenced by the frontend
+        ReadViewBuffer *chosen = nullptr;
+        for (auto &buffer : m_readViewBuffers)
+        {
+            // a small view must not hold on to a much larger buffer
+            if (buffer.data.use_count() == 1 && buffer.size >= size &&
+                buffer.size <= 2 * size &&
+                (!chosen || buffer.size < chosen->size))
+            {
+                chosen = &buffer;
+            }
+        }
+        if (!chosen)
+        {
+            chosen = &m_readViewBuffers.emplace_back();
+            chosen->data = std::shared_ptr<char[]>(new char[size]);
+            chosen->size = size;
+        }
+        chosen->usedInStep = true;
+        return std::shared_ptr<void>(chosen->data, chosen->data.get());
+    }
+
     static std::vector<std::string> availableAttributesOrVariablesPrefixed(
         std::string const &prefix,
         BufferedActions::AttributeMap_t const &(
@@ -3657,16 +4781,19 @@ namespace detail
             prefix, &BufferedActions::availableAttributes, *this);
     }
 
-    std::vector<std::string>
-    BufferedActions::availableVariablesPrefixed(std::string const &prefix)
+    PathIndex const &BufferedActions::attributeIndex()
     {
-        return availableAttributesOrVariablesPrefixed(
-            prefix, &BufferedActions::availableVariables, *this);
+        if (!m_attributeIndex)
+        {
+            m_attributeIndex.emplace(availableAttributes());
+        }
+        return m_attributeIndex.value();
     }
 
     void BufferedActions::invalidateAttributesMap()
     {
         m_availableAttributes = std::optional<AttributeMap_t>();
+        m_attributeIndex = std::optional<PathIndex>();
     }
 
     BufferedActions::AttributeMap_t const &
@@ -3684,9 +4811,19 @@ namespace detail
         }
     }
 
+    PathIndex const &BufferedActions::variableIndex()
+    {
+        if (!m_variableIndex)
+        {
+            m_variableIndex.emplace(availableVariables());
+        }
+        return m_variableIndex.value();
+    }
+
     void BufferedActions::invalidateVariablesMap()
     {
         m_availableVariables = std::optional<AttributeMap_t>();
+        m_variableIndex = std::optional<PathIndex>();
     }
 
     BufferedActions::AttributeMap_t const &BufferedActions::availableVariables()
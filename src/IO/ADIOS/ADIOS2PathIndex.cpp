@@ -0,0 +1,138 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "openPMD/config.hpp"
+#if openPMD_HAVE_ADIOS2
+
+#include "openPMD/IO/ADIOS/ADIOS2PathIndex.hpp"
+
+namespace openPMD::detail
+{
+PathIndex::PathIndex(std::map<std::string, adios2::Params> const &names)
+{
+    m_nodes.emplace_back();
+    for (auto const &pair : names)
+    {
+        insert(pair.first);
+    }
+}
+
+void PathIndex::insert(std::string_view name)
+{
+    size_t node = 0;
+    size_t begin = 0;
+    while (true)
+    {
+        size_t end = name.find('/', begin);
+        auto component = name.substr(
+            begin, end == std::string_view::npos ? end : end - begin);
+        auto &children = m_nodes[node].children;
+        auto it = children.find(component);
+        if (it == children.end())
+        {
+            size_t next = m_nodes.size();
+            children.emplace(std::string(component), next);
+            // invalidates children
+            m_nodes.emplace_back();
+            node = next;
+        }
+        else
+        {
+            node = it->second;
+        }
+        if (end == std::string_view::npos)
+        {
+            break;
+        }
+        begin = end + 1;
+    }
+    m_nodes[node].isEntry = true;
+}
+
+auto PathIndex::find(std::string_view prefix) const -> Node const *
+{
+    if (!prefix.empty() && prefix.back() == '/')
+    {
+        prefix.remove_suffix(1);
+    }
+    // the empty prefix and "/" both have the single component ""
+    size_t node = 0;
+    size_t begin = 0;
+    while (true)
+    {
+        size_t end = prefix.find('/', begin);
+        auto component = prefix.substr(
+            begin, end == std::string_view::npos ? end : end - begin);
+        auto const &children = m_nodes[node].children;
+        auto it = children.find(component);
+        if (it == children.end())
+        {
+            return nullptr;
+        }
+        node = it->second;
+        if (end == std::string_view::npos)
+        {
+            return &m_nodes[node];
+        }
+        begin = end + 1;
+    }
+}
+
+std::vector<std::string> PathIndex::entries(std::string const &prefix) const
+{
+    std::vector<std::string> res;
+    if (auto node = find(prefix); node)
+    {
+        for (auto const &[name, child] : node->children)
+        {
+            if (m_nodes[child].isEntry)
+            {
+                res.emplace_back(name);
+            }
+        }
+    }
+    return res;
+}
+
+std::vector<std::string> PathIndex::groups(std::string const &prefix) const
+{
+    std::vector<std::string> res;
+    if (auto node = find(prefix); node)
+    {
+        for (auto const &[name, child] : node->children)
+        {
+            if (!m_nodes[child].children.empty())
+            {
+                res.emplace_back(name);
+            }
+        }
+    }
+    return res;
+}
+
+bool PathIndex::contains(std::string const &name) const
+{
+    auto node = find(name);
+    return node && node->isEntry;
+}
+} // namespace openPMD::detail
+
+#endif // openPMD_HAVE_ADIOS2
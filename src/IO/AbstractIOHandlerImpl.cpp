@@ -20,6 +20,7 @@
  */
 
 #include "openPMD/IO/AbstractIOHandlerImpl.hpp"
+#include "openPMD/Error.hpp"
 #include "openPMD/backend/Writable.hpp"
 
 namespace openPMD
@@ -30,4 +31,12 @@ void AbstractIOHandlerImpl::keepSynchronous(
     writable->abstractFilePosition = param.otherWritable->abstractFilePosition;
     writable->written = true;
 }
+
+void AbstractIOHandlerImpl::readAllAttributes(
+    Writable *, Parameter<Operation::READ_ALL_ATTS> &)
+{
+    throw error::OperationUnsupportedInBackend(
+        m_handler->backendName(),
+        "Reading all attributes of an object at once is not supported.");
+}
 } // namespace openPMD
@@ -30,11 +30,12 @@
 
 #include <array>
 #include <complex>
+#include <initializer_list>
 #include <map>
 #include <stack>
 #include <stdexcept>
 #include <string>
-#include <typeinfo>
+#include <utility>
 #include <vector>
 
 #if openPMD_USE_VERIFY
@@ -51,64 +52,57 @@
     } while (0)
 #endif
 
-hid_t openPMD::GetH5DataType::operator()(Attribute const &att)
+openPMD::GetH5DataType::GetH5DataType()
+{
+    m_types.fill(-1);
+}
+
+openPMD::GetH5DataType::GetH5DataType(
+    hid_t boolType, hid_t cfloatType, hid_t cdoubleType, hid_t clongDoubleType)
+{
+    m_types.fill(-1);
+    auto set = [this](Datatype dtype, hid_t type) {
+        m_types[static_cast<size_t>(dtype)] = type;
+    };
+    using DT = Datatype;
+    for (auto [dtype, type] : std::initializer_list<std::pair<DT, hid_t> >{
+             {DT::CHAR, H5T_NATIVE_CHAR},
+             {DT::UCHAR, H5T_NATIVE_UCHAR},
+             {DT::SCHAR, H5T_NATIVE_SCHAR},
+             {DT::SHORT, H5T_NATIVE_SHORT},
+             {DT::INT, H5T_NATIVE_INT},
+             {DT::LONG, H5T_NATIVE_LONG},
+             {DT::LONGLONG, H5T_NATIVE_LLONG},
+             {DT::USHORT, H5T_NATIVE_USHORT},
+             {DT::UINT, H5T_NATIVE_UINT},
+             {DT::ULONG, H5T_NATIVE_ULONG},
+             {DT::ULONGLONG, H5T_NATIVE_ULLONG},
+             {DT::FLOAT, H5T_NATIVE_FLOAT},
+             {DT::DOUBLE, H5T_NATIVE_DOUBLE},
+             {DT::LONG_DOUBLE, H5T_NATIVE_LDOUBLE},
+             {DT::CFLOAT, cfloatType},
+             {DT::CDOUBLE, cdoubleType},
+             {DT::CLONG_DOUBLE, clongDoubleType}})
+    {
+        set(dtype, type);
+        // vectors are stored with the datatype of their elements
+        set(toVectorType(dtype), type);
+    }
+    set(DT::ARR_DBL_7, H5T_NATIVE_DOUBLE);
+    set(DT::BOOL, boolType);
+}
+
+hid_t openPMD::GetH5DataType::native(Datatype dtype) const
+{
+    auto const index = static_cast<size_t>(dtype);
+    return index < m_types.size() ? m_types[index] : -1;
+}
+
+hid_t openPMD::GetH5DataType::operator()(Attribute const &att) const
 {
     using DT = Datatype;
     switch (att.dtype)
     {
-    case DT::CHAR:
-    case DT::VEC_CHAR:
-        return H5Tcopy(H5T_NATIVE_CHAR);
-    case DT::UCHAR:
-    case DT::VEC_UCHAR:
-        return H5Tcopy(H5T_NATIVE_UCHAR);
-    case DT::SCHAR:
-    case DT::VEC_SCHAR:
-        return H5Tcopy(H5T_NATIVE_SCHAR);
-    case DT::SHORT:
-    case DT::VEC_SHORT:
-        return H5Tcopy(H5T_NATIVE_SHORT);
-    case DT::INT:
-    case DT::VEC_INT:
-        return H5Tcopy(H5T_NATIVE_INT);
-    case DT::LONG:
-    case DT::VEC_LONG:
-        return H5Tcopy(H5T_NATIVE_LONG);
-    case DT::LONGLONG:
-    case DT::VEC_LONGLONG:
-        return H5Tcopy(H5T_NATIVE_LLONG);
-    case DT::USHORT:
-    case DT::VEC_USHORT:
-        return H5Tcopy(H5T_NATIVE_USHORT);
-    case DT::UINT:
-    case DT::VEC_UINT:
-        return H5Tcopy(H5T_NATIVE_UINT);
-    case DT::ULONG:
-    case DT::VEC_ULONG:
-        return H5Tcopy(H5T_NATIVE_ULONG);
-    case DT::ULONGLONG:
-    case DT::VEC_ULONGLONG:
-        return H5Tcopy(H5T_NATIVE_ULLONG);
-    case DT::FLOAT:
-    case DT::VEC_FLOAT:
-        return H5Tcopy(H5T_NATIVE_FLOAT);
-    case DT::DOUBLE:
-    case DT::ARR_DBL_7:
-    case DT::VEC_DOUBLE:
-        return H5Tcopy(H5T_NATIVE_DOUBLE);
-    case DT::LONG_DOUBLE:
-    case DT::VEC_LONG_DOUBLE:
-        return H5Tcopy(H5T_NATIVE_LDOUBLE);
-    case DT::CFLOAT:
-    case DT::VEC_CFLOAT:
-        return H5Tcopy(m_userTypes.at(typeid(std::complex<float>).name()));
-    case DT::CDOUBLE:
-    case DT::VEC_CDOUBLE:
-        return H5Tcopy(m_userTypes.at(typeid(std::complex<double>).name()));
-    case DT::CLONG_DOUBLE:
-    case DT::VEC_CLONG_DOUBLE:
-        return H5Tcopy(
-            m_userTypes.at(typeid(std::complex<long double>).name()));
     case DT::STRING: {
         hid_t string_t_id = H5Tcopy(H5T_C_S1);
         size_t const max_len = att.get<std::string>().size() + 1;
@@ -130,14 +124,40 @@ hid_t openPMD::GetH5DataType::operator()(Attribute const &att)
             "[HDF5] Internal error: Failed in H5Tset_size for VEC_STRING");
         return string_t_id;
     }
-    case DT::BOOL:
-        return H5Tcopy(m_userTypes.at(typeid(bool).name()));
     case DT::UNDEFINED:
         throw std::runtime_error(
             "[HDF5] Unknown Attribute datatype (HDF5 datatype)");
-    default:
-        throw std::runtime_error("[HDF5] Datatype not implemented");
+    default: {
+        hid_t type = native(att.dtype);
+        if (type < 0)
+        {
+            throw std::runtime_error("[HDF5] Datatype not implemented");
+        }
+        return H5Tcopy(type);
     }
+    }
+}
+
+void openPMD::HDF5Lock::lock()
+{
+    std::unique_lock<std::mutex> lock(m_mutex);
+    m_released.wait(lock, [this]() { return !m_locked; });
+    m_locked = true;
+}
+
+void openPMD::HDF5Lock::unlock()
+{
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_locked = false;
+    }
+    m_released.notify_one();
+}
+
+openPMD::HDF5Lock &openPMD::hdf5Lock()
+{
+    static HDF5Lock lock;
+    return lock;
 }
 
 hid_t openPMD::getH5DataSpace(Attribute const &att)
@@ -313,7 +333,9 @@ std::string openPMD::concrete_h5_file_position(Writable *w)
 }
 
 std::vector<hsize_t> openPMD::getOptimalChunkDims(
-    std::vector<hsize_t> const dims, size_t const typeSize)
+    std::vector<hsize_t> const dims,
+    size_t const typeSize,
+    size_t const targetChunkSize)
 {
     auto const ndims = dims.size();
     std::vector<hsize_t> chunk_dims(dims.size());
@@ -344,11 +366,18 @@ std::vector<hsize_t> openPMD::getOptimalChunkDims(
     }
 
     // compute the target chunk size
-    for (auto const &chunk_size : CHUNK_SIZES_KiB)
+    if (targetChunkSize > 0)
     {
-        target_chunk_size = chunk_size * 1024;
-        if (target_chunk_size <= max_chunk_size)
-            break;
+        target_chunk_size = targetChunkSize;
+    }
+    else
+    {
+        for (auto const &chunk_size : CHUNK_SIZES_KiB)
+        {
+            target_chunk_size = chunk_size * 1024;
+            if (target_chunk_size <= max_chunk_size)
+                break;
+        }
     }
 
     size_t current_chunk_size = typeSize;
@@ -0,0 +1,330 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "openPMD/IO/HDF5/HDF5DirectChunk.hpp"
+
+#if openPMD_HAVE_HDF5
+#if openPMD_HAVE_ZLIB
+#include <zlib.h>
+#endif
+
+#include <algorithm>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+
+namespace openPMD::detail
+{
+std::optional<std::vector<DirectChunkFilter>> directChunkFilters(hid_t dcpl)
+{
+    int const nfilters = H5Pget_nfilters(dcpl);
+    if (nfilters < 0)
+    {
+        return std::nullopt;
+    }
+    std::vector<DirectChunkFilter> filters;
+    for (int i = 0; i < nfilters; ++i)
+    {
+        unsigned int flags;
+        size_t cdNelmts = 8;
+        unsigned int cdValues[8];
+        unsigned int filterConfig;
+        H5Z_filter_t id = H5Pget_filter2(
+            dcpl,
+            static_cast<unsigned>(i),
+            &flags,
+            &cdNelmts,
+            cdValues,
+            0,
+            nullptr,
+            &filterConfig);
+        switch (id)
+        {
+        case H5Z_FILTER_SHUFFLE:
+            // the element size is set by HDF5 at dataset creation
+            if (cdNelmts < 1)
+            {
+                return std::nullopt;
+            }
+            filters.push_back({DirectChunkFilter::Type::Shuffle, cdValues[0]});
+            break;
+#if openPMD_HAVE_ZLIB
+        case H5Z_FILTER_DEFLATE:
+            filters.push_back(
+                {DirectChunkFilter::Type::Deflate,
+                 cdNelmts > 0 ? cdValues[0] : 6u});
+            break;
+#endif
+        default:
+            return std::nullopt;
+        }
+    }
+    return filters;
+}
+
+namespace
+{
+    std::vector<char> shuffle(std::vector<char> const &in, size_t elementSize)
+    {
+        size_t const n = in.size() / elementSize;
+        std::vector<char> out(in.size());
+        for (size_t byte = 0; byte < elementSize; ++byte)
+        {
+            for (size_t i = 0; i < n; ++i)
+            {
+                out[byte * n + i] = in[i * elementSize + byte];
+            }
+        }
+        // trailing bytes not forming a whole element stay in place
+        std::copy(
+            in.begin() + n * elementSize,
+            in.end(),
+            out.begin() + n * elementSize);
+        return out;
+    }
+
+    std::vector<char> unshuffle(std::vector<char> const &in, size_t elementSize)
+    {
+        size_t const n = in.size() / elementSize;
+        std::vector<char> out(in.size());
+        for (size_t byte = 0; byte < elementSize; ++byte)
+        {
+            for (size_t i = 0; i < n; ++i)
+            {
+                out[i * elementSize + byte] = in[byte * n + i];
+            }
+        }
+        std::copy(
+            in.begin() + n * elementSize,
+            in.end(),
+            out.begin() + n * elementSize);
+        return out;
+    }
+
+#if openPMD_HAVE_ZLIB
+    std::vector<char> deflate(std::vector<char> const &in, int level)
+    {
+        uLongf size = compressBound(static_cast<uLong>(in.size()));
+        std::vector<char> out(size);
+        int status = compress2(
+            reinterpret_cast<Bytef *>(out.data()),
+            &size,
+            reinterpret_cast<Bytef const *>(in.data()),
+            static_cast<uLong>(in.size()),
+            level);
+        if (status != Z_OK)
+        {
+            throw std::runtime_error(
+                "[HDF5] Failed to compress chunk with zlib (status " +
+                std::to_string(status) + ").");
+        }
+        out.resize(size);
+        return out;
+    }
+
+    std::vector<char> inflate(std::vector<char> const &in, size_t rawSize)
+    {
+        uLongf size = static_cast<uLongf>(rawSize);
+        std::vector<char> out(rawSize);
+        int status = uncompress(
+            reinterpret_cast<Bytef *>(out.data()),
+            &size,
+            reinterpret_cast<Bytef const *>(in.data()),
+            static_cast<uLong>(in.size()));
+        if (status != Z_OK || size != rawSize)
+        {
+            throw std::runtime_error(
+                "[HDF5] Failed to decompress chunk with zlib (status " +
+                std::to_string(status) + ").");
+        }
+        return out;
+    }
+#endif
+} // namespace
+
+std::vector<char> encodeChunk(
+    std::vector<DirectChunkFilter> const &filters, std::vector<char> chunk)
+{
+    for (auto const &filter : filters)
+    {
+        switch (filter.type)
+        {
+        case DirectChunkFilter::Type::Shuffle:
+            if (filter.parameter > 1)
+            {
+                chunk = shuffle(chunk, filter.parameter);
+            }
+            break;
+        case DirectChunkFilter::Type::Deflate:
+#if openPMD_HAVE_ZLIB
+            chunk = deflate(chunk, static_cast<int>(filter.parameter));
+            break;
+#else
+            throw std::runtime_error(
+                "[HDF5] Internal error: Deflate filter requires zlib.");
+#endif
+        }
+    }
+    return chunk;
+}
+
+std::vector<char> decodeChunk(
+    std::vector<DirectChunkFilter> const &filters,
+    uint32_t filterMask,
+    std::vector<char> chunk,
+    size_t rawSize)
+{
+    for (size_t i = filters.size(); i-- > 0;)
+    {
+        if (filterMask & (1u << i))
+        {
+            // filter was skipped when writing the chunk
+            continue;
+        }
+        auto const &filter = filters[i];
+        switch (filter.type)
+        {
+        case DirectChunkFilter::Type::Shuffle:
+            if (filter.parameter > 1)
+            {
+                chunk = unshuffle(chunk, filter.parameter);
+            }
+            break;
+        case DirectChunkFilter::Type::Deflate:
+#if openPMD_HAVE_ZLIB
+            chunk = inflate(chunk, rawSize);
+            break;
+#else
+            throw std::runtime_error(
+                "[HDF5] Internal error: Deflate filter requires zlib.");
+#endif
+        }
+    }
+    if (chunk.size() != rawSize)
+    {
+        throw std::runtime_error(
+            "[HDF5] Chunk has unexpected size after decoding.");
+    }
+    return chunk;
+}
+
+namespace
+{
+    /*
+     * Call copy(blockPosition, chunkPosition, bytes) for every row in the
+     * fastest varying dimension of the intersection of chunk and block,
+     * positions are in bytes.
+     */
+    template <typename Copy>
+    void forEachRow(
+        std::vector<hsize_t> const &blockExtent,
+        std::vector<hsize_t> const &chunkExtent,
+        std::vector<hsize_t> const &chunkOffset,
+        size_t elementSize,
+        Copy &&copy)
+    {
+        size_t const ndim = blockExtent.size();
+        std::vector<hsize_t> valid(ndim);
+        for (size_t d = 0; d < ndim; ++d)
+        {
+            if (chunkOffset[d] >= blockExtent[d])
+            {
+                return;
+            }
+            valid[d] =
+                std::min(chunkExtent[d], blockExtent[d] - chunkOffset[d]);
+        }
+        size_t const rowBytes = valid[ndim - 1] * elementSize;
+        std::vector<hsize_t> index(ndim, 0);
+        while (true)
+        {
+            size_t blockPosition = 0;
+            size_t chunkPosition = 0;
+            for (size_t d = 0; d < ndim; ++d)
+            {
+                blockPosition =
+                    blockPosition * blockExtent[d] + chunkOffset[d] + index[d];
+                chunkPosition = chunkPosition * chunkExtent[d] + index[d];
+            }
+            copy(
+                blockPosition * elementSize,
+                chunkPosition * elementSize,
+                rowBytes);
+
+            // next row
+            size_t d = ndim - 1;
+            while (d > 0)
+            {
+                --d;
+                if (++index[d] < valid[d])
+                {
+                    break;
+                }
+                index[d] = 0;
+                if (d == 0)
+                {
+                    return;
+                }
+            }
+            if (ndim == 1)
+            {
+                return;
+            }
+        }
+    }
+} // namespace
+
+void copyBlockToChunk(
+    char const *block,
+    std::vector<hsize_t> const &blockExtent,
+    char *chunk,
+    std::vector<hsize_t> const &chunkExtent,
+    std::vector<hsize_t> const &chunkOffset,
+    size_t elementSize)
+{
+    forEachRow(
+        blockExtent,
+        chunkExtent,
+        chunkOffset,
+        elementSize,
+        [block, chunk](size_t blockPosition, size_t chunkPosition, size_t n) {
+            std::memcpy(chunk + chunkPosition, block + blockPosition, n);
+        });
+}
+
+void copyChunkToBlock(
+    char const *chunk,
+    std::vector<hsize_t> const &chunkExtent,
+    std::vector<hsize_t> const &chunkOffset,
+    char *block,
+    std::vector<hsize_t> const &blockExtent,
+    size_t elementSize)
+{
+    forEachRow(
+        blockExtent,
+        chunkExtent,
+        chunkOffset,
+        elementSize,
+        [block, chunk](size_t blockPosition, size_t chunkPosition, size_t n) {
+            std::memcpy(block + blockPosition, chunk + chunkPosition, n);
+        });
+}
+} // namespace openPMD::detail
+#endif
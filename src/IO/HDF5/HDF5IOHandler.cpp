@@ -20,6 +20,7 @@
  */
 #include "openPMD/IO/HDF5/HDF5IOHandler.hpp"
 #include "openPMD/IO/HDF5/HDF5IOHandlerImpl.hpp"
+#include "openPMD/auxiliary/DerefDynamicCast.hpp"
 #include "openPMD/auxiliary/Environment.hpp"
 
 #if openPMD_HAVE_HDF5
@@ -34,15 +35,25 @@
 #include "openPMD/backend/Attribute.hpp"
 
 #include <hdf5.h>
+
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
 #endif
 
+#include <algorithm>
 #include <complex>
 #include <cstring>
+#include <exception>
 #include <future>
 #include <iostream>
+#include <map>
+#include <memory>
 #include <stack>
 #include <string>
-#include <typeinfo>
+#include <thread>
 #include <unordered_map>
 #include <utility>
 #include <vector>
@@ -64,17 +75,85 @@ namespace openPMD
     } while (0)
 #endif
 
+namespace
+{
+    hsize_t numberOfElements(Extent const &extent)
+    {
+        hsize_t res = 1;
+        for (auto val : extent)
+        {
+            res *= val;
+        }
+        return res;
+    }
+
+    std::vector<hsize_t> datasetExtent(hid_t dataset_id)
+    {
+        hid_t dataspace = H5Dget_space(dataset_id);
+        VERIFY(
+            dataspace >= 0,
+            "[HDF5] Internal error: Failed to get dataset space during "
+            "dataset access");
+        int const ndims = H5Sget_simple_extent_ndims(dataspace);
+        std::vector<hsize_t> dims(std::max(ndims, 0));
+        H5Sget_simple_extent_dims(dataspace, dims.data(), nullptr);
+        H5Sclose(dataspace);
+        return dims;
+    }
+
+    /*
+     * Map a byte range of a file into memory, read-only.
+     * Returns a null pointer if that fails or is not supported.
+     */
+    std::shared_ptr<void const>
+    mapFileRange(std::string const &path, size_t offset, size_t size)
+    {
+#ifndef _WIN32
+        int fd = open(path.c_str(), O_RDONLY);
+        if (fd < 0)
+        {
+            return nullptr;
+        }
+        // the mapping must start at a page boundary
+        size_t const pageSize = static_cast<size_t>(sysconf(_SC_PAGESIZE));
+        size_t const pageOffset = offset % pageSize;
+        size_t const mapSize = size + pageOffset;
+        void *base = mmap(
+            nullptr,
+            mapSize,
+            PROT_READ,
+            MAP_SHARED,
+            fd,
+            static_cast<off_t>(offset - pageOffset));
+        // the mapping stays valid after closing the file descriptor
+        close(fd);
+        if (base == MAP_FAILED)
+        {
+            return nullptr;
+        }
+        return std::shared_ptr<void const>(
+            static_cast<char const *>(base) + pageOffset,
+            [base, mapSize](void const *) { munmap(base, mapSize); });
+#else
+        (void)path;
+        (void)offset;
+        (void)size;
+        return nullptr;
+#endif
+    }
+} // namespace
+
 HDF5IOHandlerImpl::HDF5IOHandlerImpl(
     AbstractIOHandler *handler, json::TracingJSON config)
     : AbstractIOHandlerImpl(handler)
     , m_datasetTransferProperty{H5P_DEFAULT}
     , m_fileAccessProperty{H5P_DEFAULT}
-    , m_H5T_BOOL_ENUM{H5Tenum_create(H5T_NATIVE_INT8)}
-    , m_H5T_CFLOAT{H5Tcreate(H5T_COMPOUND, sizeof(float) * 2)}
-    , m_H5T_CDOUBLE{H5Tcreate(H5T_COMPOUND, sizeof(double) * 2)}
-    , m_H5T_CLONG_DOUBLE{H5Tcreate(H5T_COMPOUND, sizeof(long double) * 2)}
+    , m_fileCreateProperty{H5P_DEFAULT}
 {
+    std::lock_guard<HDF5Lock> lock(hdf5Lock());
+
     // create a h5py compatible bool type
+    m_H5T_BOOL_ENUM = H5Tenum_create(H5T_NATIVE_INT8);
     VERIFY(
         m_H5T_BOOL_ENUM >= 0,
         "[HDF5] Internal error: Failed to create bool enum");
@@ -91,6 +170,9 @@ HDF5IOHandlerImpl::HDF5IOHandlerImpl(
         status == 0, "[HDF5] Internal error: Failed to insert into HDF5 enum");
 
     // create h5py compatible complex types
+    m_H5T_CFLOAT = H5Tcreate(H5T_COMPOUND, sizeof(float) * 2);
+    m_H5T_CDOUBLE = H5Tcreate(H5T_COMPOUND, sizeof(double) * 2);
+    m_H5T_CLONG_DOUBLE = H5Tcreate(H5T_COMPOUND, sizeof(long double) * 2);
     VERIFY(
         m_H5T_CFLOAT >= 0,
         "[HDF5] Internal error: Failed to create complex float");
@@ -106,8 +188,25 @@ HDF5IOHandlerImpl::HDF5IOHandlerImpl(
     H5Tinsert(m_H5T_CDOUBLE, "i", sizeof(double), H5T_NATIVE_DOUBLE);
     H5Tinsert(m_H5T_CLONG_DOUBLE, "r", 0, H5T_NATIVE_LDOUBLE);
     H5Tinsert(m_H5T_CLONG_DOUBLE, "i", sizeof(long double), H5T_NATIVE_LDOUBLE);
+    m_getH5DataType = GetH5DataType(
+        m_H5T_BOOL_ENUM, m_H5T_CFLOAT, m_H5T_CDOUBLE, m_H5T_CLONG_DOUBLE);
 
-    m_chunks = auxiliary::getEnvString("OPENPMD_HDF5_CHUNKS", "auto");
+    auto const envChunks =
+        auxiliary::getEnvString("OPENPMD_HDF5_CHUNKS", "auto");
+    if (envChunks == "none")
+    {
+        m_globalDatasetConfig.chunking = ChunkingStrategy::None;
+    }
+    else if (envChunks == "store_chunk")
+    {
+        m_globalDatasetConfig.chunking = ChunkingStrategy::StoreChunk;
+    }
+    else if (envChunks != "auto")
+    {
+        std::cerr << "Warning: HDF5 chunking option set to an invalid "
+                     "value '"
+                  << envChunks << "'. Reset to 'auto'." << std::endl;
+    }
     // JSON option can overwrite env option:
     if (config.json().contains("hdf5"))
     {
@@ -117,28 +216,89 @@ HDF5IOHandlerImpl::HDF5IOHandlerImpl(
         if (m_config.json().contains("dataset"))
         {
             auto datasetConfig = m_config["dataset"];
-            if (datasetConfig.json().contains("chunks"))
+            parseDatasetConfig(datasetConfig, m_globalDatasetConfig);
+        }
+
+        if (m_config.json().contains("coalesce_writes"))
+        {
+            auto const &coalesceWrites = m_config["coalesce_writes"].json();
+            if (!coalesceWrites.is_boolean())
             {
-                auto maybeChunks = json::asLowerCaseStringDynamic(
-                    datasetConfig["chunks"].json());
-                if (maybeChunks.has_value())
-                {
-                    m_chunks = std::move(maybeChunks.value());
-                }
-                else
-                {
-                    throw error::BackendConfigSchema(
-                        {"hdf5", "dataset", "chunks"},
-                        "Must be convertible to string type.");
-                }
+                throw error::BackendConfigSchema(
+                    {"hdf5", "coalesce_writes"}, "Must be a boolean.");
+            }
+            m_coalesceWrites = coalesceWrites.get<bool>();
+        }
+
+        if (m_config.json().contains("direct_chunk_io"))
+        {
+            auto const &directChunkIO = m_config["direct_chunk_io"].json();
+            if (!directChunkIO.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "direct_chunk_io"}, "Must be a boolean.");
+            }
+            m_directChunkIO = directChunkIO.get<bool>();
+        }
+
+        if (m_config.json().contains("direct_chunk_threads"))
+        {
+            auto const &threads = m_config["direct_chunk_threads"].json();
+            if (!threads.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "direct_chunk_threads"},
+                    "Must be a non-negative integer (number of threads).");
+            }
+            m_directChunkThreads = threads.get<unsigned>();
+        }
+
+        if (m_config.json().contains("async_write"))
+        {
+            auto const &asyncWrite = m_config["async_write"].json();
+            if (!asyncWrite.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "async_write"}, "Must be a boolean.");
+            }
+            m_asyncWrite = asyncWrite.get<bool>();
+        }
+
+        if (m_config.json().contains("use_span_based_put"))
+        {
+            auto const &useSpan = m_config["use_span_based_put"].json();
+            if (!useSpan.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "use_span_based_put"}, "Must be a boolean.");
+            }
+            m_useSpanBasedPut = useSpan.get<bool>();
+        }
+
+        if (m_config.json().contains("dataset_handle_cache"))
+        {
+            auto const &cacheSize = m_config["dataset_handle_cache"].json();
+            if (!cacheSize.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset_handle_cache"},
+                    "Must be a non-negative integer (number of handles).");
             }
+            m_datasetHandleCacheSize = cacheSize.get<size_t>();
+        }
+
+        if (m_config.json().contains("mpi_info"))
+        {
+            auto mpiInfo = m_config["mpi_info"];
+            parseMPIHints(mpiInfo.json(), m_mpiHints);
+            mpiInfo.declareFullyRead();
         }
-        if (m_chunks != "auto" && m_chunks != "none")
+
+        // check for file access configs
+        if (m_config.json().contains("file"))
         {
-            std::cerr << "Warning: HDF5 chunking option set to an invalid "
-                         "value '"
-                      << m_chunks << "'. Reset to 'auto'." << std::endl;
-            m_chunks = "auto";
+            auto fileConfig = m_config["file"];
+            parseFileConfig(fileConfig, m_fileConfig);
         }
 
         // unused params
@@ -163,6 +323,25 @@ HDF5IOHandlerImpl::HDF5IOHandlerImpl(
         }
     }
 
+    if (!m_fileConfig.empty())
+    {
+        m_fileAccessProperty = H5Pcreate(H5P_FILE_ACCESS);
+        VERIFY(
+            m_fileAccessProperty >= 0,
+            "[HDF5] Internal error: Failed to create HDF5 file access "
+            "property");
+        setFileAccessProperties(m_fileAccessProperty);
+    }
+    if (m_fileConfig.fileSpace.has_value())
+    {
+        m_fileCreateProperty = H5Pcreate(H5P_FILE_CREATE);
+        VERIFY(
+            m_fileCreateProperty >= 0,
+            "[HDF5] Internal error: Failed to create HDF5 file creation "
+            "property");
+        setFileCreationProperties(m_fileCreateProperty);
+    }
+
 #if H5_VERSION_GE(1, 10, 0) && openPMD_HAVE_MPI
     auto const hdf5_collective_metadata =
         auxiliary::getEnvString("OPENPMD_HDF5_COLLECTIVE_METADATA", "ON");
@@ -175,6 +354,18 @@ HDF5IOHandlerImpl::HDF5IOHandlerImpl(
 
 HDF5IOHandlerImpl::~HDF5IOHandlerImpl()
 {
+    // waits for the background writes of the last flush
+    std::lock_guard<HDF5Lock> lock(hdf5Lock());
+    try
+    {
+        finishAsyncWrites();
+    }
+    catch (std::exception const &e)
+    {
+        std::cerr << "[HDF5] Asynchronous dataset write failed: " << e.what()
+                  << '\n';
+    }
+    closeDatasets();
     herr_t status;
     status = H5Tclose(m_H5T_BOOL_ENUM);
     if (status < 0)
@@ -201,9 +392,16 @@ HDF5IOHandlerImpl::~HDF5IOHandlerImpl()
                          "(serial)\n";
         m_openFileIDs.erase(file);
     }
-    if (m_datasetTransferProperty != H5P_DEFAULT)
+    for (hid_t transferProperty :
+         {m_datasetTransferProperty,
+          m_collectiveTransferProperty,
+          m_independentTransferProperty})
     {
-        status = H5Pclose(m_datasetTransferProperty);
+        if (transferProperty == H5P_DEFAULT)
+        {
+            continue;
+        }
+        status = H5Pclose(transferProperty);
         if (status < 0)
             std::cerr << "[HDF5] Internal error: Failed to close HDF5 dataset "
                          "transfer property\n";
@@ -215,6 +413,64 @@ HDF5IOHandlerImpl::~HDF5IOHandlerImpl()
             std::cerr << "[HDF5] Internal error: Failed to close HDF5 file "
                          "access property\n";
     }
+    if (m_fileCreateProperty != H5P_DEFAULT)
+    {
+        status = H5Pclose(m_fileCreateProperty);
+        if (status < 0)
+            std::cerr << "[HDF5] Internal error: Failed to close HDF5 file "
+                         "creation property\n";
+    }
+}
+
+std::future<void>
+HDF5IOHandlerImpl::flush(internal::ParsedFlushParams &flushParams)
+{
+    // waits for the background writes of the last flush
+    std::unique_lock<HDF5Lock> lock(hdf5Lock());
+    finishAsyncWrites();
+    m_flushTransferMode.reset();
+    if (flushParams.backendConfig.json().contains("hdf5"))
+    {
+        auto hdf5Config = flushParams.backendConfig["hdf5"];
+        if (hdf5Config.json().contains("dataset") &&
+            hdf5Config["dataset"].json().contains("transfer"))
+        {
+            m_flushTransferMode = parseTransferMode(
+                hdf5Config["dataset"]["transfer"].json(),
+                {"hdf5", "dataset", "transfer"});
+        }
+
+        if (auto shadow = hdf5Config.invertShadow(); shadow.size() > 0)
+        {
+            switch (hdf5Config.originallySpecifiedAs)
+            {
+            case json::SupportedLanguages::JSON:
+                std::cerr << "Warning: parts of the flush configuration for "
+                             "HDF5 remain unused:\n"
+                          << shadow << std::endl;
+                break;
+            case json::SupportedLanguages::TOML: {
+                auto asToml = json::jsonToToml(shadow);
+                std::cerr << "Warning: parts of the flush configuration for "
+                             "HDF5 remain unused:\n"
+                          << asToml << std::endl;
+                break;
+            }
+            }
+        }
+    }
+    if (flushParams.flushLevel == FlushLevel::UserFlush)
+    {
+        // span buffers may only be consumed at flush points
+        writeSpanBuffers();
+    }
+    auto res = AbstractIOHandlerImpl::flush();
+    m_flushTransferMode.reset();
+    if (!m_asyncWrites.empty())
+    {
+        return startAsyncWrites(std::move(lock));
+    }
+    return res;
 }
 
 void HDF5IOHandlerImpl::createFile(
@@ -267,12 +523,26 @@ void HDF5IOHandlerImpl::createFile(
         hid_t id{};
         if (flags == H5F_ACC_RDWR)
         {
-            id = H5Fopen(name.c_str(), flags, m_fileAccessProperty);
+            id = openH5File(name, flags);
+        }
+        else if (usePageBuffer())
+        {
+            // m_fileCreateProperty uses the paged file space strategy then
+            hid_t fapl = pageBufferedFileAccessProperty();
+            id = H5Fcreate(name.c_str(), flags, m_fileCreateProperty, fapl);
+            herr_t status = H5Pclose(fapl);
+            VERIFY(
+                status >= 0,
+                "[HDF5] Internal error: Failed to close HDF5 file access "
+                "property");
         }
         else
         {
             id = H5Fcreate(
-                name.c_str(), flags, H5P_DEFAULT, m_fileAccessProperty);
+                name.c_str(),
+                flags,
+                m_fileCreateProperty,
+                m_fileAccessProperty);
         }
         VERIFY(id >= 0, "[HDF5] Internal error: Failed to create HDF5 file");
 
@@ -431,6 +701,9 @@ void HDF5IOHandlerImpl::createDataset(
         json::TracingJSON config =
             json::parseOptions(parameters.options, /* considerFiles = */ false);
 
+        // a dataset may be recreated in APPEND mode, drop stale handles
+        closeDataset(writable);
+
         // general
         bool is_resizable_dataset = false;
         if (config.json().contains("resizable"))
@@ -439,15 +712,12 @@ void HDF5IOHandlerImpl::createDataset(
         }
 
         // HDF5 specific
+        DatasetConfig datasetConfig = m_globalDatasetConfig;
         if (config.json().contains("hdf5") &&
             config["hdf5"].json().contains("dataset"))
         {
-            json::TracingJSON datasetConfig{config["hdf5"]["dataset"]};
-
-            /*
-             * @todo Read more options from config here.
-             */
-            (void)datasetConfig;
+            json::TracingJSON datasetConfigJson{config["hdf5"]["dataset"]};
+            parseDatasetConfig(datasetConfigJson, datasetConfig);
         }
         parameters.warnUnusedParameters(
             config,
@@ -513,8 +783,6 @@ void HDF5IOHandlerImpl::createDataset(
             d = Datatype::BOOL;
         }
 
-        Attribute a(0);
-        a.dtype = d;
         std::vector<hsize_t> dims;
         std::uint64_t num_elements = 1u;
         for (auto const &val : parameters.extent)
@@ -539,17 +807,24 @@ void HDF5IOHandlerImpl::createDataset(
 
         H5Pset_fill_time(datasetCreationProperty, H5D_FILL_TIME_NEVER);
 
-        if (num_elements != 0u && m_chunks != "none")
+        if (num_elements != 0u && !datasetConfig.filters.empty() &&
+            datasetConfig.chunking == ChunkingStrategy::None)
+        {
+            std::cerr << "Warning: HDF5 filters require chunking, will use "
+                         "the 'auto' chunking heuristic for dataset '"
+                      << name << "'." << std::endl;
+            datasetConfig.chunking = ChunkingStrategy::Auto;
+        }
+        if (num_elements != 0u &&
+            datasetConfig.chunking != ChunkingStrategy::None)
         {
-            //! @todo add per dataset chunk control from JSON config
-
             // get chunking dimensions
-            std::vector<hsize_t> chunk_dims =
-                getOptimalChunkDims(dims, toBytes(d));
-
-            //! @todo allow overwrite with user-provided chunk size
-            // for( auto const& val : parameters.chunkSize )
-            //    chunk_dims.push_back(static_cast< hsize_t >(val));
+            std::vector<hsize_t> chunk_dims = getChunkDims(
+                writable,
+                datasetConfig,
+                dims,
+                toBytes(d),
+                is_resizable_dataset);
 
             herr_t status = H5Pset_chunk(
                 datasetCreationProperty, chunk_dims.size(), chunk_dims.data());
@@ -557,42 +832,41 @@ void HDF5IOHandlerImpl::createDataset(
                 status == 0,
                 "[HDF5] Internal error: Failed to set chunk size during "
                 "dataset creation");
+
+            for (auto const &filter : datasetConfig.filters)
+            {
+                if (H5Zfilter_avail(filter.id) <= 0)
+                {
+                    std::cerr << "Warning: HDF5 filter with ID " << filter.id
+                              << " is not available, dataset '" << name
+                              << "' will be written without it." << std::endl;
+                    continue;
+                }
+                status = H5Pset_filter(
+                    datasetCreationProperty,
+                    filter.id,
+                    filter.flags,
+                    filter.cdValues.size(),
+                    filter.cdValues.data());
+                VERIFY(
+                    status == 0,
+                    "[HDF5] Internal error: Failed to set filter during "
+                    "dataset creation");
+            }
         }
 
-        std::string const &compression = ""; // @todo read from JSON
-        if (!compression.empty())
-            std::cerr
-                << "[HDF5] Compression not yet implemented in HDF5 backend."
-                << std::endl;
-        /*
+        if (datasetConfig.chunkCache.has_value())
         {
-            std::vector< std::string > args = auxiliary::split(compression,
-        ":"); std::string const& format = args[0]; if( (format == "zlib" ||
-        format == "gzip" || format == "deflate")
-                && args.size() == 2 )
-            {
-                status = H5Pset_deflate(datasetCreationProperty,
-        std::stoi(args[1])); VERIFY(status == 0, "[HDF5] Internal error: Failed
-        to set deflate compression during dataset creation"); } else if( format
-        == "szip" || format == "nbit" || format == "scaleoffset" ) std::cerr <<
-        "[HDF5] Compression format " << format
-                          << " not yet implemented. Data will not be
-        compressed!"
-                          << std::endl;
-            else
-                std::cerr << "[HDF5] Compression format " << format
-                          << " unknown. Data will not be compressed!"
-                          << std::endl;
+            m_datasetChunkCaches[writable] = *datasetConfig.chunkCache;
         }
-         */
+        if (datasetConfig.transfer.has_value())
+        {
+            m_datasetTransferModes[writable] = *datasetConfig.transfer;
+        }
+        m_directChunkLayouts.erase(writable);
+        hid_t datasetAccessProperty = this->datasetAccessProperty(writable);
 
-        GetH5DataType getH5DataType({
-            {typeid(bool).name(), m_H5T_BOOL_ENUM},
-            {typeid(std::complex<float>).name(), m_H5T_CFLOAT},
-            {typeid(std::complex<double>).name(), m_H5T_CDOUBLE},
-            {typeid(std::complex<long double>).name(), m_H5T_CLONG_DOUBLE},
-        });
-        hid_t datatype = getH5DataType(a);
+        hid_t datatype = m_getH5DataType.native(d);
         VERIFY(
             datatype >= 0,
             "[HDF5] Internal error: Failed to get HDF5 datatype during dataset "
@@ -604,7 +878,7 @@ void HDF5IOHandlerImpl::createDataset(
             space,
             H5P_DEFAULT,
             datasetCreationProperty,
-            H5P_DEFAULT);
+            datasetAccessProperty);
         VERIFY(
             group_id >= 0,
             "[HDF5] Internal error: Failed to create HDF5 group during dataset "
@@ -616,16 +890,19 @@ void HDF5IOHandlerImpl::createDataset(
             status == 0,
             "[HDF5] Internal error: Failed to close HDF5 dataset during "
             "dataset creation");
-        status = H5Tclose(datatype);
-        VERIFY(
-            status == 0,
-            "[HDF5] Internal error: Failed to close HDF5 datatype during "
-            "dataset creation");
         status = H5Pclose(datasetCreationProperty);
         VERIFY(
             status == 0,
             "[HDF5] Internal error: Failed to close HDF5 dataset creation "
             "property during dataset creation");
+        if (datasetAccessProperty != H5P_DEFAULT)
+        {
+            status = H5Pclose(datasetAccessProperty);
+            VERIFY(
+                status == 0,
+                "[HDF5] Internal error: Failed to close HDF5 dataset access "
+                "property during dataset creation");
+        }
         status = H5Sclose(space);
         VERIFY(
             status == 0,
@@ -653,6 +930,7 @@ void HDF5IOHandlerImpl::createDataset(
 void HDF5IOHandlerImpl::extendDataset(
     Writable *writable, Parameter<Operation::EXTEND_DATASET> const &parameters)
 {
+    finishAsyncWrites();
     if (access::readOnly(m_handler->m_backendAccess))
         throw std::runtime_error(
             "[HDF5] Extending a dataset in a file opened as read only is not "
@@ -665,10 +943,7 @@ void HDF5IOHandlerImpl::extendDataset(
     auto res = getFile(writable);
     if (!res)
         res = getFile(writable->parent);
-    hid_t dataset_id = H5Dopen(
-        res.value().id,
-        concrete_h5_file_position(writable).c_str(),
-        H5P_DEFAULT);
+    hid_t dataset_id = acquireDataset(writable, res.value());
     VERIFY(
         dataset_id >= 0,
         "[HDF5] Internal error: Failed to open HDF5 dataset during dataset "
@@ -706,16 +981,13 @@ void HDF5IOHandlerImpl::extendDataset(
         "[HDF5] Internal error: Failed to extend HDF5 dataset during dataset "
         "extension");
 
-    status = H5Dclose(dataset_id);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close HDF5 dataset during dataset "
-        "extension");
+    releaseDataset(dataset_id);
 }
 
 void HDF5IOHandlerImpl::availableChunks(
     Writable *writable, Parameter<Operation::AVAILABLE_CHUNKS> &parameters)
 {
+    finishAsyncWrites();
     auto fname = m_fileNames.find(writable);
     VERIFY(
         fname != m_fileNames.end(), "[HDF5] File name not found in writable");
@@ -821,7 +1093,7 @@ void HDF5IOHandlerImpl::openFile(
         flags = H5F_ACC_RDWR;
 
     hid_t file_id;
-    file_id = H5Fopen(name.c_str(), flags, m_fileAccessProperty);
+    file_id = openH5File(name, flags);
     if (file_id < 0)
         throw error::ReadError(
             error::AffectedObject::File,
@@ -848,6 +1120,9 @@ void HDF5IOHandlerImpl::closeFile(
             "present in the backend");
     }
     File file = optionalFile.value();
+    writeSpanBuffers(file.name);
+    finishAsyncWrites();
+    closeDatasets(file.id);
     H5Fclose(file.id);
     m_openFileIDs.erase(file.id);
     m_fileNames.erase(writable);
@@ -1079,13 +1354,17 @@ void HDF5IOHandlerImpl::openDataset(
 void HDF5IOHandlerImpl::deleteFile(
     Writable *writable, Parameter<Operation::DELETE_FILE> const &parameters)
 {
+    finishAsyncWrites();
     if (access::readOnly(m_handler->m_backendAccess))
         throw std::runtime_error(
             "[HDF5] Deleting a file opened as read only is not possible.");
 
     if (writable->written)
     {
-        hid_t file_id = getFile(writable).value().id;
+        File file = getFile(writable).value();
+        hid_t file_id = file.id;
+        discardSpanBuffers(file.name);
+        closeDatasets(file_id);
         herr_t status = H5Fclose(file_id);
         VERIFY(
             status == 0,
@@ -1113,6 +1392,7 @@ void HDF5IOHandlerImpl::deleteFile(
 void HDF5IOHandlerImpl::deletePath(
     Writable *writable, Parameter<Operation::DELETE_PATH> const &parameters)
 {
+    finishAsyncWrites();
     if (access::readOnly(m_handler->m_backendAccess))
         throw std::runtime_error(
             "[HDF5] Deleting a path in a file opened as read only is not "
@@ -1133,6 +1413,9 @@ void HDF5IOHandlerImpl::deletePath(
          */
         auto res = getFile(writable);
         File file = res ? res.value() : getFile(writable->parent).value();
+        // datasets within the deleted path might be cached
+        closeDatasets(file.id);
+        discardSpanBuffers(writable);
         hid_t node_id = H5Gopen(
             file.id,
             concrete_h5_file_position(writable->parent).c_str(),
@@ -1165,6 +1448,7 @@ void HDF5IOHandlerImpl::deletePath(
 void HDF5IOHandlerImpl::deleteDataset(
     Writable *writable, Parameter<Operation::DELETE_DATASET> const &parameters)
 {
+    finishAsyncWrites();
     if (access::readOnly(m_handler->m_backendAccess))
         throw std::runtime_error(
             "[HDF5] Deleting a path in a file opened as read only is not "
@@ -1185,6 +1469,8 @@ void HDF5IOHandlerImpl::deleteDataset(
          */
         auto res = getFile(writable);
         File file = res ? res.value() : getFile(writable->parent).value();
+        closeDataset(writable);
+        discardSpanBuffers(writable);
         hid_t node_id = H5Gopen(
             file.id,
             concrete_h5_file_position(writable->parent).c_str(),
@@ -1211,6 +1497,10 @@ void HDF5IOHandlerImpl::deleteDataset(
         writable->abstractFilePosition.reset();
 
         m_fileNames.erase(writable);
+        m_datasetChunkCaches.erase(writable);
+        m_datasetTransferModes.erase(writable);
+        m_directChunkLayouts.erase(writable);
+        closeDataset(writable);
     }
 }
 
@@ -1257,59 +1547,125 @@ void HDF5IOHandlerImpl::writeDataset(
             "[HDF5] Writing into a dataset in a file opened as read only is "
             "not possible.");
 
+    if (!parameters.data.get())
+    {
+        // already written as part of a coalesced write, see below
+        return;
+    }
+
     auto res = getFile(writable);
     File file = res ? res.value() : getFile(writable->parent).value();
 
     hid_t dataset_id, filespace, memspace;
     herr_t status;
-    dataset_id = H5Dopen(
-        file.id, concrete_h5_file_position(writable).c_str(), H5P_DEFAULT);
+    dataset_id = acquireDataset(writable, file);
     VERIFY(
         dataset_id >= 0,
         "[HDF5] Internal error: Failed to open HDF5 dataset during dataset "
         "write");
 
+    if (directChunkIO())
+    {
+        // direct chunk writes must not overtake queued writes
+        finishAsyncWrites();
+        if (writeDirectChunks(writable, dataset_id, parameters))
+        {
+            releaseDataset(dataset_id);
+            m_fileNames[writable] = file.name;
+            return;
+        }
+    }
+
+    /*
+     * Merge upcoming writes to the same dataset into a single multi-block
+     * selection, issuing one H5Dwrite() instead of many.
+     */
+    std::vector<Parameter<Operation::WRITE_DATASET> *> writes{&parameters};
+    if (coalesceWrites())
+    {
+        collectCoalescableWrites(writable, writes);
+    }
+
+    filespace = H5Dget_space(dataset_id);
     std::vector<hsize_t> start;
-    for (auto const &val : parameters.offset)
-        start.push_back(static_cast<hsize_t>(val));
-    std::vector<hsize_t> stride(start.size(), 1); /* contiguous region */
-    std::vector<hsize_t> count(start.size(), 1); /* single region */
     std::vector<hsize_t> block;
-    for (auto const &val : parameters.extent)
-        block.push_back(static_cast<hsize_t>(val));
-    memspace =
-        H5Screate_simple(static_cast<int>(block.size()), block.data(), nullptr);
-    filespace = H5Dget_space(dataset_id);
-    status = H5Sselect_hyperslab(
-        filespace,
-        H5S_SELECT_SET,
-        start.data(),
-        stride.data(),
-        count.data(),
-        block.data());
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to select hyperslab during dataset "
-        "write");
+    H5S_seloper_t selectOperation = H5S_SELECT_SET;
+    auto selectBlock = [&]() {
+        std::vector<hsize_t> stride(start.size(), 1); /* contiguous region */
+        std::vector<hsize_t> count(start.size(), 1); /* single region */
+        status = H5Sselect_hyperslab(
+            filespace,
+            selectOperation,
+            start.data(),
+            stride.data(),
+            count.data(),
+            block.data());
+        VERIFY(
+            status == 0,
+            "[HDF5] Internal error: Failed to select hyperslab during dataset "
+            "write");
+        selectOperation = H5S_SELECT_OR;
+    };
+    for (auto const *write : writes)
+    {
+        if (!block.empty() && write->offset[0] == start[0] + block[0])
+        {
+            // adjacent blocks are selected as one
+            block[0] += write->extent[0];
+            continue;
+        }
+        if (!block.empty())
+        {
+            selectBlock();
+        }
+        start.assign(write->offset.begin(), write->offset.end());
+        block.assign(write->extent.begin(), write->extent.end());
+    }
+    selectBlock();
 
     void const *data = parameters.data.get();
-
-    GetH5DataType getH5DataType({
-        {typeid(bool).name(), m_H5T_BOOL_ENUM},
-        {typeid(std::complex<float>).name(), m_H5T_CFLOAT},
-        {typeid(std::complex<double>).name(), m_H5T_CDOUBLE},
-        {typeid(std::complex<long double>).name(), m_H5T_CLONG_DOUBLE},
-    });
+    std::unique_ptr<char[]> coalescedData;
+    if (writes.size() == 1)
+    {
+        memspace = H5Screate_simple(
+            static_cast<int>(block.size()), block.data(), nullptr);
+    }
+    else
+    {
+        /*
+         * The blocks are disjoint in the slowest varying dimension and equal
+         * in all others, so the selection's elements in row-major order are
+         * the blocks' data concatenated in the order of their offsets.
+         */
+        size_t const elementSize = toBytes(parameters.dtype);
+        hsize_t numElements = 0;
+        for (auto const *write : writes)
+        {
+            numElements += numberOfElements(write->extent);
+        }
+        coalescedData.reset(new char[numElements * elementSize]);
+        char *dest = coalescedData.get();
+        for (auto const *write : writes)
+        {
+            size_t const bytes = numberOfElements(write->extent) * elementSize;
+            std::memcpy(dest, write->data.get(), bytes);
+            dest += bytes;
+        }
+        data = coalescedData.get();
+        memspace = H5Screate_simple(1, &numElements, nullptr);
+    }
+    VERIFY(
+        memspace >= 0,
+        "[HDF5] Internal error: Failed to create memory space during dataset "
+        "write");
 
     // TODO Check if parameter dtype and dataset dtype match
-    Attribute a(0);
-    a.dtype = parameters.dtype;
-    hid_t dataType = getH5DataType(a);
+    hid_t dataType = m_getH5DataType.native(parameters.dtype);
     VERIFY(
         dataType >= 0,
         "[HDF5] Internal error: Failed to get HDF5 datatype during dataset "
         "write");
-    switch (a.dtype)
+    switch (parameters.dtype)
     {
         using DT = Datatype;
     case DT::LONG_DOUBLE:
@@ -1330,28 +1686,85 @@ void HDF5IOHandlerImpl::writeDataset(
     case DT::UCHAR:
     case DT::SCHAR:
     case DT::BOOL:
+        if (asyncWrite())
+        {
+            /*
+             * Issued by a background thread after the flush, see
+             * startAsyncWrites(). The write takes over the dataspaces and a
+             * reference to the dataset, and keeps the data alive: coalesced
+             * and unique_ptr buffers are taken over, all others are copied
+             * since the caller may reuse them after the flush.
+             */
+            std::shared_ptr<void const> buffer;
+            if (coalescedData)
+            {
+                buffer = std::shared_ptr<char const[]>(
+                    coalescedData.release(),
+                    [](char const *ptr) { delete[] ptr; });
+            }
+            else if (
+                auto uniquePtr = std::get_if<UniquePtrWithLambda<void> >(
+                    &parameters.data.m_buffer))
+            {
+                buffer = std::shared_ptr<void const>(std::move(*uniquePtr));
+            }
+            else
+            {
+                size_t const bytes = numberOfElements(parameters.extent) *
+                    toBytes(parameters.dtype);
+                auto copy = std::shared_ptr<char[]>(
+                    new char[bytes], [](char *ptr) { delete[] ptr; });
+                std::memcpy(copy.get(), data, bytes);
+                buffer = std::move(copy);
+            }
+            VERIFY(
+                H5Iinc_ref(dataset_id) >= 0,
+                "[HDF5] Internal error: Failed to reference HDF5 dataset "
+                "during dataset write");
+            m_asyncWrites.push_back(AsyncWrite{
+                dataset_id,
+                dataType,
+                memspace,
+                filespace,
+                datasetTransferProperty(writable),
+                std::move(buffer),
+                concrete_h5_file_position(writable)});
+            for (auto *write : writes)
+            {
+                if (write != &parameters)
+                {
+                    write->data = auxiliary::WriteBuffer();
+                }
+            }
+            releaseDataset(dataset_id);
+            m_fileNames[writable] = file.name;
+            return;
+        }
         status = H5Dwrite(
             dataset_id,
             dataType,
             memspace,
             filespace,
-            m_datasetTransferProperty,
+            datasetTransferProperty(writable),
             data);
         VERIFY(
             status == 0,
             "[HDF5] Internal error: Failed to write dataset " +
                 concrete_h5_file_position(writable));
+        // mark the coalesced writes as done, this also frees their buffers
+        for (auto *write : writes)
+        {
+            if (write != &parameters)
+            {
+                write->data = auxiliary::WriteBuffer();
+            }
+        }
         break;
     case DT::UNDEFINED:
         throw std::runtime_error("[HDF5] Undefined Attribute datatype");
     default:
         throw std::runtime_error("[HDF5] Datatype not implemented in HDF5 IO");
     }
-    status = H5Tclose(dataType);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close dataset datatype during "
-        "dataset write");
     status = H5Sclose(filespace);
     VERIFY(
         status == 0,
@@ -1362,30 +1775,181 @@ void HDF5IOHandlerImpl::writeDataset(
         status == 0,
         "[HDF5] Internal error: Failed to close dataset memory space during "
         "dataset write");
-    status = H5Dclose(dataset_id);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close dataset " +
-            concrete_h5_file_position(writable) + " during dataset write");
+    releaseDataset(dataset_id);
 
     m_fileNames[writable] = file.name;
 }
 
-void HDF5IOHandlerImpl::writeAttribute(
-    Writable *writable, Parameter<Operation::WRITE_ATT> const &parameters)
+void HDF5IOHandlerImpl::getBufferView(
+    Writable *writable, Parameter<Operation::GET_BUFFER_VIEW> &parameters)
 {
-    if (parameters.changesOverSteps)
+    if (parameters.update)
     {
-        // cannot do this
+        auto it = m_spanBuffers.find(parameters.out->viewIndex);
+        if (it == m_spanBuffers.end())
+        {
+            throw std::runtime_error(
+                "[HDF5] Buffer view has already been written in a previous "
+                "flush and can no longer be accessed.");
+        }
+        parameters.out->ptr = it->second.data.get();
+        return;
+    }
+    if (access::readOnly(m_handler->m_backendAccess) || !useSpanBasedPut())
+    {
+        parameters.out->backendManagedBuffer = false;
         return;
     }
-    if (access::readOnly(m_handler->m_backendAccess))
-        throw std::runtime_error(
-            "[HDF5] Writing an attribute in a file opened as read only is not "
-            "possible.");
 
-    auto res = getFile(writable);
-    File file = res ? res.value() : getFile(writable->parent).value();
+    size_t const bytes =
+        numberOfElements(parameters.extent) * toBytes(parameters.dtype);
+    UniquePtrWithLambda<void> buffer(
+        new char[bytes], [](void *ptr) { delete[] static_cast<char *>(ptr); });
+    unsigned const index = m_nextSpanIndex++;
+    parameters.out->backendManagedBuffer = true;
+    parameters.out->viewIndex = index;
+    // the buffer does not move, so it can be handed out right away
+    parameters.out->ptr = buffer.get();
+    m_spanBuffers.emplace(
+        index,
+        SpanBuffer{
+            writable,
+            parameters.offset,
+            parameters.extent,
+            parameters.dtype,
+            std::move(buffer)});
+}
+
+void HDF5IOHandlerImpl::readBufferView(
+    Writable *writable, Parameter<Operation::READ_BUFFER_VIEW> &parameters)
+{
+    parameters.out->backendManagedBuffer = false;
+    /*
+     * Only files opened read-only are mapped, others might have data in
+     * HDF5's caches that is not yet on disk.
+     */
+    if (!access::readOnly(m_handler->m_backendAccess))
+    {
+        return;
+    }
+    auto res = getFile(writable);
+    if (!res)
+    {
+        res = getFile(writable->parent);
+    }
+    hsize_t const numElements = numberOfElements(parameters.extent);
+    if (!res || numElements == 0)
+    {
+        return;
+    }
+    File file = res.value();
+
+    // only the sec2 (POSIX) driver keeps the file as is on disk
+    hid_t fapl = H5Fget_access_plist(file.id);
+    VERIFY(
+        fapl >= 0,
+        "[HDF5] Internal error: Failed to get file access property list "
+        "during dataset read");
+    bool const posixFile = H5Pget_driver(fapl) == H5FD_SEC2;
+    H5Pclose(fapl);
+    if (!posixFile)
+    {
+        return;
+    }
+
+    hid_t dataset_id = acquireDataset(writable, file);
+    VERIFY(
+        dataset_id >= 0,
+        "[HDF5] Internal error: Failed to open HDF5 dataset during dataset "
+        "read");
+    // contiguous datasets are stored unfiltered, in row-major order
+    hid_t dcpl = H5Dget_create_plist(dataset_id);
+    VERIFY(
+        dcpl >= 0,
+        "[HDF5] Internal error: Failed to get dataset creation property list "
+        "during dataset read");
+    bool const contiguous = H5Pget_layout(dcpl) == H5D_CONTIGUOUS &&
+        H5Pget_external_count(dcpl) == 0;
+    H5Pclose(dcpl);
+    haddr_t const address = H5Dget_offset(dataset_id);
+    hid_t fileType = H5Dget_type(dataset_id);
+    // no datatype conversion, e.g. of the byte order
+    bool const sameType = fileType >= 0 &&
+        H5Tequal(fileType, m_getH5DataType.native(parameters.dtype)) > 0;
+    if (fileType >= 0)
+    {
+        H5Tclose(fileType);
+    }
+    Extent const dims = [&]() {
+        auto extent = datasetExtent(dataset_id);
+        return Extent(extent.begin(), extent.end());
+    }();
+    releaseDataset(dataset_id);
+    if (!contiguous || address == HADDR_UNDEF || !sameType ||
+        dims.size() != parameters.extent.size())
+    {
+        return;
+    }
+
+    /*
+     * The selection is contiguous in the file if all dimensions following
+     * the first one with more than one element are selected in full.
+     */
+    size_t d = 0;
+    while (d < dims.size() && parameters.extent[d] == 1)
+    {
+        ++d;
+    }
+    for (++d; d < dims.size(); ++d)
+    {
+        if (parameters.offset[d] != 0 || parameters.extent[d] != dims[d])
+        {
+            return;
+        }
+    }
+    hsize_t firstElement = 0;
+    for (d = 0; d < dims.size(); ++d)
+    {
+        firstElement = firstElement * dims[d] + parameters.offset[d];
+    }
+    size_t const elementSize = toBytes(parameters.dtype);
+    size_t const offset = address + firstElement * elementSize;
+    // the view must be aligned for its datatype, see hdf5.file.alignment
+    if (offset % std::min(elementSize, alignof(std::max_align_t)) != 0)
+    {
+        return;
+    }
+
+    ssize_t const nameLength = H5Fget_name(file.id, nullptr, 0);
+    if (nameLength <= 0)
+    {
+        return;
+    }
+    std::string path(static_cast<size_t>(nameLength), '\0');
+    H5Fget_name(file.id, path.data(), path.size() + 1);
+    auto view = mapFileRange(path, offset, numElements * elementSize);
+    if (view)
+    {
+        parameters.out->ptr = std::move(view);
+        parameters.out->backendManagedBuffer = true;
+    }
+}
+
+void HDF5IOHandlerImpl::writeAttribute(
+    Writable *writable, Parameter<Operation::WRITE_ATT> const &parameters)
+{
+    if (parameters.changesOverSteps)
+    {
+        // cannot do this
+        return;
+    }
+    if (access::readOnly(m_handler->m_backendAccess))
+        throw std::runtime_error(
+            "[HDF5] Writing an attribute in a file opened as read only is not "
+            "possible.");
+
+    auto res = getFile(writable);
+    File file = res ? res.value() : getFile(writable->parent).value();
     hid_t node_id, attribute_id;
 
     hid_t fapl = H5Pcreate(H5P_LINK_ACCESS);
@@ -1405,13 +1969,11 @@ void HDF5IOHandlerImpl::writeAttribute(
     Attribute const att(parameters.resource);
     Datatype dtype = parameters.dtype;
     herr_t status;
-    GetH5DataType getH5DataType({
-        {typeid(bool).name(), m_H5T_BOOL_ENUM},
-        {typeid(std::complex<float>).name(), m_H5T_CFLOAT},
-        {typeid(std::complex<double>).name(), m_H5T_CDOUBLE},
-        {typeid(std::complex<long double>).name(), m_H5T_CLONG_DOUBLE},
-    });
-    hid_t dataType = getH5DataType(att);
+    // strings need a type of their length, all others are looked up
+    bool const isString =
+        dtype == Datatype::STRING || dtype == Datatype::VEC_STRING;
+    hid_t dataType =
+        isString ? m_getH5DataType(att) : m_getH5DataType.native(dtype);
     VERIFY(
         dataType >= 0,
         "[HDF5] Internal error: Failed to get HDF5 datatype during attribute "
@@ -1659,11 +2221,14 @@ void HDF5IOHandlerImpl::writeAttribute(
         "[HDF5] Internal error: Failed to write attribute " + name + " at " +
             concrete_h5_file_position(writable));
 
-    status = H5Tclose(dataType);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close HDF5 datatype during Attribute "
-        "write");
+    if (isString)
+    {
+        status = H5Tclose(dataType);
+        VERIFY(
+            status == 0,
+            "[HDF5] Internal error: Failed to close HDF5 datatype during "
+            "Attribute write");
+    }
 
     status = H5Aclose(attribute_id);
     VERIFY(
@@ -1687,17 +2252,23 @@ void HDF5IOHandlerImpl::writeAttribute(
 void HDF5IOHandlerImpl::readDataset(
     Writable *writable, Parameter<Operation::READ_DATASET> &parameters)
 {
+    finishAsyncWrites();
     auto res = getFile(writable);
     File file = res ? res.value() : getFile(writable->parent).value();
     hid_t dataset_id, memspace, filespace;
     herr_t status;
-    dataset_id = H5Dopen(
-        file.id, concrete_h5_file_position(writable).c_str(), H5P_DEFAULT);
+    dataset_id = acquireDataset(writable, file);
     VERIFY(
         dataset_id >= 0,
         "[HDF5] Internal error: Failed to open HDF5 dataset during dataset "
         "read");
 
+    if (directChunkIO() && readDirectChunks(writable, dataset_id, parameters))
+    {
+        releaseDataset(dataset_id);
+        return;
+    }
+
     std::vector<hsize_t> start;
     for (auto const &val : parameters.offset)
         start.push_back(static_cast<hsize_t>(val));
@@ -1723,9 +2294,7 @@ void HDF5IOHandlerImpl::readDataset(
 
     void *data = parameters.data.get();
 
-    Attribute a(0);
-    a.dtype = parameters.dtype;
-    switch (a.dtype)
+    switch (parameters.dtype)
     {
         using DT = Datatype;
     case DT::LONG_DOUBLE:
@@ -1753,13 +2322,7 @@ void HDF5IOHandlerImpl::readDataset(
     default:
         throw std::runtime_error("[HDF5] Datatype not implemented in HDF5 IO");
     }
-    GetH5DataType getH5DataType({
-        {typeid(bool).name(), m_H5T_BOOL_ENUM},
-        {typeid(std::complex<float>).name(), m_H5T_CFLOAT},
-        {typeid(std::complex<double>).name(), m_H5T_CDOUBLE},
-        {typeid(std::complex<long double>).name(), m_H5T_CLONG_DOUBLE},
-    });
-    hid_t dataType = getH5DataType(a);
+    hid_t dataType = m_getH5DataType.native(parameters.dtype);
     VERIFY(
         dataType >= 0,
         "[HDF5] Internal error: Failed to get HDF5 datatype during dataset "
@@ -1769,15 +2332,10 @@ void HDF5IOHandlerImpl::readDataset(
         dataType,
         memspace,
         filespace,
-        m_datasetTransferProperty,
+        datasetTransferProperty(writable),
         data);
     VERIFY(status == 0, "[HDF5] Internal error: Failed to read dataset");
 
-    status = H5Tclose(dataType);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close dataset datatype during "
-        "dataset read");
     status = H5Sclose(filespace);
     VERIFY(
         status == 0,
@@ -1788,61 +2346,13 @@ void HDF5IOHandlerImpl::readDataset(
         status == 0,
         "[HDF5] Internal error: Failed to close dataset memory space during "
         "dataset read");
-    status = H5Dclose(dataset_id);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close dataset during dataset read");
+    releaseDataset(dataset_id);
 }
 
-void HDF5IOHandlerImpl::readAttribute(
-    Writable *writable, Parameter<Operation::READ_ATT> &parameters)
+Attribute HDF5IOHandlerImpl::readAttributeValue(
+    Writable *writable, hid_t attr_id, std::string const &attr_name)
 {
-    if (!writable->written)
-        throw std::runtime_error(
-            "[HDF5] Internal error: Writable not marked written during "
-            "attribute read");
-
-    auto res = getFile(writable);
-    File file = res ? res.value() : getFile(writable->parent).value();
-
-    hid_t obj_id, attr_id;
     herr_t status;
-
-    hid_t fapl = H5Pcreate(H5P_LINK_ACCESS);
-#if H5_VERSION_GE(1, 10, 0) && openPMD_HAVE_MPI
-    if (m_hdf5_collective_metadata)
-    {
-        H5Pset_all_coll_metadata_ops(fapl, true);
-    }
-#endif
-
-    obj_id =
-        H5Oopen(file.id, concrete_h5_file_position(writable).c_str(), fapl);
-    if (obj_id < 0)
-    {
-        throw error::ReadError(
-            error::AffectedObject::Attribute,
-            error::Reason::NotFound,
-            "HDF5",
-            std::string("[HDF5] Internal error: Failed to open HDF5 object '") +
-                concrete_h5_file_position(writable).c_str() +
-                "' during attribute read");
-    }
-    std::string const &attr_name = parameters.name;
-    attr_id = H5Aopen(obj_id, attr_name.c_str(), H5P_DEFAULT);
-    if (attr_id < 0)
-    {
-        throw error::ReadError(
-            error::AffectedObject::Attribute,
-            error::Reason::NotFound,
-            "HDF5",
-            std::string(
-                "[HDF5] Internal error: Failed to open HDF5 attribute '") +
-                attr_name + "' (" +
-                concrete_h5_file_position(writable).c_str() +
-                ") during attribute read");
-    }
-
     hid_t attr_type, attr_space;
     attr_type = H5Aget_type(attr_id);
     attr_space = H5Aget_space(attr_id);
@@ -2283,7 +2793,59 @@ void HDF5IOHandlerImpl::readAttribute(
             "during "
             "attribute read");
     }
+    return a;
+}
+
+void HDF5IOHandlerImpl::readAttribute(
+    Writable *writable, Parameter<Operation::READ_ATT> &parameters)
+{
+    if (!writable->written)
+        throw std::runtime_error(
+            "[HDF5] Internal error: Writable not marked written during "
+            "attribute read");
+
+    auto res = getFile(writable);
+    File file = res ? res.value() : getFile(writable->parent).value();
+
+    hid_t obj_id, attr_id;
+    herr_t status;
+
+    hid_t fapl = H5Pcreate(H5P_LINK_ACCESS);
+#if H5_VERSION_GE(1, 10, 0) && openPMD_HAVE_MPI
+    if (m_hdf5_collective_metadata)
+    {
+        H5Pset_all_coll_metadata_ops(fapl, true);
+    }
+#endif
+
+    obj_id =
+        H5Oopen(file.id, concrete_h5_file_position(writable).c_str(), fapl);
+    if (obj_id < 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::NotFound,
+            "HDF5",
+            std::string("[HDF5] Internal error: Failed to open HDF5 object '") +
+                concrete_h5_file_position(writable).c_str() +
+                "' during attribute read");
+    }
+    std::string const &attr_name = parameters.name;
+    attr_id = H5Aopen(obj_id, attr_name.c_str(), H5P_DEFAULT);
+    if (attr_id < 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::NotFound,
+            "HDF5",
+            std::string(
+                "[HDF5] Internal error: Failed to open HDF5 attribute '") +
+                attr_name + "' (" +
+                concrete_h5_file_position(writable).c_str() +
+                ") during attribute read");
+    }
 
+    Attribute a = readAttributeValue(writable, attr_id, attr_name);
     auto dtype = parameters.dtype;
     *dtype = a.dtype;
     auto resource = parameters.resource;
@@ -2322,66 +2884,220 @@ void HDF5IOHandlerImpl::readAttribute(
     }
 }
 
-void HDF5IOHandlerImpl::listPaths(
-    Writable *writable, Parameter<Operation::LIST_PATHS> &parameters)
+void HDF5IOHandlerImpl::readAllAttributes(
+    Writable *writable, Parameter<Operation::READ_ALL_ATTS> &parameters)
 {
     if (!writable->written)
         throw std::runtime_error(
-            "[HDF5] Internal error: Writable not marked written during path "
-            "listing");
+            "[HDF5] Internal error: Writable not marked written during "
+            "attribute read");
 
     auto res = getFile(writable);
     File file = res ? res.value() : getFile(writable->parent).value();
 
-    hid_t gapl = H5Pcreate(H5P_GROUP_ACCESS);
+    hid_t fapl = H5Pcreate(H5P_LINK_ACCESS);
 #if H5_VERSION_GE(1, 10, 0) && openPMD_HAVE_MPI
     if (m_hdf5_collective_metadata)
     {
-        H5Pset_all_coll_metadata_ops(gapl, true);
+        H5Pset_all_coll_metadata_ops(fapl, true);
     }
 #endif
 
-    hid_t node_id =
-        H5Gopen(file.id, concrete_h5_file_position(writable).c_str(), gapl);
-    VERIFY(
-        node_id >= 0,
-        "[HDF5] Internal error: Failed to open HDF5 group during path listing");
-
-    H5G_info_t group_info;
-    herr_t status = H5Gget_info(node_id, &group_info);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to get HDF5 group info for " +
-            concrete_h5_file_position(writable) + " during path listing");
+    hid_t obj_id =
+        H5Oopen(file.id, concrete_h5_file_position(writable).c_str(), fapl);
+    if (obj_id < 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::NotFound,
+            "HDF5",
+            std::string("[HDF5] Internal error: Failed to open HDF5 object '") +
+                concrete_h5_file_position(writable).c_str() +
+                "' during attribute read");
+    }
 
-    auto paths = parameters.paths;
-    for (hsize_t i = 0; i < group_info.nlinks; ++i)
+    /*
+     * Visit all attributes in a single pass instead of reopening the object
+     * for every attribute.
+     * Exceptions must not propagate through the HDF5 library, they are
+     * stored and rethrown after the iteration.
+     */
+    struct AttributeVisitor
     {
-        if (H5G_GROUP == H5Gget_objtype_by_idx(node_id, i))
+        HDF5IOHandlerImpl *impl;
+        Writable *writable;
+        std::map<std::string, Attribute> &attributes;
+        std::exception_ptr error;
+    } visitor{this, writable, *parameters.attributes, nullptr};
+    H5A_operator2_t readOne = [](hid_t location_id,
+                                 char const *name,
+                                 H5A_info_t const *,
+                                 void *data) -> herr_t {
+        auto &self = *static_cast<AttributeVisitor *>(data);
+        hid_t attr_id = H5Aopen(location_id, name, H5P_DEFAULT);
+        if (attr_id < 0)
         {
-            ssize_t name_length = H5Gget_objname_by_idx(node_id, i, nullptr, 0);
-            std::vector<char> name(name_length + 1);
-            H5Gget_objname_by_idx(node_id, i, name.data(), name_length + 1);
-            paths->push_back(std::string(name.data(), name_length));
+            self.error = std::make_exception_ptr(error::ReadError(
+                error::AffectedObject::Attribute,
+                error::Reason::NotFound,
+                "HDF5",
+                std::string(
+                    "[HDF5] Internal error: Failed to open HDF5 attribute '") +
+                    name + "' (" + concrete_h5_file_position(self.writable) +
+                    ") during attribute read"));
+            return 1; // stop iterating
+        }
+        try
+        {
+            self.attributes.emplace(
+                name,
+                self.impl->readAttributeValue(self.writable, attr_id, name));
         }
+        catch (...)
+        {
+            self.error = std::current_exception();
+        }
+        if (H5Aclose(attr_id) < 0 && !self.error)
+        {
+            self.error = std::make_exception_ptr(error::ReadError(
+                error::AffectedObject::Attribute,
+                error::Reason::CannotRead,
+                "HDF5",
+                std::string("[HDF5] Internal error: Failed to close "
+                            "attribute ") +
+                    name + " at " + concrete_h5_file_position(self.writable) +
+                    " during attribute read"));
+        }
+        return self.error ? 1 : 0;
+    };
+    hsize_t index = 0;
+    herr_t status = H5Aiterate2(
+        obj_id, H5_INDEX_NAME, H5_ITER_INC, &index, readOne, &visitor);
+
+    herr_t const closeObject = H5Oclose(obj_id);
+    herr_t const closeProperty = H5Pclose(fapl);
+    if (visitor.error)
+    {
+        std::rethrow_exception(visitor.error);
     }
-
-    status = H5Gclose(node_id);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close HDF5 group " +
-            concrete_h5_file_position(writable) + " during path listing");
-    status = H5Pclose(gapl);
-    VERIFY(
-        status == 0,
-        "[HDF5] Internal error: Failed to close HDF5 property during path "
-        "listing");
-}
-
-void HDF5IOHandlerImpl::listDatasets(
-    Writable *writable, Parameter<Operation::LIST_DATASETS> &parameters)
-{
-    if (!writable->written)
+    if (status < 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::CannotRead,
+            "HDF5",
+            "[HDF5] Internal error: Failed to iterate over attributes of " +
+                concrete_h5_file_position(writable));
+    }
+    if (closeObject != 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::CannotRead,
+            "HDF5",
+            "[HDF5] Internal error: Failed to close " +
+                concrete_h5_file_position(writable) + " during attribute read");
+    }
+    if (closeProperty != 0)
+    {
+        throw error::ReadError(
+            error::AffectedObject::Attribute,
+            error::Reason::CannotRead,
+            "HDF5",
+            "[HDF5] Internal error: Failed to close HDF5 link access property "
+            "during attribute read");
+    }
+}
+
+void HDF5IOHandlerImpl::listPaths(
+    Writable *writable, Parameter<Operation::LIST_PATHS> &parameters)
+{
+    if (!writable->written)
+        throw std::runtime_error(
+            "[HDF5] Internal error: Writable not marked written during path "
+            "listing");
+
+    auto res = getFile(writable);
+    File file = res ? res.value() : getFile(writable->parent).value();
+
+    hid_t gapl = H5Pcreate(H5P_GROUP_ACCESS);
+#if H5_VERSION_GE(1, 10, 0) && openPMD_HAVE_MPI
+    if (m_hdf5_collective_metadata)
+    {
+        H5Pset_all_coll_metadata_ops(gapl, true);
+    }
+#endif
+
+    hid_t node_id =
+        H5Gopen(file.id, concrete_h5_file_position(writable).c_str(), gapl);
+    VERIFY(
+        node_id >= 0,
+        "[HDF5] Internal error: Failed to open HDF5 group during path listing");
+
+    H5G_info_t group_info;
+    herr_t status = H5Gget_info(node_id, &group_info);
+    VERIFY(
+        status == 0,
+        "[HDF5] Internal error: Failed to get HDF5 group info for " +
+            concrete_h5_file_position(writable) + " during path listing");
+
+    auto paths = parameters.paths;
+    for (hsize_t i = 0; i < group_info.nlinks; ++i)
+    {
+        auto const type = H5Gget_objtype_by_idx(node_id, i);
+        if (type != H5G_GROUP && type != H5G_LINK && type != H5G_UDLINK)
+        {
+            continue;
+        }
+        ssize_t name_length = H5Gget_objname_by_idx(node_id, i, nullptr, 0);
+        std::vector<char> name(name_length + 1);
+        H5Gget_objname_by_idx(node_id, i, name.data(), name_length + 1);
+        if (type != H5G_GROUP)
+        {
+            /*
+             * Soft and external links, e.g. iterations of a merged series
+             * (see helper::mergeSeries()), count if they resolve to a group.
+             */
+            hid_t object_id;
+            H5E_BEGIN_TRY
+            {
+                object_id = H5Oopen(node_id, name.data(), H5P_DEFAULT);
+            }
+            H5E_END_TRY
+            if (object_id < 0)
+            {
+                continue; // dangling link
+            }
+            bool const isGroup = H5Iget_type(object_id) == H5I_GROUP;
+            status = H5Oclose(object_id);
+            VERIFY(
+                status == 0,
+                "[HDF5] Internal error: Failed to close HDF5 object during "
+                "path listing");
+            if (!isGroup)
+            {
+                continue;
+            }
+        }
+        paths->push_back(std::string(name.data(), name_length));
+    }
+
+    status = H5Gclose(node_id);
+    VERIFY(
+        status == 0,
+        "[HDF5] Internal error: Failed to close HDF5 group " +
+            concrete_h5_file_position(writable) + " during path listing");
+    status = H5Pclose(gapl);
+    VERIFY(
+        status == 0,
+        "[HDF5] Internal error: Failed to close HDF5 property during path "
+        "listing");
+}
+
+void HDF5IOHandlerImpl::listDatasets(
+    Writable *writable, Parameter<Operation::LIST_DATASETS> &parameters)
+{
+    if (!writable->written)
         throw std::runtime_error(
             "[HDF5] Internal error: Writable not marked written during dataset "
             "listing");
@@ -2516,40 +3232,1693 @@ void HDF5IOHandlerImpl::deregister(
     Writable *writable, Parameter<Operation::DEREGISTER> const &)
 {
     m_fileNames.erase(writable);
+    m_datasetChunkCaches.erase(writable);
+    m_datasetTransferModes.erase(writable);
+    m_directChunkLayouts.erase(writable);
+    for (auto it = m_spanBuffers.begin(); it != m_spanBuffers.end();)
+    {
+        it = it->second.writable == writable ? m_spanBuffers.erase(it)
+                                             : std::next(it);
+    }
+    closeDataset(writable);
 }
 
-std::optional<HDF5IOHandlerImpl::File>
-HDF5IOHandlerImpl::getFile(Writable *writable)
+void HDF5IOHandlerImpl::parseDatasetConfig(
+    json::TracingJSON &config, DatasetConfig &datasetConfig)
 {
-    auto it = m_fileNames.find(writable);
-    if (it == m_fileNames.end())
+    if (config.json().contains("chunks"))
     {
-        return std::optional<File>();
+        auto chunksConfig = config["chunks"];
+        auto const &chunks = chunksConfig.json();
+        if (chunks.is_array())
+        {
+            std::vector<hsize_t> chunkShape;
+            chunkShape.reserve(chunks.size());
+            for (auto const &extent : chunks)
+            {
+                if (!extent.is_number_unsigned() || extent.get<hsize_t>() == 0)
+                {
+                    throw error::BackendConfigSchema(
+                        {"hdf5", "dataset", "chunks"},
+                        "A chunk shape must be given as an array of positive "
+                        "integers.");
+                }
+                chunkShape.push_back(extent.get<hsize_t>());
+            }
+            datasetConfig.chunking = ChunkingStrategy::Explicit;
+            datasetConfig.chunkShape = std::move(chunkShape);
+        }
+        else
+        {
+            auto maybeChunks = json::asLowerCaseStringDynamic(chunks);
+            if (!maybeChunks.has_value())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "chunks"},
+                    "Must be convertible to string type or be an array of "
+                    "integers.");
+            }
+            if (*maybeChunks == "auto")
+            {
+                datasetConfig.chunking = ChunkingStrategy::Auto;
+            }
+            else if (*maybeChunks == "none")
+            {
+                datasetConfig.chunking = ChunkingStrategy::None;
+            }
+            else if (*maybeChunks == "store_chunk")
+            {
+                datasetConfig.chunking = ChunkingStrategy::StoreChunk;
+            }
+            else
+            {
+                std::cerr << "Warning: HDF5 chunking option set to an invalid "
+                             "value '"
+                          << *maybeChunks << "'. Reset to 'auto'." << std::endl;
+                datasetConfig.chunking = ChunkingStrategy::Auto;
+            }
+        }
     }
-    auto it2 = m_fileNamesWithID.find(it->second);
-    if (it2 == m_fileNamesWithID.end())
+    if (config.json().contains("filters"))
     {
-        return std::optional<File>();
+        auto filters = config["filters"];
+        datasetConfig.filters = parseFilters(filters.json());
+        filters.declareFullyRead();
+    }
+    if (config.json().contains("target_chunk_size"))
+    {
+        auto const &targetChunkSize = config["target_chunk_size"].json();
+        if (!targetChunkSize.is_number_unsigned())
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "dataset", "target_chunk_size"},
+                "Must be a non-negative integer (size in bytes).");
+        }
+        datasetConfig.targetChunkSize = targetChunkSize.get<size_t>();
+    }
+    if (config.json().contains("chunk_cache"))
+    {
+        auto chunkCacheConfig = config["chunk_cache"];
+        ChunkCache chunkCache = datasetConfig.chunkCache.value_or(ChunkCache{});
+        parseChunkCache(
+            chunkCacheConfig, chunkCache, {"hdf5", "dataset", "chunk_cache"});
+        datasetConfig.chunkCache = chunkCache;
+    }
+    if (config.json().contains("transfer"))
+    {
+        datasetConfig.transfer = parseTransferMode(
+            config["transfer"].json(), {"hdf5", "dataset", "transfer"});
     }
-    File res;
-    res.name = it->second;
-    res.id = it2->second;
-    return std::make_optional(std::move(res));
 }
-#endif
 
-#if openPMD_HAVE_HDF5
-HDF5IOHandler::HDF5IOHandler(
-    std::string path, Access at, json::TracingJSON config)
-    : AbstractIOHandler(std::move(path), at)
-    , m_impl{new HDF5IOHandlerImpl(this, std::move(config))}
-{}
+auto HDF5IOHandlerImpl::parseTransferMode(
+    nlohmann::json const &config, std::vector<std::string> errorPath)
+    -> TransferMode
+{
+    auto mode = json::asLowerCaseStringDynamic(config);
+    if (mode == "collective")
+    {
+        return TransferMode::Collective;
+    }
+    else if (mode == "independent")
+    {
+        return TransferMode::Independent;
+    }
+    throw error::BackendConfigSchema(
+        std::move(errorPath), "Must be either 'collective' or 'independent'.");
+}
 
-HDF5IOHandler::~HDF5IOHandler() = default;
+void HDF5IOHandlerImpl::parseMPIHints(
+    nlohmann::json const &config, std::map<std::string, std::string> &hints)
+{
+    if (!config.is_object())
+    {
+        throw error::BackendConfigSchema(
+            {"hdf5", "mpi_info"},
+            "Must be an object of MPI-IO hints, e.g. {\"cb_nodes\": 4}.");
+    }
+    for (auto const &[key, value] : config.items())
+    {
+        // MPI_Info values are strings, numbers and booleans are accepted too
+        auto hint = json::asStringDynamic(value);
+        if (!hint.has_value())
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "mpi_info", key},
+                "Must be a string, number or boolean.");
+        }
+        hints[key] = std::move(*hint);
+    }
+}
 
-std::future<void> HDF5IOHandler::flush(internal::ParsedFlushParams &)
+namespace
+{
+    /*
+     * Read config[key] as a non-negative integer if it is present,
+     * errorPath is the location of config within the backend configuration.
+     */
+    template <typename T>
+    std::optional<T> readUnsigned(
+        json::TracingJSON &config,
+        std::string const &key,
+        std::vector<std::string> errorPath)
+    {
+        if (!config.json().contains(key))
+        {
+            return std::nullopt;
+        }
+        auto const &val = config[key].json();
+        if (!val.is_number_unsigned())
+        {
+            errorPath.push_back(key);
+            throw error::BackendConfigSchema(
+                std::move(errorPath), "Must be a non-negative integer.");
+        }
+        return val.template get<T>();
+    }
+} // namespace
+
+void HDF5IOHandlerImpl::parseChunkCache(
+    json::TracingJSON &config,
+    ChunkCache &chunkCache,
+    std::vector<std::string> const &errorPath)
+{
+    if (!config.json().is_object())
+    {
+        throw error::BackendConfigSchema(
+            errorPath,
+            "Must be an object with keys 'slots', 'size' and/or 'w0'.");
+    }
+    if (auto slots = readUnsigned<size_t>(config, "slots", errorPath); slots)
+    {
+        chunkCache.slots = *slots;
+    }
+    if (auto size = readUnsigned<size_t>(config, "size", errorPath); size)
+    {
+        chunkCache.size = *size;
+    }
+    if (config.json().contains("w0"))
+    {
+        auto const &w0 = config["w0"].json();
+        if (!w0.is_number() || w0.get<double>() < 0. || w0.get<double>() > 1.)
+        {
+            auto path = errorPath;
+            path.emplace_back("w0");
+            throw error::BackendConfigSchema(
+                std::move(path), "Must be a number between 0 and 1.");
+        }
+        chunkCache.w0 = w0.get<double>();
+    }
+}
+
+bool HDF5IOHandlerImpl::FileConfig::empty() const
+{
+    return !chunkCache.has_value() && !metadataCache.has_value() &&
+        !pageBufferSize.has_value() && !alignment.has_value() &&
+        !fileSpace.has_value();
+}
+
+void HDF5IOHandlerImpl::parseFileConfig(
+    json::TracingJSON &config, FileConfig &fileConfig)
+{
+    if (config.json().contains("chunk_cache"))
+    {
+        auto chunkCacheConfig = config["chunk_cache"];
+        ChunkCache chunkCache;
+        parseChunkCache(
+            chunkCacheConfig, chunkCache, {"hdf5", "file", "chunk_cache"});
+        fileConfig.chunkCache = chunkCache;
+    }
+    if (config.json().contains("metadata_cache"))
+    {
+        auto mdcConfig = config["metadata_cache"];
+        std::vector<std::string> const errorPath{
+            "hdf5", "file", "metadata_cache"};
+        if (!mdcConfig.json().is_object())
+        {
+            throw error::BackendConfigSchema(
+                errorPath,
+                "Must be an object with keys 'initial_size', 'min_size', "
+                "'max_size' and/or 'evictions'.");
+        }
+        FileConfig::MetadataCache mdc;
+        mdc.initialSize =
+            readUnsigned<size_t>(mdcConfig, "initial_size", errorPath);
+        mdc.minSize = readUnsigned<size_t>(mdcConfig, "min_size", errorPath);
+        mdc.maxSize = readUnsigned<size_t>(mdcConfig, "max_size", errorPath);
+        if (mdcConfig.json().contains("evictions"))
+        {
+            auto const &evictions = mdcConfig["evictions"].json();
+            if (!evictions.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "file", "metadata_cache", "evictions"},
+                    "Must be a boolean.");
+            }
+            mdc.evictions = evictions.get<bool>();
+        }
+        fileConfig.metadataCache = std::move(mdc);
+    }
+    fileConfig.pageBufferSize =
+        readUnsigned<size_t>(config, "page_buffer_size", {"hdf5", "file"});
+#if !H5_VERSION_GE(1, 10, 1)
+    if (fileConfig.pageBufferSize.has_value())
+    {
+        std::cerr << "Warning: HDF5 page buffering requires HDF5 >= 1.10.1, "
+                     "ignoring hdf5.file.page_buffer_size."
+                  << std::endl;
+    }
+#endif
+    if (config.json().contains("alignment"))
+    {
+        auto alignmentConfig = config["alignment"];
+        std::vector<std::string> const errorPath{"hdf5", "file", "alignment"};
+        FileConfig::Alignment alignment;
+        if (alignmentConfig.json().is_number_unsigned())
+        {
+            alignment.boundary = alignmentConfig.json().get<hsize_t>();
+        }
+        else if (alignmentConfig.json().is_object())
+        {
+            alignment.threshold =
+                readUnsigned<hsize_t>(alignmentConfig, "threshold", errorPath)
+                    .value_or(alignment.threshold);
+            alignment.boundary =
+                readUnsigned<hsize_t>(alignmentConfig, "boundary", errorPath)
+                    .value_or(alignment.boundary);
+        }
+        else
+        {
+            throw error::BackendConfigSchema(
+                errorPath,
+                "Must be a non-negative integer or an object with keys "
+                "'threshold' and/or 'boundary'.");
+        }
+        if (alignment.boundary == 0)
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "file", "alignment", "boundary"},
+                "Must be a positive integer.");
+        }
+        fileConfig.alignment = alignment;
+    }
+    if (config.json().contains("file_space"))
+    {
+        auto fileSpaceConfig = config["file_space"];
+        std::vector<std::string> const errorPath{"hdf5", "file", "file_space"};
+        if (!fileSpaceConfig.json().is_object())
+        {
+            throw error::BackendConfigSchema(
+                errorPath,
+                "Must be an object with keys 'strategy', 'persist', "
+                "'threshold' and/or 'page_size'.");
+        }
+        FileConfig::FileSpace fileSpace;
+        if (fileSpaceConfig.json().contains("strategy"))
+        {
+            auto strategy = json::asLowerCaseStringDynamic(
+                fileSpaceConfig["strategy"].json());
+            if (strategy == "fsm_aggr")
+            {
+                fileSpace.strategy = FileSpaceStrategy::FsmAggr;
+            }
+            else if (strategy == "page")
+            {
+                fileSpace.strategy = FileSpaceStrategy::Page;
+            }
+            else if (strategy == "aggr")
+            {
+                fileSpace.strategy = FileSpaceStrategy::Aggr;
+            }
+            else if (strategy == "none")
+            {
+                fileSpace.strategy = FileSpaceStrategy::None;
+            }
+            else
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "file", "file_space", "strategy"},
+                    "Must be one of 'fsm_aggr', 'page', 'aggr' or 'none'.");
+            }
+        }
+        if (fileSpaceConfig.json().contains("persist"))
+        {
+            auto const &persist = fileSpaceConfig["persist"].json();
+            if (!persist.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "file", "file_space", "persist"},
+                    "Must be a boolean.");
+            }
+            fileSpace.persist = persist.get<bool>();
+        }
+        fileSpace.threshold =
+            readUnsigned<hsize_t>(fileSpaceConfig, "threshold", errorPath)
+                .value_or(fileSpace.threshold);
+        fileSpace.pageSize =
+            readUnsigned<hsize_t>(fileSpaceConfig, "page_size", errorPath);
+        if (fileSpace.pageSize.has_value() &&
+            fileSpace.strategy != FileSpaceStrategy::Page)
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "file", "file_space", "page_size"},
+                "Only applicable for strategy 'page'.");
+        }
+        fileConfig.fileSpace = fileSpace;
+    }
+    if (fileConfig.pageBufferSize.value_or(0) > 0)
+    {
+        // page buffering requires the paged file space strategy
+        if (!fileConfig.fileSpace.has_value())
+        {
+            fileConfig.fileSpace = FileConfig::FileSpace();
+            fileConfig.fileSpace->strategy = FileSpaceStrategy::Page;
+        }
+        else if (fileConfig.fileSpace->strategy != FileSpaceStrategy::Page)
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "file", "page_buffer_size"},
+                "Page buffering requires the file space strategy 'page'.");
+        }
+        // 4096 bytes is the default page size in HDF5
+        if (*fileConfig.pageBufferSize <
+            fileConfig.fileSpace->pageSize.value_or(4096))
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "file", "page_buffer_size"},
+                "The page buffer must be able to hold at least one page.");
+        }
+    }
+#if !H5_VERSION_GE(1, 10, 1)
+    if (fileConfig.fileSpace.has_value())
+    {
+        std::cerr << "Warning: HDF5 file space strategies require HDF5 >= "
+                     "1.10.1, ignoring hdf5.file.file_space."
+                  << std::endl;
+    }
+#endif
+}
+
+void HDF5IOHandlerImpl::setFileCreationProperties(hid_t fcpl) const
+{
+#if H5_VERSION_GE(1, 10, 1)
+    if (!m_fileConfig.fileSpace.has_value())
+    {
+        return;
+    }
+    auto const &fileSpace = *m_fileConfig.fileSpace;
+    H5F_fspace_strategy_t strategy{};
+    switch (fileSpace.strategy)
+    {
+    case FileSpaceStrategy::FsmAggr:
+        strategy = H5F_FSPACE_STRATEGY_FSM_AGGR;
+        break;
+    case FileSpaceStrategy::Page:
+        strategy = H5F_FSPACE_STRATEGY_PAGE;
+        break;
+    case FileSpaceStrategy::Aggr:
+        strategy = H5F_FSPACE_STRATEGY_AGGR;
+        break;
+    case FileSpaceStrategy::None:
+        strategy = H5F_FSPACE_STRATEGY_NONE;
+        break;
+    }
+    herr_t status = H5Pset_file_space_strategy(
+        fcpl, strategy, fileSpace.persist, fileSpace.threshold);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set file space strategy of HDF5 "
+        "file creation property");
+    if (fileSpace.pageSize.has_value() &&
+        H5Pset_file_space_page_size(fcpl, *fileSpace.pageSize) < 0)
+    {
+        throw error::BackendConfigSchema(
+            {"hdf5", "file", "file_space", "page_size"},
+            "Rejected by HDF5, the page size must be at least 512 bytes.");
+    }
+#else
+    (void)fcpl;
+#endif
+}
+
+void HDF5IOHandlerImpl::setFileAccessProperties(hid_t fapl) const
+{
+    herr_t status;
+    if (m_fileConfig.chunkCache.has_value())
+    {
+        auto const &chunkCache = *m_fileConfig.chunkCache;
+        int mdcNelmts;
+        size_t slots, size;
+        double w0;
+        status = H5Pget_cache(fapl, &mdcNelmts, &slots, &size, &w0);
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to get chunk cache of HDF5 file "
+            "access property");
+        if (chunkCache.slots != H5D_CHUNK_CACHE_NSLOTS_DEFAULT)
+            slots = chunkCache.slots;
+        if (chunkCache.size != H5D_CHUNK_CACHE_NBYTES_DEFAULT)
+            size = chunkCache.size;
+        if (chunkCache.w0 >= 0.)
+            w0 = chunkCache.w0;
+        status = H5Pset_cache(fapl, mdcNelmts, slots, size, w0);
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to set chunk cache of HDF5 file "
+            "access property");
+    }
+    if (m_fileConfig.metadataCache.has_value())
+    {
+        auto const &mdc = *m_fileConfig.metadataCache;
+        H5AC_cache_config_t cacheConfig;
+        cacheConfig.version = H5AC__CURR_CACHE_CONFIG_VERSION;
+        status = H5Pget_mdc_config(fapl, &cacheConfig);
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to get metadata cache of HDF5 file "
+            "access property");
+        if (mdc.minSize.has_value())
+            cacheConfig.min_size = *mdc.minSize;
+        if (mdc.maxSize.has_value())
+            cacheConfig.max_size = *mdc.maxSize;
+        if (mdc.initialSize.has_value())
+        {
+            cacheConfig.set_initial_size = 1;
+            cacheConfig.initial_size = *mdc.initialSize;
+            // widen the bounds unless explicitly specified
+            if (!mdc.maxSize.has_value())
+                cacheConfig.max_size =
+                    std::max(cacheConfig.max_size, *mdc.initialSize);
+            if (!mdc.minSize.has_value())
+                cacheConfig.min_size =
+                    std::min(cacheConfig.min_size, *mdc.initialSize);
+        }
+        if (mdc.evictions.has_value())
+        {
+            cacheConfig.evictions_enabled = *mdc.evictions;
+            if (!*mdc.evictions)
+            {
+                // HDF5 does not allow automatic resizing without evictions
+                cacheConfig.incr_mode = H5C_incr__off;
+                cacheConfig.flash_incr_mode = H5C_flash_incr__off;
+                cacheConfig.decr_mode = H5C_decr__off;
+            }
+        }
+        if (H5Pset_mdc_config(fapl, &cacheConfig) < 0)
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "file", "metadata_cache"},
+                "Rejected by HDF5, check that min_size <= initial_size <= "
+                "max_size.");
+        }
+    }
+    if (m_fileConfig.alignment.has_value())
+    {
+        status = H5Pset_alignment(
+            fapl,
+            m_fileConfig.alignment->threshold,
+            m_fileConfig.alignment->boundary);
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to set alignment of HDF5 file "
+            "access property");
+    }
+}
+
+bool HDF5IOHandlerImpl::usePageBuffer() const
+{
+#if H5_VERSION_GE(1, 10, 1)
+    return m_fileConfig.pageBufferSize.value_or(0) > 0;
+#else
+    return false;
+#endif
+}
+
+hid_t HDF5IOHandlerImpl::pageBufferedFileAccessProperty() const
+{
+    hid_t fapl = H5Pcopy(
+        m_fileAccessProperty == H5P_DEFAULT ? H5P_FILE_ACCESS_DEFAULT
+                                            : m_fileAccessProperty);
+    VERIFY(
+        fapl >= 0,
+        "[HDF5] Internal error: Failed to copy HDF5 file access property");
+#if H5_VERSION_GE(1, 10, 1)
+    herr_t status =
+        H5Pset_page_buffer_size(fapl, *m_fileConfig.pageBufferSize, 0, 0);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set page buffer size of HDF5 file "
+        "access property");
+#endif
+    return fapl;
+}
+
+hid_t HDF5IOHandlerImpl::openH5File(std::string const &name, unsigned flags)
+{
+    if (!usePageBuffer())
+    {
+        return H5Fopen(name.c_str(), flags, m_fileAccessProperty);
+    }
+    hid_t fapl = pageBufferedFileAccessProperty();
+    hid_t file_id;
+    /*
+     * page buffering fails for files without paged file space strategy or
+     * with pages larger than the page buffer
+     */
+    H5E_BEGIN_TRY
+    {
+        file_id = H5Fopen(name.c_str(), flags, fapl);
+    }
+    H5E_END_TRY;
+    herr_t status = H5Pclose(fapl);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to close HDF5 file access property");
+    if (file_id < 0)
+    {
+        file_id = H5Fopen(name.c_str(), flags, m_fileAccessProperty);
+        if (file_id >= 0 && !m_warnedPageBuffer)
+        {
+            std::cerr << "Warning: HDF5 file '" << name
+                      << "' does not use the paged file space strategy or "
+                         "its pages exceed the page buffer size, opening "
+                         "without page buffering."
+                      << std::endl;
+            m_warnedPageBuffer = true;
+        }
+    }
+    return file_id;
+}
+
+hid_t HDF5IOHandlerImpl::datasetTransferProperty(Writable *writable) const
+{
+    std::optional<TransferMode> mode = m_flushTransferMode;
+    if (!mode.has_value())
+    {
+        if (auto it = m_datasetTransferModes.find(writable);
+            it != m_datasetTransferModes.end())
+        {
+            mode = it->second;
+        }
+        else
+        {
+            mode = m_globalDatasetConfig.transfer;
+        }
+    }
+    if (!mode.has_value())
+    {
+        return m_datasetTransferProperty;
+    }
+    switch (*mode)
+    {
+    case TransferMode::Collective:
+        return m_collectiveTransferProperty;
+    case TransferMode::Independent:
+        return m_independentTransferProperty;
+    }
+    return m_datasetTransferProperty;
+}
+
+hid_t HDF5IOHandlerImpl::datasetAccessProperty(Writable *writable) const
+{
+    std::optional<ChunkCache> chunkCache = m_globalDatasetConfig.chunkCache;
+    if (auto it = m_datasetChunkCaches.find(writable);
+        it != m_datasetChunkCaches.end())
+    {
+        chunkCache = it->second;
+    }
+    if (!chunkCache.has_value())
+    {
+        return H5P_DEFAULT;
+    }
+    hid_t dapl = H5Pcreate(H5P_DATASET_ACCESS);
+    VERIFY(
+        dapl >= 0,
+        "[HDF5] Internal error: Failed to create HDF5 dataset access "
+        "property");
+    herr_t status = H5Pset_chunk_cache(
+        dapl, chunkCache->slots, chunkCache->size, chunkCache->w0);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set chunk cache of HDF5 dataset "
+        "access property");
+    return dapl;
+}
+
+auto HDF5IOHandlerImpl::parseFilters(nlohmann::json const &filters)
+    -> std::vector<DatasetConfig::Filter>
+{
+    if (!filters.is_array())
+    {
+        throw error::BackendConfigSchema(
+            {"hdf5", "dataset", "filters"},
+            "Must be an array of filter specifications.");
+    }
+    // ID, default flags, default client data
+    static std::map<std::string, DatasetConfig::Filter> const knownFilters{
+        {"deflate", {H5Z_FILTER_DEFLATE, H5Z_FLAG_OPTIONAL, {6}}},
+        {"shuffle", {H5Z_FILTER_SHUFFLE, H5Z_FLAG_OPTIONAL, {}}},
+        {"fletcher32", {H5Z_FILTER_FLETCHER32, H5Z_FLAG_MANDATORY, {}}},
+        {"szip",
+         {H5Z_FILTER_SZIP, H5Z_FLAG_OPTIONAL, {H5_SZIP_NN_OPTION_MASK, 16}}}};
+
+    std::vector<DatasetConfig::Filter> res;
+    for (auto const &filterConfig : filters)
+    {
+        if (!filterConfig.is_object() || !filterConfig.contains("type"))
+        {
+            throw error::BackendConfigSchema(
+                {"hdf5", "dataset", "filters"},
+                "Each filter must be specified as an object with a key "
+                "'type'.");
+        }
+        DatasetConfig::Filter filter;
+        auto const &type = filterConfig.at("type");
+        std::string typeName;
+        if (type.is_number_unsigned())
+        {
+            // filter by ID, e.g. a registered plugin filter
+            filter = {type.get<H5Z_filter_t>(), H5Z_FLAG_OPTIONAL, {}};
+        }
+        else
+        {
+            auto maybeType = json::asLowerCaseStringDynamic(type);
+            if (!maybeType.has_value())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "type"},
+                    "Must be a filter name or a numeric filter ID.");
+            }
+            typeName = std::move(*maybeType);
+            if (typeName == "gzip" || typeName == "zlib")
+            {
+                typeName = "deflate";
+            }
+            auto it = knownFilters.find(typeName);
+            if (it == knownFilters.end())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "type"},
+                    "Unknown filter '" + typeName +
+                        "'. Use a numeric filter ID for plugin filters.");
+            }
+            filter = it->second;
+        }
+
+        if (!filterConfig.contains("parameters"))
+        {
+            res.push_back(std::move(filter));
+            continue;
+        }
+        auto const &parameters = filterConfig.at("parameters");
+        auto getUnsigned = [&parameters](char const *key, unsigned int &dest) {
+            if (!parameters.contains(key))
+            {
+                return;
+            }
+            auto const &val = parameters.at(key);
+            if (!val.is_number_unsigned())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "parameters", key},
+                    "Must be a non-negative integer.");
+            }
+            dest = val.get<unsigned int>();
+        };
+        if (typeName == "deflate")
+        {
+            getUnsigned("level", filter.cdValues.at(0));
+            if (filter.cdValues.at(0) > 9)
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "parameters", "level"},
+                    "Must be between 0 and 9.");
+            }
+        }
+        else if (typeName == "szip")
+        {
+            if (parameters.contains("options_mask"))
+            {
+                auto mask =
+                    json::asLowerCaseStringDynamic(parameters["options_mask"]);
+                if (mask == "nn")
+                {
+                    filter.cdValues.at(0) = H5_SZIP_NN_OPTION_MASK;
+                }
+                else if (mask == "ec")
+                {
+                    filter.cdValues.at(0) = H5_SZIP_EC_OPTION_MASK;
+                }
+                else
+                {
+                    throw error::BackendConfigSchema(
+                        {"hdf5",
+                         "dataset",
+                         "filters",
+                         "parameters",
+                         "options_mask"},
+                        "Must be either 'nn' or 'ec'.");
+                }
+            }
+            getUnsigned("pixels_per_block", filter.cdValues.at(1));
+        }
+        if (parameters.contains("cd_values"))
+        {
+            auto const &cdValues = parameters.at("cd_values");
+            if (!cdValues.is_array())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "parameters", "cd_values"},
+                    "Must be an array of non-negative integers.");
+            }
+            filter.cdValues.clear();
+            for (auto const &val : cdValues)
+            {
+                if (!val.is_number_unsigned())
+                {
+                    throw error::BackendConfigSchema(
+                        {"hdf5",
+                         "dataset",
+                         "filters",
+                         "parameters",
+                         "cd_values"},
+                        "Must be an array of non-negative integers.");
+                }
+                filter.cdValues.push_back(val.get<unsigned int>());
+            }
+        }
+        if (parameters.contains("optional"))
+        {
+            auto const &optional = parameters.at("optional");
+            if (!optional.is_boolean())
+            {
+                throw error::BackendConfigSchema(
+                    {"hdf5", "dataset", "filters", "parameters", "optional"},
+                    "Must be a boolean.");
+            }
+            filter.flags =
+                optional.get<bool>() ? H5Z_FLAG_OPTIONAL : H5Z_FLAG_MANDATORY;
+        }
+        res.push_back(std::move(filter));
+    }
+    return res;
+}
+
+size_t HDF5IOHandlerImpl::datasetHandleCacheSize() const
+{
+#if openPMD_HAVE_MPI
+    /*
+     * Reads and writes may be independent in parallel HDF5, so caching
+     * handles is opt-in to keep open/close calls consistent across ranks.
+     */
+    if (m_communicator.has_value())
+    {
+        return m_datasetHandleCacheSize.value_or(0);
+    }
+#endif
+    return m_datasetHandleCacheSize.value_or(32);
+}
+
+hid_t HDF5IOHandlerImpl::acquireDataset(Writable *writable, File const &file)
+{
+    if (auto it = m_datasetHandleIndex.find(writable);
+        it != m_datasetHandleIndex.end())
+    {
+        if (it->second->fileID == file.id)
+        {
+            // mark as most recently used
+            m_datasetHandles.splice(
+                m_datasetHandles.begin(), m_datasetHandles, it->second);
+            return it->second->datasetID;
+        }
+        closeDataset(writable);
+    }
+
+    hid_t datasetAccessProperty = this->datasetAccessProperty(writable);
+    hid_t dataset_id = H5Dopen(
+        file.id,
+        concrete_h5_file_position(writable).c_str(),
+        datasetAccessProperty);
+    if (datasetAccessProperty != H5P_DEFAULT)
+    {
+        herr_t status = H5Pclose(datasetAccessProperty);
+        VERIFY(
+            status == 0,
+            "[HDF5] Internal error: Failed to close HDF5 dataset access "
+            "property");
+    }
+    size_t const cacheSize = datasetHandleCacheSize();
+    if (dataset_id < 0 || cacheSize == 0)
+    {
+        return dataset_id;
+    }
+
+    while (m_datasetHandles.size() >= cacheSize)
+    {
+        closeDataset(m_datasetHandles.back().writable);
+    }
+    m_datasetHandles.push_front({writable, file.id, dataset_id});
+    m_datasetHandleIndex[writable] = m_datasetHandles.begin();
+    return dataset_id;
+}
+
+void HDF5IOHandlerImpl::releaseDataset(hid_t dataset_id)
+{
+    if (datasetHandleCacheSize() == 0)
+    {
+        herr_t status = H5Dclose(dataset_id);
+        VERIFY(
+            status == 0, "[HDF5] Internal error: Failed to close HDF5 dataset");
+    }
+}
+
+void HDF5IOHandlerImpl::closeDataset(Writable *writable)
+{
+    auto it = m_datasetHandleIndex.find(writable);
+    if (it == m_datasetHandleIndex.end())
+    {
+        return;
+    }
+    herr_t status = H5Dclose(it->second->datasetID);
+    m_datasetHandles.erase(it->second);
+    m_datasetHandleIndex.erase(it);
+    VERIFY(
+        status == 0,
+        "[HDF5] Internal error: Failed to close cached HDF5 dataset");
+}
+
+void HDF5IOHandlerImpl::closeDatasets(std::optional<hid_t> fileID)
+{
+    for (auto it = m_datasetHandles.begin(); it != m_datasetHandles.end();)
+    {
+        if (fileID.has_value() && it->fileID != *fileID)
+        {
+            ++it;
+            continue;
+        }
+        herr_t status = H5Dclose(it->datasetID);
+        if (status < 0)
+        {
+            std::cerr << "[HDF5] Internal error: Failed to close cached HDF5 "
+                         "dataset\n";
+        }
+        m_datasetHandleIndex.erase(it->writable);
+        it = m_datasetHandles.erase(it);
+    }
+}
+
+bool HDF5IOHandlerImpl::coalesceWrites() const
+{
+#if openPMD_HAVE_MPI
+    /*
+     * With collective transfers, all ranks need to issue the same number of
+     * writes, which coalescing cannot guarantee, so it is opt-in.
+     */
+    if (m_communicator.has_value())
+    {
+        return m_coalesceWrites.value_or(false);
+    }
+#endif
+    return m_coalesceWrites.value_or(true);
+}
+
+namespace
+{
+    /*
+     * Call f(parameters) for the writes to the given dataset queued after the
+     * running write, skipping writes done already, until f returns false or a
+     * task is reached that might interfere with writing the dataset.
+     * Does nothing unless the running write is at the front of the queue.
+     */
+    template <typename F>
+    void forEachQueuedWrite(
+        std::deque<IOTask> &work,
+        Writable *writable,
+        Parameter<Operation::WRITE_DATASET> const &running,
+        F &&f)
+    {
+        if (work.empty() || work.front().parameter.get() != &running)
+        {
+            return;
+        }
+        for (auto it = std::next(work.begin()); it != work.end(); ++it)
+        {
+            if (it->writable != writable)
+            {
+                // tasks that cannot interfere with writing this dataset
+                bool const independent =
+                    it->operation == Operation::CREATE_PATH ||
+                    it->operation == Operation::CREATE_DATASET ||
+                    it->operation == Operation::EXTEND_DATASET ||
+                    it->operation == Operation::WRITE_DATASET ||
+                    it->operation == Operation::WRITE_ATT;
+                if (independent)
+                {
+                    continue;
+                }
+                return;
+            }
+            if (it->operation != Operation::WRITE_DATASET)
+            {
+                return;
+            }
+            auto &candidate = auxiliary::deref_dynamic_cast<
+                Parameter<Operation::WRITE_DATASET> >(it->parameter.get());
+            if (!candidate.data.get())
+            {
+                // written already
+                continue;
+            }
+            if (!f(candidate))
+            {
+                return;
+            }
+        }
+    }
+
+    // only small writes benefit from coalescing, bound the copying overhead
+    constexpr size_t maxCoalescedWriteSize = 1024 * 1024;
+    constexpr size_t maxCoalescedTotalSize = 16 * 1024 * 1024;
+    constexpr size_t maxCoalescedBlocks = 64;
+} // namespace
+
+void HDF5IOHandlerImpl::collectCoalescableWrites(
+    Writable *writable,
+    std::vector<Parameter<Operation::WRITE_DATASET> *> &writes)
+{
+    auto &work = m_handler->m_work;
+    auto *const front = writes.front();
+    auto const &first = *front;
+    if (first.extent.empty())
+    {
+        return;
+    }
+    size_t const elementSize = toBytes(first.dtype);
+    auto writeSize = [elementSize](auto const &write) {
+        return numberOfElements(write.extent) * elementSize;
+    };
+    size_t totalSize = writeSize(first);
+    if (totalSize == 0 || totalSize > maxCoalescedWriteSize)
+    {
+        return;
+    }
+
+    // range in the slowest varying dimension covered by the writes
+    hsize_t begin = first.offset[0];
+    hsize_t end = first.offset[0] + first.extent[0];
+    forEachQueuedWrite(work, writable, first, [&](auto &candidate) {
+        size_t const candidateSize = writeSize(candidate);
+        if (candidate.dtype != first.dtype ||
+            candidate.extent.size() != first.extent.size() ||
+            !std::equal(
+                candidate.extent.begin() + 1,
+                candidate.extent.end(),
+                first.extent.begin() + 1) ||
+            !std::equal(
+                candidate.offset.begin() + 1,
+                candidate.offset.end(),
+                first.offset.begin() + 1) ||
+            candidateSize == 0 || candidateSize > maxCoalescedWriteSize ||
+            totalSize + candidateSize > maxCoalescedTotalSize)
+        {
+            return false;
+        }
+        // overlapping writes must be applied in order
+        auto overlaps = [&candidate](auto const *write) {
+            return candidate.offset[0] < write->offset[0] + write->extent[0] &&
+                write->offset[0] < candidate.offset[0] + candidate.extent[0];
+        };
+        // cheap check first, writes usually come in order
+        if (candidate.offset[0] < end &&
+            candidate.offset[0] + candidate.extent[0] > begin &&
+            std::any_of(writes.begin(), writes.end(), overlaps))
+        {
+            return false;
+        }
+        begin = std::min<hsize_t>(begin, candidate.offset[0]);
+        end = std::max<hsize_t>(end, candidate.offset[0] + candidate.extent[0]);
+        writes.push_back(&candidate);
+        totalSize += candidateSize;
+        return true;
+    });
+
+    std::sort(writes.begin(), writes.end(), [](auto const *a, auto const *b) {
+        return a->offset[0] < b->offset[0];
+    });
+    /*
+     * Selections made of many hyperslabs are slow in HDF5, only coalesce if
+     * most of the writes are adjacent.
+     */
+    size_t blocks = 1;
+    for (size_t i = 1; i < writes.size(); ++i)
+    {
+        if (writes[i]->offset[0] !=
+            writes[i - 1]->offset[0] + writes[i - 1]->extent[0])
+        {
+            ++blocks;
+        }
+    }
+    if (blocks > maxCoalescedBlocks)
+    {
+        writes = {front};
+    }
+}
+
+bool HDF5IOHandlerImpl::directChunkIO() const
+{
+#if openPMD_HAVE_MPI
+    // H5Dwrite_chunk() and H5Dread_chunk() are serial only
+    if (m_communicator.has_value())
+    {
+        return false;
+    }
+#endif
+#if H5_VERSION_GE(1, 10, 3)
+    return m_directChunkIO;
+#else
+    return false;
+#endif
+}
+
+std::optional<HDF5IOHandlerImpl::DirectChunkLayout> const &
+HDF5IOHandlerImpl::directChunkLayout(
+    Writable *writable, hid_t dataset_id, Datatype dtype)
+{
+    if (auto it = m_directChunkLayouts.find(writable);
+        it != m_directChunkLayouts.end())
+    {
+        return it->second;
+    }
+    auto &layout = m_directChunkLayouts[writable];
+
+    hid_t dcpl = H5Dget_create_plist(dataset_id);
+    VERIFY(
+        dcpl >= 0,
+        "[HDF5] Internal error: Failed to get dataset creation property list "
+        "during dataset access");
+    unsigned chunkOptions = 0;
+    int const ndims = H5Pget_layout(dcpl) == H5D_CHUNKED
+        ? H5Pget_chunk(dcpl, 0, nullptr)
+        : -1;
+    if (ndims > 0 && H5Pget_chunk_opts(dcpl, &chunkOptions) >= 0 &&
+        !(chunkOptions & H5D_CHUNK_DONT_FILTER_PARTIAL_CHUNKS))
+    {
+        std::vector<hsize_t> chunkDims(ndims);
+        auto filters = detail::directChunkFilters(dcpl);
+        // without filters, H5Dwrite() has nothing to gain from bypassing
+        if (H5Pget_chunk(dcpl, ndims, chunkDims.data()) == ndims && filters &&
+            !filters->empty())
+        {
+            hid_t memoryType = m_getH5DataType.native(dtype);
+            hid_t fileType = H5Dget_type(dataset_id);
+            // chunks are stored without datatype conversion
+            if (memoryType >= 0 && fileType >= 0 &&
+                H5Tequal(memoryType, fileType) > 0)
+            {
+                layout = DirectChunkLayout{
+                    dtype, toBytes(dtype), std::move(chunkDims), *filters};
+            }
+            if (fileType >= 0)
+            {
+                H5Tclose(fileType);
+            }
+        }
+    }
+    herr_t status = H5Pclose(dcpl);
+    VERIFY(
+        status == 0,
+        "[HDF5] Internal error: Failed to close dataset creation property "
+        "list during dataset access");
+    return layout;
+}
+
+auxiliary::ThreadPool &HDF5IOHandlerImpl::chunkThreadPool()
+{
+    if (!m_chunkThreadPool)
+    {
+        unsigned threads = m_directChunkThreads;
+        if (threads == 0)
+        {
+            threads = std::max(1u, std::thread::hardware_concurrency());
+        }
+        m_chunkThreadPool = std::make_unique<auxiliary::ThreadPool>(threads);
+    }
+    return *m_chunkThreadPool;
+}
+
+namespace
+{
+    // bound the memory held by filtered chunks waiting to be written
+    constexpr size_t maxDirectChunkBatchSize = 64 * 1024 * 1024;
+
+    /*
+     * A block is chunk-aligned if it starts at chunk boundaries and ends at
+     * chunk boundaries or at the end of the dataset, i.e. it consists of
+     * whole chunks.
+     */
+    bool isChunkAligned(
+        Offset const &offset,
+        Extent const &extent,
+        std::vector<hsize_t> const &dims,
+        std::vector<hsize_t> const &chunkDims)
+    {
+        if (extent.size() != dims.size() || chunkDims.size() != dims.size())
+        {
+            return false;
+        }
+        for (size_t d = 0; d < dims.size(); ++d)
+        {
+            if (extent[d] == 0 || offset[d] % chunkDims[d] != 0 ||
+                (extent[d] % chunkDims[d] != 0 &&
+                 offset[d] + extent[d] != dims[d]))
+            {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /*
+     * Call f(offsetInBlock) for the chunks of a chunk-aligned block, in
+     * row-major order.
+     */
+    template <typename F>
+    void forEachChunk(
+        Extent const &extent, std::vector<hsize_t> const &chunkDims, F &&f)
+    {
+        size_t const ndim = extent.size();
+        std::vector<hsize_t> offsetInBlock(ndim, 0);
+        while (true)
+        {
+            f(offsetInBlock);
+            size_t d = ndim;
+            while (d > 0)
+            {
+                --d;
+                offsetInBlock[d] += chunkDims[d];
+                if (offsetInBlock[d] < extent[d])
+                {
+                    break;
+                }
+                offsetInBlock[d] = 0;
+                if (d == 0)
+                {
+                    return;
+                }
+            }
+        }
+    }
+
+    struct ChunkJob
+    {
+        size_t block;
+        std::vector<hsize_t> offsetInBlock;
+        std::vector<hsize_t> fileOffset;
+        std::vector<char> data;
+    };
+} // namespace
+
+bool HDF5IOHandlerImpl::writeDirectChunks(
+    Writable *writable,
+    hid_t dataset_id,
+    Parameter<Operation::WRITE_DATASET> &parameters)
+{
+#if H5_VERSION_GE(1, 10, 3)
+    auto const &layout =
+        directChunkLayout(writable, dataset_id, parameters.dtype);
+    if (!layout || layout->dtype != parameters.dtype)
+    {
+        return false;
+    }
+    auto const dims = datasetExtent(dataset_id);
+    auto aligned = [&](auto const &write) {
+        return isChunkAligned(
+            write.offset, write.extent, dims, layout->chunkDims);
+    };
+    if (!aligned(parameters))
+    {
+        return false;
+    }
+
+    // filter chunks of upcoming aligned writes in the same batch
+    std::vector<Parameter<Operation::WRITE_DATASET> *> writes{&parameters};
+    size_t totalSize =
+        numberOfElements(parameters.extent) * layout->elementSize;
+    forEachQueuedWrite(
+        m_handler->m_work, writable, parameters, [&](auto &candidate) {
+            size_t const candidateSize =
+                numberOfElements(candidate.extent) * layout->elementSize;
+            if (candidate.dtype != parameters.dtype || !aligned(candidate) ||
+                totalSize + candidateSize > maxDirectChunkBatchSize)
+            {
+                return false;
+            }
+            writes.push_back(&candidate);
+            totalSize += candidateSize;
+            return true;
+        });
+
+    // in queue order, so overlapping writes are applied in order
+    std::vector<std::vector<hsize_t> > blockExtents;
+    std::vector<ChunkJob> jobs;
+    for (size_t i = 0; i < writes.size(); ++i)
+    {
+        auto const &write = *writes[i];
+        blockExtents.emplace_back(write.extent.begin(), write.extent.end());
+        forEachChunk(
+            write.extent,
+            layout->chunkDims,
+            [&](std::vector<hsize_t> const &offsetInBlock) {
+                std::vector<hsize_t> fileOffset(offsetInBlock);
+                for (size_t d = 0; d < fileOffset.size(); ++d)
+                {
+                    fileOffset[d] += write.offset[d];
+                }
+                jobs.push_back({i, offsetInBlock, std::move(fileOffset), {}});
+            });
+    }
+
+    size_t chunkSize = layout->elementSize;
+    for (auto extent : layout->chunkDims)
+    {
+        chunkSize *= extent;
+    }
+    chunkThreadPool().parallelFor(jobs.size(), [&](size_t i) {
+        auto &job = jobs[i];
+        // edge chunks are padded with zeros
+        std::vector<char> chunk(chunkSize, 0);
+        detail::copyBlockToChunk(
+            static_cast<char const *>(writes[job.block]->data.get()),
+            blockExtents[job.block],
+            chunk.data(),
+            layout->chunkDims,
+            job.offsetInBlock,
+            layout->elementSize);
+        job.data = detail::encodeChunk(layout->filters, std::move(chunk));
+    });
+
+    hid_t const transferProperty = datasetTransferProperty(writable);
+    for (auto &job : jobs)
+    {
+        herr_t status = H5Dwrite_chunk(
+            dataset_id,
+            transferProperty,
+            0, // all filters applied
+            job.fileOffset.data(),
+            job.data.size(),
+            job.data.data());
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to write chunk of dataset " +
+                concrete_h5_file_position(writable));
+        job.data = std::vector<char>();
+    }
+
+    // mark the other writes as done, this also frees their buffers
+    for (auto *write : writes)
+    {
+        if (write != &parameters)
+        {
+            write->data = auxiliary::WriteBuffer();
+        }
+    }
+    return true;
+#else
+    (void)writable;
+    (void)dataset_id;
+    (void)parameters;
+    return false;
+#endif
+}
+
+bool HDF5IOHandlerImpl::readDirectChunks(
+    Writable *writable,
+    hid_t dataset_id,
+    Parameter<Operation::READ_DATASET> &parameters)
+{
+#if H5_VERSION_GE(1, 10, 3)
+    auto const &layout =
+        directChunkLayout(writable, dataset_id, parameters.dtype);
+    if (!layout || layout->dtype != parameters.dtype)
+    {
+        return false;
+    }
+    auto const dims = datasetExtent(dataset_id);
+    if (!isChunkAligned(
+            parameters.offset, parameters.extent, dims, layout->chunkDims))
+    {
+        return false;
+    }
+
+    std::vector<ChunkJob> jobs;
+    forEachChunk(
+        parameters.extent,
+        layout->chunkDims,
+        [&](std::vector<hsize_t> const &offsetInBlock) {
+            std::vector<hsize_t> fileOffset(offsetInBlock);
+            for (size_t d = 0; d < fileOffset.size(); ++d)
+            {
+                fileOffset[d] += parameters.offset[d];
+            }
+            jobs.push_back({0, offsetInBlock, std::move(fileOffset), {}});
+        });
+
+    // unallocated chunks must be read as fill value by H5Dread()
+    for (auto &job : jobs)
+    {
+        hsize_t storageSize = 0;
+        herr_t status;
+        H5E_BEGIN_TRY
+        {
+            status = H5Dget_chunk_storage_size(
+                dataset_id, job.fileOffset.data(), &storageSize);
+        }
+        H5E_END_TRY;
+        if (status < 0 || storageSize == 0)
+        {
+            return false;
+        }
+        job.data.resize(storageSize);
+    }
+
+    std::vector<uint32_t> filterMasks(jobs.size(), 0);
+    hid_t const transferProperty = datasetTransferProperty(writable);
+    for (size_t i = 0; i < jobs.size(); ++i)
+    {
+        herr_t status = H5Dread_chunk(
+            dataset_id,
+            transferProperty,
+            jobs[i].fileOffset.data(),
+            &filterMasks[i],
+            jobs[i].data.data());
+        VERIFY(
+            status >= 0,
+            "[HDF5] Internal error: Failed to read chunk of dataset " +
+                concrete_h5_file_position(writable));
+    }
+
+    size_t chunkSize = layout->elementSize;
+    for (auto extent : layout->chunkDims)
+    {
+        chunkSize *= extent;
+    }
+    std::vector<hsize_t> const blockExtent(
+        parameters.extent.begin(), parameters.extent.end());
+    char *data = static_cast<char *>(parameters.data.get());
+    chunkThreadPool().parallelFor(jobs.size(), [&](size_t i) {
+        auto &job = jobs[i];
+        auto chunk = detail::decodeChunk(
+            layout->filters, filterMasks[i], std::move(job.data), chunkSize);
+        detail::copyChunkToBlock(
+            chunk.data(),
+            layout->chunkDims,
+            job.offsetInBlock,
+            data,
+            blockExtent,
+            layout->elementSize);
+    });
+    return true;
+#else
+    (void)writable;
+    (void)dataset_id;
+    (void)parameters;
+    return false;
+#endif
+}
+
+std::vector<hsize_t> HDF5IOHandlerImpl::getChunkDims(
+    Writable *writable,
+    DatasetConfig const &datasetConfig,
+    std::vector<hsize_t> const &dims,
+    size_t typeSize,
+    bool resizable) const
+{
+    auto clip = [&dims, resizable](std::vector<hsize_t> chunk_dims) {
+        if (!resizable)
+        {
+            for (size_t i = 0; i < dims.size(); ++i)
+            {
+                chunk_dims[i] = std::min(chunk_dims[i], dims[i]);
+            }
+        }
+        return chunk_dims;
+    };
+
+    switch (datasetConfig.chunking)
+    {
+    case ChunkingStrategy::Explicit:
+        if (datasetConfig.chunkShape.size() == dims.size())
+        {
+            return clip(datasetConfig.chunkShape);
+        }
+        std::cerr << "Warning: HDF5 chunk shape with "
+                  << datasetConfig.chunkShape.size()
+                  << " dimensions requested for a dataset with " << dims.size()
+                  << " dimensions. Will use the 'auto' heuristic instead."
+                  << std::endl;
+        break;
+    case ChunkingStrategy::StoreChunk: {
+        /*
+         * Look ahead at the pending writes to this dataset: The first
+         * non-empty block determines the chunk shape. If a target chunk size
+         * is specified, whole multiples of the block are merged into one
+         * chunk, starting with the slowest varying dimension.
+         */
+        for (auto const &task : m_handler->m_work)
+        {
+            if (task.writable != writable ||
+                task.operation != Operation::WRITE_DATASET)
+            {
+                continue;
+            }
+            auto const &extent =
+                static_cast<Parameter<Operation::WRITE_DATASET> const *>(
+                    task.parameter.get())
+                    ->extent;
+            if (extent.size() != dims.size() ||
+                std::find(extent.begin(), extent.end(), 0) != extent.end())
+            {
+                continue;
+            }
+            std::vector<hsize_t> chunk_dims(extent.begin(), extent.end());
+            size_t chunkSize = typeSize;
+            for (auto val : chunk_dims)
+            {
+                chunkSize *= val;
+            }
+            for (size_t i = 0; i < dims.size(); ++i)
+            {
+                while (chunkSize * 2 <= datasetConfig.targetChunkSize &&
+                       chunk_dims[i] * 2 <= dims[i])
+                {
+                    chunk_dims[i] *= 2;
+                    chunkSize *= 2;
+                }
+            }
+            return clip(std::move(chunk_dims));
+        }
+        // no writes pending for this dataset, fall back to the heuristic
+        break;
+    }
+    case ChunkingStrategy::Auto:
+    case ChunkingStrategy::None:
+        break;
+    }
+    return getOptimalChunkDims(dims, typeSize, datasetConfig.targetChunkSize);
+}
+
+std::optional<HDF5IOHandlerImpl::File>
+HDF5IOHandlerImpl::getFile(Writable *writable)
+{
+    auto it = m_fileNames.find(writable);
+    if (it == m_fileNames.end())
+    {
+        return std::optional<File>();
+    }
+    auto it2 = m_fileNamesWithID.find(it->second);
+    if (it2 == m_fileNamesWithID.end())
+    {
+        return std::optional<File>();
+    }
+    File res;
+    res.name = it->second;
+    res.id = it2->second;
+    return std::make_optional(std::move(res));
+}
+
+bool HDF5IOHandlerImpl::asyncWrite() const
+{
+#if openPMD_HAVE_MPI
+    // collective writes must be issued by all ranks in the same order
+    if (m_communicator.has_value())
+    {
+        return false;
+    }
+#endif
+    return m_asyncWrite;
+}
+
+std::future<void>
+HDF5IOHandlerImpl::startAsyncWrites(std::unique_lock<HDF5Lock> lock)
+{
+    auto promise = std::make_shared<std::promise<void> >();
+    auto future = promise->get_future();
+    m_asyncWriter = std::thread([this,
+                                 promise,
+                                 lock = std::move(lock),
+                                 writes = std::move(m_asyncWrites)]() mutable {
+        try
+        {
+            issueAsyncWrites(writes);
+            lock.unlock();
+            promise->set_value();
+        }
+        catch (...)
+        {
+            if (lock.owns_lock())
+            {
+                lock.unlock();
+            }
+            m_asyncError = std::current_exception();
+            promise->set_exception(m_asyncError);
+        }
+    });
+    m_asyncWrites.clear();
+    return future;
+}
+
+void HDF5IOHandlerImpl::finishAsyncWrites()
+{
+    if (m_asyncWriter.joinable())
+    {
+        m_asyncWriter.join();
+    }
+    if (!m_asyncWrites.empty())
+    {
+        // queued by the running flush, issue them before going on
+        auto writes = std::move(m_asyncWrites);
+        m_asyncWrites.clear();
+        issueAsyncWrites(writes);
+    }
+    if (m_asyncError)
+    {
+        auto error = m_asyncError;
+        m_asyncError = nullptr;
+        std::rethrow_exception(error);
+    }
+}
+
+bool HDF5IOHandlerImpl::useSpanBasedPut() const
+{
+#if openPMD_HAVE_MPI
+    /*
+     * Span buffers are written at flush points, which need not match the
+     * collective writes of other ranks.
+     */
+    if (m_communicator.has_value())
+    {
+        return false;
+    }
+#endif
+    return m_useSpanBasedPut;
+}
+
+void HDF5IOHandlerImpl::writeSpanBuffers(
+    std::optional<std::string> const &fileName)
+{
+    for (auto it = m_spanBuffers.begin(); it != m_spanBuffers.end();)
+    {
+        auto &span = it->second;
+        if (fileName.has_value())
+        {
+            auto file = m_fileNames.find(span.writable);
+            if (file == m_fileNames.end() || file->second != *fileName)
+            {
+                ++it;
+                continue;
+            }
+        }
+        Parameter<Operation::WRITE_DATASET> write;
+        write.offset = std::move(span.offset);
+        write.extent = std::move(span.extent);
+        write.dtype = span.dtype;
+        write.data = auxiliary::WriteBuffer(std::move(span.data));
+        Writable *writable = span.writable;
+        it = m_spanBuffers.erase(it);
+        writeDataset(writable, write);
+    }
+}
+
+void HDF5IOHandlerImpl::discardSpanBuffers(std::string const &fileName)
+{
+    for (auto it = m_spanBuffers.begin(); it != m_spanBuffers.end();)
+    {
+        auto file = m_fileNames.find(it->second.writable);
+        it = file != m_fileNames.end() && file->second == fileName
+            ? m_spanBuffers.erase(it)
+            : std::next(it);
+    }
+}
+
+void HDF5IOHandlerImpl::discardSpanBuffers(Writable *writable)
+{
+    for (auto it = m_spanBuffers.begin(); it != m_spanBuffers.end();)
+    {
+        Writable *ancestor = it->second.writable;
+        while (ancestor && ancestor != writable)
+        {
+            ancestor = ancestor->parent;
+        }
+        it = ancestor ? m_spanBuffers.erase(it) : std::next(it);
+    }
+}
+
+void HDF5IOHandlerImpl::issueAsyncWrites(std::vector<AsyncWrite> &writes)
+{
+    std::optional<std::string> failed;
+    for (auto &write : writes)
+    {
+        if (!failed.has_value())
+        {
+            herr_t status = H5Dwrite(
+                write.dataset,
+                write.memoryType,
+                write.memspace,
+                write.filespace,
+                write.transferProperty,
+                write.data.get());
+            if (status < 0)
+            {
+                failed = write.position;
+            }
+        }
+        // all ids are closed, even after a failure
+        H5Sclose(write.memspace);
+        H5Sclose(write.filespace);
+        H5Dclose(write.dataset);
+        write.data.reset();
+    }
+    writes.clear();
+    if (failed.has_value())
+    {
+        throw std::runtime_error(
+            "[HDF5] Internal error: Failed to write dataset " + *failed);
+    }
+}
+#endif
+
+#if openPMD_HAVE_HDF5
+HDF5IOHandler::HDF5IOHandler(
+    std::string path, Access at, json::TracingJSON config)
+    : AbstractIOHandler(std::move(path), at)
+    , m_impl{new HDF5IOHandlerImpl(this, std::move(config))}
+{}
+
+HDF5IOHandler::~HDF5IOHandler() = default;
+
+std::future<void> HDF5IOHandler::flush(internal::ParsedFlushParams &params)
 {
-    return m_impl->flush();
+    return m_impl->flush(params);
 }
 #else
 HDF5IOHandler::HDF5IOHandler(
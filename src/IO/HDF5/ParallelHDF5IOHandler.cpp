@@ -54,9 +54,10 @@ ParallelHDF5IOHandler::ParallelHDF5IOHandler(
 
 ParallelHDF5IOHandler::~ParallelHDF5IOHandler() = default;
 
-std::future<void> ParallelHDF5IOHandler::flush(internal::ParsedFlushParams &)
+std::future<void>
+ParallelHDF5IOHandler::flush(internal::ParsedFlushParams &params)
 {
-    return m_impl->flush();
+    return m_impl->flush(params);
 }
 
 ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
@@ -68,13 +69,21 @@ ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
     // Set this so the parent class can use the MPI communicator in functions
     // that are written with special implemenations for MPI-enabled HDF5.
     m_communicator = m_mpiComm;
+    std::lock_guard<HDF5Lock> lock(hdf5Lock());
     m_datasetTransferProperty = H5Pcreate(H5P_DATASET_XFER);
-    m_fileAccessProperty = H5Pcreate(H5P_FILE_ACCESS);
-    m_fileCreateProperty = H5Pcreate(H5P_FILE_CREATE);
+    if (m_fileAccessProperty == H5P_DEFAULT)
+    {
+        m_fileAccessProperty = H5Pcreate(H5P_FILE_ACCESS);
+    }
+    if (m_fileCreateProperty == H5P_DEFAULT)
+    {
+        m_fileCreateProperty = H5Pcreate(H5P_FILE_CREATE);
+    }
 
 #if H5_VERSION_GE(1, 10, 1)
+    // opt-in: paged allocation changes the layout of every created file
     auto const hdf5_spaced_allocation =
-        auxiliary::getEnvString("OPENPMD_HDF5_PAGED_ALLOCATION", "ON");
+        auxiliary::getEnvString("OPENPMD_HDF5_PAGED_ALLOCATION", "OFF");
     if (hdf5_spaced_allocation == "ON")
     {
         auto const strPageSize = auxiliary::getEnvString(
@@ -88,6 +97,8 @@ ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
         H5Pset_file_space_page_size(m_fileCreateProperty, page_size);
     }
 #endif
+    // JSON options can overwrite env options
+    setFileCreationProperties(m_fileCreateProperty);
 
     auto const hdf5_defer_metadata =
         auxiliary::getEnvString("OPENPMD_HDF5_DEFER_METADATA", "ON");
@@ -126,6 +137,27 @@ ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
 
     herr_t status;
     status = H5Pset_dxpl_mpio(m_datasetTransferProperty, xfer_mode);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set HDF5 dataset transfer property");
+
+    // for datasets and flushes that specify hdf5.dataset.transfer
+    m_collectiveTransferProperty = H5Pcreate(H5P_DATASET_XFER);
+    m_independentTransferProperty = H5Pcreate(H5P_DATASET_XFER);
+    VERIFY(
+        m_collectiveTransferProperty >= 0 && m_independentTransferProperty >= 0,
+        "[HDF5] Internal error: Failed to create HDF5 dataset transfer "
+        "property");
+    status =
+        H5Pset_dxpl_mpio(m_collectiveTransferProperty, H5FD_MPIO_COLLECTIVE);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set HDF5 dataset transfer property");
+    status =
+        H5Pset_dxpl_mpio(m_independentTransferProperty, H5FD_MPIO_INDEPENDENT);
+    VERIFY(
+        status >= 0,
+        "[HDF5] Internal error: Failed to set HDF5 dataset transfer property");
 
 #if H5_VERSION_GE(1, 10, 0)
     status = H5Pset_all_coll_metadata_ops(
@@ -157,6 +189,19 @@ ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
     if (bytes > 1)
         H5Pset_alignment(m_fileAccessProperty, threshold, bytes);
 
+    // JSON options can overwrite env options
+    setFileAccessProperties(m_fileAccessProperty);
+
+    // collective buffering and other MPI-IO hints, e.g. cb_nodes
+    if (!m_mpiHints.empty())
+    {
+        MPI_Info_create(&m_mpiInfo);
+        for (auto const &[key, value] : m_mpiHints)
+        {
+            MPI_Info_set(m_mpiInfo, key.c_str(), value.c_str());
+        }
+    }
+
     VERIFY(
         status >= 0,
         "[HDF5] Internal error: Failed to set HDF5 dataset transfer property");
@@ -168,6 +213,8 @@ ParallelHDF5IOHandlerImpl::ParallelHDF5IOHandlerImpl(
 
 ParallelHDF5IOHandlerImpl::~ParallelHDF5IOHandlerImpl()
 {
+    std::lock_guard<HDF5Lock> lock(hdf5Lock());
+    closeDatasets();
     herr_t status;
     while (!m_openFileIDs.empty())
     {
@@ -178,6 +225,10 @@ ParallelHDF5IOHandlerImpl::~ParallelHDF5IOHandlerImpl()
                 << "Internal error: Failed to close HDF5 file (parallel)\n";
         m_openFileIDs.erase(file);
     }
+    if (m_mpiInfo != MPI_INFO_NULL)
+    {
+        MPI_Info_free(&m_mpiInfo);
+    }
 }
 #else
 #if openPMD_HAVE_MPI
@@ -130,6 +130,9 @@ namespace internal
         case Operation::GET_BUFFER_VIEW:
             return "GET_BUFFER_VIEW";
             break;
+        case Operation::READ_BUFFER_VIEW:
+            return "READ_BUFFER_VIEW";
+            break;
         case Operation::DELETE_ATT:
             return "DELETE_ATT";
             break;
@@ -141,6 +144,8 @@ namespace internal
             break;
         case Operation::LIST_ATTS:
             return "LIST_ATTS";
+        case Operation::READ_ALL_ATTS:
+            return "READ_ALL_ATTS";
             break;
         case Operation::ADVANCE:
             return "ADVANCE";
@@ -23,6 +23,7 @@
 #include "openPMD/Datatype.hpp"
 #include "openPMD/DatatypeHelpers.hpp"
 #include "openPMD/Error.hpp"
+#include "openPMD/IO/Format.hpp"
 #include "openPMD/auxiliary/Filesystem.hpp"
 #include "openPMD/auxiliary/Memory.hpp"
 #include "openPMD/auxiliary/StringManip.hpp"
@@ -30,6 +31,7 @@
 
 #include <exception>
 #include <iostream>
+#include <map>
 #include <optional>
 
 namespace openPMD
@@ -54,9 +56,107 @@ namespace openPMD
             throw std::runtime_error((TEXT));                                  \
     }
 
-JSONIOHandlerImpl::JSONIOHandlerImpl(AbstractIOHandler *handler)
+namespace
+{
+    std::string defaultExtension(JSONIOHandlerImpl::FileFormat format)
+    {
+        using FF = JSONIOHandlerImpl::FileFormat;
+        switch (format)
+        {
+        case FF::Json:
+            return ".json";
+        case FF::CBOR:
+            return ".cbor";
+        case FF::MessagePack:
+            return ".msgpack";
+        case FF::UBJSON:
+            return ".ubjson";
+        case FF::BSON:
+            return ".bson";
+        }
+        throw std::runtime_error("Unreachable!");
+    }
+} // namespace
+
+JSONIOHandlerImpl::JSONIOHandlerImpl(
+    AbstractIOHandler *handler,
+    openPMD::json::TracingJSON config,
+    FileFormat format,
+    std::string originalExtension)
     : AbstractIOHandlerImpl(handler)
-{}
+    , m_fileFormat{format}
+    , m_originalExtension{std::move(originalExtension)}
+{
+    if (config.json().contains("json"))
+    {
+        auto jsonConfig = config["json"];
+
+        // JSON option can overwrite the filename extension
+        if (jsonConfig.json().contains("format"))
+        {
+            std::map<std::string, FileFormat> const formatDescriptors{
+                {"json", FileFormat::Json},
+                {"cbor", FileFormat::CBOR},
+                {"msgpack", FileFormat::MessagePack},
+                {"ubjson", FileFormat::UBJSON},
+                {"bson", FileFormat::BSON}};
+            auto maybeFormat = openPMD::json::asLowerCaseStringDynamic(
+                jsonConfig["format"].json());
+            if (!maybeFormat.has_value())
+            {
+                throw error::BackendConfigSchema(
+                    {"json", "format"}, "Must be convertible to string type.");
+            }
+            auto it = formatDescriptors.find(*maybeFormat);
+            if (it == formatDescriptors.end())
+            {
+                throw error::BackendConfigSchema(
+                    {"json", "format"},
+                    "Unknown file format specified: " + *maybeFormat);
+            }
+            m_fileFormat = it->second;
+        }
+
+        // unused params
+        auto shadow = jsonConfig.invertShadow();
+        if (shadow.size() > 0)
+        {
+            switch (jsonConfig.originallySpecifiedAs)
+            {
+            case openPMD::json::SupportedLanguages::JSON:
+                std::cerr << "Warning: parts of the backend configuration for "
+                             "JSON remain unused:\n"
+                          << shadow << std::endl;
+                break;
+            case openPMD::json::SupportedLanguages::TOML: {
+                auto asToml = openPMD::json::jsonToToml(shadow);
+                std::cerr << "Warning: parts of the backend configuration for "
+                             "JSON remain unused:\n"
+                          << asToml << std::endl;
+                break;
+            }
+            }
+        }
+    }
+
+    /*
+     * Keep an explicitly given extension of the JSON family, otherwise
+     * (no extension or the one of another backend) fall back to the default
+     * extension of the chosen encoding.
+     */
+    switch (determineFormat(m_originalExtension))
+    {
+    case Format::JSON:
+    case Format::JSON_CBOR:
+    case Format::JSON_MSGPACK:
+    case Format::JSON_UBJSON:
+    case Format::JSON_BSON:
+        break;
+    default:
+        m_originalExtension = defaultExtension(m_fileFormat);
+        break;
+    }
+}
 
 JSONIOHandlerImpl::~JSONIOHandlerImpl() = default;
 
@@ -80,11 +180,7 @@ void JSONIOHandlerImpl::createFile(
 
     if (!writable->written)
     {
-        std::string name = parameters.name;
-        if (!auxiliary::ends_with(name, ".json"))
-        {
-            name += ".json";
-        }
+        std::string name = withExtension(parameters.name);
 
         auto res_pair = getPossiblyExisting(name);
         auto fullPathToFile = fullPath(std::get<0>(res_pair));
@@ -132,12 +228,7 @@ void JSONIOHandlerImpl::createFile(
 void JSONIOHandlerImpl::checkFile(
     Writable *, Parameter<Operation::CHECK_FILE> &parameters)
 {
-    std::string name = parameters.name;
-    if (!auxiliary::ends_with(name, ".json"))
-    {
-        name += ".json";
-    }
-    name = fullPath(name);
+    std::string name = fullPath(withExtension(parameters.name));
     using FileExists = Parameter<Operation::CHECK_FILE>::FileExists;
     *parameters.fileExists =
         (auxiliary::file_exists(name) || auxiliary::directory_exists(name))
@@ -521,11 +612,7 @@ void JSONIOHandlerImpl::openFile(
             "Supplied directory is not valid: " + m_handler->directory);
     }
 
-    std::string name = parameter.name;
-    if (!auxiliary::ends_with(name, ".json"))
-    {
-        name += ".json";
-    }
+    std::string name = withExtension(parameter.name);
 
     auto file = std::get<0>(getPossiblyExisting(name));
 
@@ -608,9 +695,7 @@ void JSONIOHandlerImpl::deleteFile(
         return;
     }
 
-    auto filename = auxiliary::ends_with(parameters.name, ".json")
-        ? parameters.name
-        : parameters.name + ".json";
+    auto filename = withExtension(parameters.name);
 
     auto tuple = getPossiblyExisting(filename);
     if (!std::get<2>(tuple))
@@ -939,6 +1024,9 @@ JSONIOHandlerImpl::getFilehandle(File fileName, Access access)
         "[JSON] Tried opening a file that has been overwritten or deleted.")
     auto path = fullPath(std::move(fileName));
     auto fs = std::make_shared<std::fstream>();
+    std::ios_base::openmode mode = m_fileFormat == FileFormat::Json
+        ? std::ios_base::openmode{}
+        : std::ios_base::binary;
     if (access::write(access))
     {
         /*
@@ -948,16 +1036,25 @@ JSONIOHandlerImpl::getFilehandle(File fileName, Access access)
          * equivalent, but the openPMD frontend exposes no reading
          * functionality in APPEND mode.
          */
-        fs->open(path, std::ios_base::out | std::ios_base::trunc);
+        fs->open(path, std::ios_base::out | std::ios_base::trunc | mode);
     }
     else
     {
-        fs->open(path, std::ios_base::in);
+        fs->open(path, std::ios_base::in | mode);
     }
     VERIFY(fs->good(), "[JSON] Failed opening a file '" + path + "'");
     return fs;
 }
 
+std::string JSONIOHandlerImpl::withExtension(std::string name) const
+{
+    if (!auxiliary::ends_with(name, m_originalExtension))
+    {
+        name += m_originalExtension;
+    }
+    return name;
+}
+
 std::string JSONIOHandlerImpl::fullPath(File fileName)
 {
     return fullPath(*fileName);
@@ -1167,8 +1264,33 @@ std::shared_ptr<nlohmann::json> JSONIOHandlerImpl::obtainJsonContents(File file)
     // read from file
     auto fh = getFilehandle(file, Access::READ_ONLY);
     std::shared_ptr<nlohmann::json> res = std::make_shared<nlohmann::json>();
-    *fh >> *res;
-    VERIFY(fh->good(), "[JSON] Failed reading from a file.");
+    switch (m_fileFormat)
+    {
+    case FileFormat::Json:
+        *fh >> *res;
+        VERIFY(fh->good(), "[JSON] Failed reading from a file.");
+        break;
+    /*
+     * The binary parsers consume the stream up to its end, so only check
+     * for actual failures, not for EOF.
+     */
+    case FileFormat::CBOR:
+        *res = nlohmann::json::from_cbor(*fh);
+        VERIFY(!fh->fail(), "[JSON] Failed reading from a file.");
+        break;
+    case FileFormat::MessagePack:
+        *res = nlohmann::json::from_msgpack(*fh);
+        VERIFY(!fh->fail(), "[JSON] Failed reading from a file.");
+        break;
+    case FileFormat::UBJSON:
+        *res = nlohmann::json::from_ubjson(*fh);
+        VERIFY(!fh->fail(), "[JSON] Failed reading from a file.");
+        break;
+    case FileFormat::BSON:
+        *res = nlohmann::json::from_bson(*fh);
+        VERIFY(!fh->fail(), "[JSON] Failed reading from a file.");
+        break;
+    }
     m_jsonVals.emplace(file, res);
     return res;
 }
@@ -1193,7 +1315,24 @@ void JSONIOHandlerImpl::putJsonContents(
     {
         auto fh = getFilehandle(filename, Access::CREATE);
         (*it->second)["platform_byte_widths"] = platformSpecifics();
-        *fh << *it->second << std::endl;
+        switch (m_fileFormat)
+        {
+        case FileFormat::Json:
+            *fh << *it->second << std::endl;
+            break;
+        case FileFormat::CBOR:
+            nlohmann::json::to_cbor(*it->second, *fh);
+            break;
+        case FileFormat::MessagePack:
+            nlohmann::json::to_msgpack(*it->second, *fh);
+            break;
+        case FileFormat::UBJSON:
+            nlohmann::json::to_ubjson(*it->second, *fh);
+            break;
+        case FileFormat::BSON:
+            nlohmann::json::to_bson(*it->second, *fh);
+            break;
+        }
         VERIFY(fh->good(), "[JSON] Failed writing data to disk.")
         m_jsonVals.erase(it);
         if (unsetDirty)
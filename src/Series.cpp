@@ -2176,6 +2176,16 @@ void Series::parseJsonOptions(TracingJSON &options, ParsedInput &input)
                     // If the file ending was more explicit, keep it.
                     // -> Nothing to do
                 }
+                else if (
+                    backend == "json" &&
+                    (input.format == Format::JSON_CBOR ||
+                     input.format == Format::JSON_MSGPACK ||
+                     input.format == Format::JSON_UBJSON ||
+                     input.format == Format::JSON_BSON))
+                {
+                    // Same for the binary encodings of the JSON backend
+                    // -> Nothing to do
+                }
                 else if (
                     input.format != Format::DUMMY &&
                     suffix(input.format) != suffix(it->second))
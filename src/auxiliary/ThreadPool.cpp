@@ -0,0 +1,124 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "openPMD/auxiliary/ThreadPool.hpp"
+
+namespace openPMD::auxiliary
+{
+ThreadPool::ThreadPool(unsigned threads)
+{
+    for (unsigned i = 1; i < threads; ++i)
+    {
+        m_workers.emplace_back([this]() { work(); });
+    }
+}
+
+ThreadPool::~ThreadPool()
+{
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_stop = true;
+    }
+    m_wake.notify_all();
+    for (auto &worker : m_workers)
+    {
+        worker.join();
+    }
+}
+
+void ThreadPool::parallelFor(size_t n, std::function<void(size_t)> const &task)
+{
+    if (n == 0)
+    {
+        return;
+    }
+    auto batch = std::make_shared<Batch>();
+    batch->task = &task;
+    batch->n = n;
+    if (n > 1 && !m_workers.empty())
+    {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_batch = batch;
+        }
+        m_wake.notify_all();
+    }
+    run(*batch);
+
+    std::unique_lock<std::mutex> lock(m_mutex);
+    m_done.wait(lock, [&batch]() { return batch->done == batch->n; });
+    if (m_batch == batch)
+    {
+        m_batch.reset();
+    }
+    if (batch->error)
+    {
+        std::rethrow_exception(batch->error);
+    }
+}
+
+void ThreadPool::run(Batch &batch)
+{
+    // workers that pick up a finished batch find no indices left
+    for (size_t i = batch.next++; i < batch.n; i = batch.next++)
+    {
+        std::exception_ptr error;
+        try
+        {
+            (*batch.task)(i);
+        }
+        catch (...)
+        {
+            error = std::current_exception();
+        }
+        std::lock_guard<std::mutex> lock(m_mutex);
+        if (error && !batch.error)
+        {
+            batch.error = error;
+        }
+        if (++batch.done == batch.n)
+        {
+            m_done.notify_all();
+        }
+    }
+}
+
+void ThreadPool::work()
+{
+    std::shared_ptr<Batch> seen;
+    while (true)
+    {
+        std::shared_ptr<Batch> batch;
+        {
+            std::unique_lock<std::mutex> lock(m_mutex);
+            m_wake.wait(lock, [this, &seen]() {
+                return m_stop || (m_batch && m_batch != seen);
+            });
+            if (m_stop)
+            {
+                return;
+            }
+            batch = m_batch;
+        }
+        seen = batch;
+        run(*batch);
+    }
+}
+} // namespace openPMD::auxiliary
@@ -241,9 +241,27 @@ void Attributable::flushAttributes(internal::FlushParams const &flushParams)
 void Attributable::readAttributes(ReadMode mode)
 {
     auto &attri = get();
+    /*
+     * Backends that support it read all attributes in a single task,
+     * otherwise list them first and read them one by one.
+     */
+    bool const readAll = IOHandler()->supportsReadAllAttributes();
+    Parameter<Operation::READ_ALL_ATTS> aReadAll;
     Parameter<Operation::LIST_ATTS> aList;
-    IOHandler()->enqueue(IOTask(this, aList));
-    IOHandler()->flush(internal::defaultFlushParams);
+    if (readAll)
+    {
+        IOHandler()->enqueue(IOTask(this, aReadAll));
+        IOHandler()->flush(internal::defaultFlushParams);
+        for (auto const &pair : *aReadAll.attributes)
+        {
+            aList.attributes->push_back(pair.first);
+        }
+    }
+    else
+    {
+        IOHandler()->enqueue(IOTask(this, aList));
+        IOHandler()->flush(internal::defaultFlushParams);
+    }
     std::vector<std::string> written_attributes = attributes();
 
     /* std::set_difference requires sorted ranges */
@@ -278,20 +296,31 @@ void Attributable::readAttributes(ReadMode mode)
 
     for (auto const &att_name : tmpAttributes)
     {
-        aRead.name = att_name;
         std::string att = auxiliary::strip(att_name, {'\0'});
-        IOHandler()->enqueue(IOTask(this, aRead));
-        try
+        Attribute a(0);
+        Datatype dtype;
+        if (readAll)
         {
-            IOHandler()->flush(internal::defaultFlushParams);
+            a = aReadAll.attributes->at(att_name);
+            dtype = a.dtype;
         }
-        catch (unsupported_data_error const &e)
+        else
         {
-            std::cerr << "Skipping non-standard attribute " << att << " ("
-                      << e.what() << ")\n";
-            continue;
+            aRead.name = att_name;
+            IOHandler()->enqueue(IOTask(this, aRead));
+            try
+            {
+                IOHandler()->flush(internal::defaultFlushParams);
+            }
+            catch (unsupported_data_error const &e)
+            {
+                std::cerr << "Skipping non-standard attribute " << att << " ("
+                          << e.what() << ")\n";
+                continue;
+            }
+            a = Attribute(*aRead.resource);
+            dtype = *aRead.dtype;
         }
-        Attribute a(*aRead.resource);
 
         auto guardUnitDimension = [this](std::string const &key, auto vector) {
             if (key == "unitDimension")
@@ -318,7 +347,7 @@ void Attributable::readAttributes(ReadMode mode)
             }
         };
 
-        switch (*aRead.dtype)
+        switch (dtype)
         {
         case DT::CHAR:
             setAttribute(att, a.get<char>());
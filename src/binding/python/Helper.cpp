@@ -24,6 +24,7 @@
 #include "openPMD/Series.hpp"
 #include "openPMD/cli/ls.hpp"
 #include "openPMD/helper/list_series.hpp"
+#include "openPMD/helper/merge_series.hpp"
 
 #include <sstream>
 #include <string>
@@ -44,6 +45,13 @@ void init_Helper(py::module &m)
          py::arg("series"),
          py::arg_v("longer", false, "Print more verbose output."),
          "List information about an openPMD data series")
+        .def(
+            "merge_series",
+            &helper::mergeSeries,
+            py::arg("source"),
+            py::arg("target"),
+            "Merge a file-based HDF5 series into a single HDF5 file whose "
+            "iterations link to the source files, without copying data")
         // CLI entry point
         .def(
             "_ls_run", // &cli::ls::run
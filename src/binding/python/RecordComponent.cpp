@@ -737,6 +737,39 @@ inline py::array load_chunk(RecordComponent &r, py::tuple const &slices)
     return a;
 }
 
+namespace
+{
+struct LoadChunkView
+{
+    template <typename T>
+    static py::array
+    call(RecordComponent &r, Offset const &offset, Extent const &extent)
+    {
+        std::shared_ptr<T const> view = r.loadChunkView<T>(offset, extent);
+        std::vector<ptrdiff_t> shape(extent.begin(), extent.end());
+        // the capsule keeps the backend's buffer alive as long as the array
+        auto holder = new std::shared_ptr<T const>(view);
+        py::capsule base(holder, [](void *ptr) {
+            delete static_cast<std::shared_ptr<T const> *>(ptr);
+        });
+        py::array a(dtype_to_numpy(r.getDatatype()), shape, view.get(), base);
+        // the backend's buffer might be mapped read-only
+        a.attr("setflags")(py::arg("write") = false);
+        return a;
+    }
+
+    static constexpr char const *errorMsg = "RecordComponent.load_chunk_view()";
+};
+
+template <>
+py::array LoadChunkView::call<std::string>(
+    RecordComponent &, Offset const &, Extent const &)
+{
+    throw std::runtime_error(
+        "[RecordComponent.load_chunk_view()] Only PODs allowed.");
+}
+} // namespace
+
 void init_RecordComponent(py::module &m)
 {
     py::class_<PythonDynamicMemoryView>(m, "Dynamic_Memory_View")
@@ -997,6 +1030,44 @@ void init_RecordComponent(py::module &m)
             py::arg_v(
                 "offset", Offset(1, 0u), "np.zeros(Record_Component.shape)"),
             py::arg_v("extent", Extent(1, -1u), "Record_Component.shape"))
+        .def(
+            "load_chunk_view",
+            [](RecordComponent &r,
+               Offset const &offset_in,
+               Extent const &extent_in) {
+                uint8_t ndim = r.getDimensionality();
+
+                // default arguments
+                //   offset = {0u}: expand to right dim {0u, 0u, ...}
+                Offset offset = offset_in;
+                if (offset_in.size() == 1u && offset_in.at(0) == 0u)
+                    offset = Offset(ndim, 0u);
+
+                //   extent = {-1u}: take full size
+                Extent extent(ndim, 1u);
+                if (extent_in.size() == 1u && extent_in.at(0) == -1u)
+                {
+                    extent = r.getExtent();
+                    for (uint8_t i = 0u; i < ndim; ++i)
+                        extent[i] -= offset[i];
+                }
+                else
+                    extent = extent_in;
+
+                return switchNonVectorType<LoadChunkView>(
+                    r.getDatatype(), r, offset, extent);
+            },
+            py::arg_v(
+                "offset", Offset(1, 0u), "np.zeros(Record_Component.shape)"),
+            py::arg_v("extent", Extent(1, -1u), "Record_Component.shape"),
+            R"doc(
+Load a chunk as a read-only array backed by memory of the backend.
+
+HDF5 maps contiguous, uncompressed datasets of files opened read-only
+into memory instead of copying them, other backends and layouts fall
+back to load_chunk(). As with load_chunk(), the data is available after
+the next flush point.
+)doc")
         .def(
             "load_chunk",
             [](RecordComponent &r,
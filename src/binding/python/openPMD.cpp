@@ -82,6 +82,7 @@ PYBIND11_MODULE(openpmd_api_cxx, m)
                Record
                Series
                list_series
+               merge_series
     )pbdoc";
 
     // note: order from parent to child classes
@@ -48,6 +48,7 @@ Examples:
         --outfile simData_%T.bp
     {0} --infile uncompressed.bp \\
         --outfile compressed.bp --outconfig @compressionConfig.json
+    {0} --infile simData_%T.h5 --outfile simData.h5 --link
 """.format(os.path.basename(program_name)))
 
     parser.add_argument('--infile', type=str, help='In file')
@@ -60,6 +61,11 @@ Examples:
                         type=str,
                         default='{}',
                         help='JSON config for the out file')
+    parser.add_argument('--link',
+                        action='store_true',
+                        help='Merge a file-based HDF5 series into a single '
+                        'HDF5 file whose iterations are external links to '
+                        'the in files, without copying any data')
     # MPI, default: Import mpi4py if available and openPMD is parallel,
     # but don't use if MPI size is 1 (this makes it easier to interact with
     # JSON, since that backend is unavailable in parallel)
@@ -349,6 +355,10 @@ def main():
     if not args.infile or not args.outfile:
         print("Please specify parameters --infile and --outfile.")
         sys.exit(1)
+    if args.link:
+        if not HAVE_MPI or MPI.COMM_WORLD.rank == 0:
+            io.merge_series(args.infile, args.outfile)
+        return
     if HAVE_MPI:
         communicator = MPI.COMM_WORLD
     else:
@@ -42,6 +42,11 @@ std::vector<std::string> openPMD::getFileExtensions()
 {
     std::vector<std::string> fext;
     fext.emplace_back("json");
+    // binary encodings of the JSON backend
+    fext.emplace_back("cbor");
+    fext.emplace_back("msgpack");
+    fext.emplace_back("ubjson");
+    fext.emplace_back("bson");
 #if openPMD_HAVE_ADIOS2
     fext.emplace_back("bp");
 #endif
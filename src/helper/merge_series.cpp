@@ -0,0 +1,393 @@
+/* Copyright 2023 openPMD contributors
+ *
+ * This file is part of openPMD-api.
+ *
+ * openPMD-api is free software: you can redistribute it and/or modify
+ * it under the terms of of either the GNU General Public License or
+ * the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * openPMD-api is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License and the GNU Lesser General Public License
+ * for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * and the GNU Lesser General Public License along with openPMD-api.
+ * If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "openPMD/helper/merge_series.hpp"
+
+#include "openPMD/Error.hpp"
+#include "openPMD/Series.hpp"
+#include "openPMD/auxiliary/Filesystem.hpp"
+#include "openPMD/auxiliary/StringManip.hpp"
+#include "openPMD/config.hpp"
+
+#if openPMD_HAVE_HDF5
+#include "openPMD/IO/HDF5/HDF5Auxiliary.hpp"
+
+#include <hdf5.h>
+#endif
+
+#ifdef _WIN32
+#include <direct.h>
+#else
+#include <unistd.h>
+#endif
+
+#include <algorithm>
+#include <cctype>
+#include <cerrno>
+#include <map>
+#include <regex>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <variant>
+#include <vector>
+
+namespace openPMD::helper
+{
+#if openPMD_HAVE_HDF5
+namespace
+{
+    // directory (empty if none) and file name of a path
+    std::pair<std::string, std::string> splitPath(std::string const &path)
+    {
+        auto pos = path.find_last_of(auxiliary::directory_separator);
+        if (pos == std::string::npos)
+        {
+            return {"", path};
+        }
+        return {path.substr(0, pos), path.substr(pos + 1)};
+    }
+
+    std::string currentDirectory()
+    {
+        std::vector<char> buffer(4096);
+#ifdef _WIN32
+        while (!_getcwd(buffer.data(), int(buffer.size())))
+#else
+        while (!getcwd(buffer.data(), buffer.size()))
+#endif
+        {
+            if (errno != ERANGE)
+            {
+                throw std::runtime_error(
+                    "[mergeSeries] Failed to determine the working "
+                    "directory.");
+            }
+            buffer.resize(2 * buffer.size());
+        }
+        return buffer.data();
+    }
+
+    /*
+     * Components of the absolute path of a directory, without '.' and '..'.
+     * The first component is the root, i.e. empty or a drive letter.
+     */
+    std::vector<std::string> absoluteComponents(std::string directory)
+    {
+        std::string const separators =
+            std::string("/") + auxiliary::directory_separator;
+        bool const absolute =
+            (!directory.empty() &&
+             separators.find(directory[0]) != std::string::npos) ||
+            (directory.size() > 1 && directory[1] == ':');
+        if (!absolute)
+        {
+            directory =
+                currentDirectory() + auxiliary::directory_separator + directory;
+        }
+        std::vector<std::string> res;
+        size_t begin = 0;
+        while (true)
+        {
+            auto end = directory.find_first_of(separators, begin);
+            auto component = directory.substr(
+                begin, end == std::string::npos ? end : end - begin);
+            if (res.empty())
+            {
+                res.push_back(std::move(component));
+            }
+            else if (component == "..")
+            {
+                if (res.size() > 1)
+                {
+                    res.pop_back();
+                }
+            }
+            else if (!component.empty() && component != ".")
+            {
+                res.push_back(std::move(component));
+            }
+            if (end == std::string::npos)
+            {
+                break;
+            }
+            begin = end + 1;
+        }
+        return res;
+    }
+
+    /*
+     * Path of a directory relative to another one, absolute if they are on
+     * different drives. Empty if both are the same.
+     */
+    std::string
+    relativeDirectory(std::string const &directory, std::string const &from)
+    {
+        auto const target = absoluteComponents(directory);
+        auto const base = absoluteComponents(from);
+        std::string res;
+        auto append = [&res](std::string const &component) {
+            if (!res.empty())
+            {
+                res += auxiliary::directory_separator;
+            }
+            res += component;
+        };
+        if (target[0] != base[0])
+        {
+            res = target[0];
+            for (size_t i = 1; i < target.size(); ++i)
+            {
+                res += auxiliary::directory_separator + target[i];
+            }
+            return res;
+        }
+        size_t common = 1;
+        while (common < target.size() && common < base.size() &&
+               target[common] == base[common])
+        {
+            ++common;
+        }
+        for (size_t i = common; i < base.size(); ++i)
+        {
+            append("..");
+        }
+        for (size_t i = common; i < target.size(); ++i)
+        {
+            append(target[i]);
+        }
+        return res;
+    }
+
+    /*
+     * Files of a file-based series within a directory by iteration index,
+     * pattern is a file name with expansion pattern, e.g. data_%06T.h5
+     */
+    std::map<Series::IterationIndex_t, std::string>
+    listIterationFiles(std::string const &directory, std::string const &pattern)
+    {
+        std::smatch match;
+        if (!std::regex_search(pattern, match, std::regex("%(0[0-9]+)?T")))
+        {
+            throw error::WrongAPIUsage(
+                "[mergeSeries] No expansion pattern found in '" + pattern +
+                "'.");
+        }
+        std::string const prefix = match.prefix();
+        std::string const suffix = match.suffix();
+
+        std::map<Series::IterationIndex_t, std::string> files;
+        for (auto const &file :
+             auxiliary::list_directory(directory.empty() ? "." : directory))
+        {
+            if (file.size() <= prefix.size() + suffix.size() ||
+                !auxiliary::starts_with(file, prefix) ||
+                !auxiliary::ends_with(file, suffix))
+            {
+                continue;
+            }
+            auto const digits = file.substr(
+                prefix.size(), file.size() - prefix.size() - suffix.size());
+            if (!std::all_of(digits.begin(), digits.end(), [](char c) {
+                    return std::isdigit(static_cast<unsigned char>(c));
+                }))
+            {
+                continue;
+            }
+            files.emplace(std::stoull(digits), file);
+        }
+        return files;
+    }
+
+    // closes an HDF5 object upon leaving the scope
+    struct H5Handle
+    {
+        hid_t id;
+        herr_t (*closeFunction)(hid_t);
+
+        H5Handle(hid_t id_in, herr_t (*closeFunction_in)(hid_t))
+            : id(id_in), closeFunction(closeFunction_in)
+        {}
+        H5Handle(H5Handle const &) = delete;
+        H5Handle &operator=(H5Handle const &) = delete;
+
+        ~H5Handle()
+        {
+            close();
+        }
+
+        herr_t close()
+        {
+            herr_t status = 0;
+            if (id >= 0)
+            {
+                status = closeFunction(id);
+                id = -1;
+            }
+            return status;
+        }
+    };
+} // namespace
+
+void mergeSeries(std::string const &source, std::string const &target)
+{
+    Series src(
+        source, Access::READ_ONLY, R"({"defer_iteration_parsing": true})");
+    if (src.backend() != "HDF5" ||
+        src.iterationEncoding() != IterationEncoding::fileBased)
+    {
+        throw error::WrongAPIUsage(
+            "[mergeSeries] Source must be a file-based HDF5 series, e.g. "
+            "'data_%T.h5'.");
+    }
+    // openPMD requires a basePath of the form /data/%T/
+    std::string const basePath = src.basePath();
+    auto const expansion = basePath.find("%T");
+    if (expansion == std::string::npos ||
+        basePath.find_first_not_of('/', expansion + 2) != std::string::npos)
+    {
+        throw error::WrongAPIUsage(
+            "[mergeSeries] Unsupported basePath '" + basePath + "'.");
+    }
+    std::string const groupPath = basePath.substr(0, expansion);
+
+    auto const [sourceDirectory, sourcePattern] = splitPath(source);
+    auto const targetDirectory = splitPath(target).first;
+    auto files = listIterationFiles(sourceDirectory, sourcePattern);
+    auto const linkDirectory =
+        relativeDirectory(sourceDirectory, targetDirectory);
+
+    // root attributes, the Series takes care of the group-based encoding
+    {
+        Series dest(target, Access::CREATE);
+        if (dest.backend() != "HDF5" ||
+            dest.iterationEncoding() != IterationEncoding::groupBased)
+        {
+            throw error::WrongAPIUsage(
+                "[mergeSeries] Target must be a single HDF5 file, e.g. "
+                "'data.h5'.");
+        }
+        for (auto const &key : src.attributes())
+        {
+            if (key == "iterationEncoding" || key == "iterationFormat")
+            {
+                continue;
+            }
+            std::visit(
+                [&dest, &key](auto const &value) {
+                    dest.setAttribute(key, value);
+                },
+                src.getAttribute(key).getResource());
+        }
+        dest.flush();
+    }
+
+    std::vector<Series::IterationIndex_t> iterations;
+    for (auto const &pair : src.iterations)
+    {
+        iterations.push_back(pair.first);
+    }
+
+    // other Series may be writing in the background
+    std::lock_guard<HDF5Lock> lock(hdf5Lock());
+    H5Handle file(H5Fopen(target.c_str(), H5F_ACC_RDWR, H5P_DEFAULT), H5Fclose);
+    if (file.id < 0)
+    {
+        throw std::runtime_error(
+            "[HDF5] Failed to open '" + target + "' for merging.");
+    }
+    H5Handle group(-1, H5Gclose);
+    H5E_BEGIN_TRY
+    {
+        group.id = H5Gopen(file.id, groupPath.c_str(), H5P_DEFAULT);
+    }
+    H5E_END_TRY
+    if (group.id < 0)
+    {
+        H5Handle lcpl(H5Pcreate(H5P_LINK_CREATE), H5Pclose);
+        if (lcpl.id < 0 || H5Pset_create_intermediate_group(lcpl.id, 1) < 0)
+        {
+            throw std::runtime_error(
+                "[HDF5] Failed to create the link creation property list for "
+                "merging into '" +
+                target + "'.");
+        }
+        group.id = H5Gcreate(
+            file.id, groupPath.c_str(), lcpl.id, H5P_DEFAULT, H5P_DEFAULT);
+    }
+    if (group.id < 0)
+    {
+        throw std::runtime_error(
+            "[HDF5] Failed to create group '" + groupPath + "' in '" + target +
+            "'.");
+    }
+
+    for (auto const index : iterations)
+    {
+        auto it = files.find(index);
+        if (it == files.end())
+        {
+            throw error::WrongAPIUsage(
+                "[mergeSeries] Found no file for iteration " +
+                std::to_string(index) + ".");
+        }
+        /*
+         * HDF5 looks up relative file names of external links relative to
+         * the directory of the linking file first, so the merged file can
+         * be opened from any working directory.
+         */
+        std::string linkedFile = it->second;
+        if (!linkDirectory.empty())
+        {
+            linkedFile =
+                linkDirectory + auxiliary::directory_separator + linkedFile;
+        }
+        std::string const name = std::to_string(index);
+        std::string const linkedObject = groupPath + name;
+        herr_t status = H5Lcreate_external(
+            linkedFile.c_str(),
+            linkedObject.c_str(),
+            group.id,
+            name.c_str(),
+            H5P_DEFAULT,
+            H5P_DEFAULT);
+        if (status < 0)
+        {
+            throw std::runtime_error(
+                "[HDF5] Failed to link iteration " + name + " into '" + target +
+                "'.");
+        }
+    }
+
+    group.close();
+    if (file.close() < 0)
+    {
+        throw std::runtime_error("[HDF5] Failed to close '" + target + "'.");
+    }
+}
+#else
+void mergeSeries(std::string const &, std::string const &)
+{
+    throw error::WrongAPIUsage(
+        "[mergeSeries] openPMD-api built without HDF5 support.");
+}
+#endif
+} // namespace openPMD::helper
@@ -53,7 +53,8 @@ std::vector<std::string> testedFileExtensions()
             // sst and ssc need a receiver for testing
             // bp4 is already tested via bp
             return ext == "sst" || ext == "ssc" || ext == "bp4" ||
-                ext == "toml" || ext == "json";
+                ext == "toml" || ext == "json" || ext == "cbor" ||
+                ext == "msgpack" || ext == "ubjson" || ext == "bson";
         });
     return {allExtensions.begin(), newEnd};
 }
@@ -368,6 +369,66 @@ TEST_CASE("hdf5_write_test_skip_declare", "[parallel][hdf5]")
         REQUIRE(true);
 }
 
+TEST_CASE("hdf5_transfer_modes", "[parallel][hdf5]")
+{
+    int mpi_s{-1};
+    int mpi_r{-1};
+    MPI_Comm_size(MPI_COMM_WORLD, &mpi_s);
+    MPI_Comm_rank(MPI_COMM_WORLD, &mpi_r);
+    auto mpi_size = static_cast<uint64_t>(mpi_s);
+    auto mpi_rank = static_cast<uint64_t>(mpi_r);
+    std::string const name = "../samples/parallel_transfer_modes.h5";
+    {
+        Series write(
+            name,
+            Access::CREATE,
+            MPI_COMM_WORLD,
+            R"({"hdf5": {"mpi_info": {"cb_nodes": 1,
+                                      "cb_buffer_size": 1048576}}})");
+        auto it = write.iterations[0];
+
+        // written by all ranks
+        Dataset meshDataset{Datatype::DOUBLE, {mpi_size, 10}};
+        meshDataset.options =
+            R"({"hdf5": {"dataset": {"transfer": "collective"}}})";
+        auto E_x = it.meshes["E"]["x"];
+        E_x.resetDataset(meshDataset);
+        std::vector<double> meshData(10, double(mpi_rank));
+        E_x.storeChunk(meshData, {mpi_rank, 0}, {1, 10});
+
+        // written by rank 0 only
+        Dataset particleDataset{Datatype::DOUBLE, {10}};
+        particleDataset.options =
+            R"({"hdf5": {"dataset": {"transfer": "independent"}}})";
+        auto x = it.particles["e"]["position"]["x"];
+        x.resetDataset(particleDataset);
+        std::vector<double> particleData(10, 1.);
+        if (mpi_rank == 0)
+        {
+            x.storeChunk(particleData, {0}, {10});
+        }
+        write.flush();
+
+        // overwrite the mesh, now collectively for all datasets in the flush
+        std::fill(meshData.begin(), meshData.end(), double(mpi_rank) + 0.5);
+        E_x.storeChunk(meshData, {mpi_rank, 0}, {1, 10});
+        write.flush(R"({"hdf5": {"dataset": {"transfer": "collective"}}})");
+    }
+    {
+        Series read(name, Access::READ_ONLY, MPI_COMM_WORLD);
+        auto it = read.iterations[0];
+        auto E_x =
+            it.meshes["E"]["x"].loadChunk<double>({mpi_rank, 0}, {1, 10});
+        auto x = it.particles["e"]["position"]["x"].loadChunk<double>();
+        read.flush();
+        for (size_t i = 0; i < 10; ++i)
+        {
+            REQUIRE(E_x.get()[i] == double(mpi_rank) + 0.5);
+            REQUIRE(x.get()[i] == 1.);
+        }
+    }
+}
+
 #else
 
 TEST_CASE("no_parallel_hdf5", "[parallel][hdf5]")
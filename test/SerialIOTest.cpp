@@ -25,6 +25,7 @@
 #include <list>
 #include <memory>
 #include <numeric>
+#include <random>
 #include <sstream>
 #include <stdexcept>
 #include <string>
@@ -414,6 +415,83 @@ TEST_CASE("available_chunks_test_json", "[serial][json]")
     }
 }
 
+void json_binary_encoding(
+    std::string const &filename,
+    std::string const &readFilename,
+    std::string const &config = "{}")
+{
+    std::vector<double> data{0., 1., std::nan(""), 3., 4., 5.};
+    {
+        Series write(filename, Access::CREATE, config);
+        Iteration it0 = write.iterations[0];
+        it0.setAttribute("some_string", "hello");
+        it0.setAttribute("some_vector", std::vector<int>{1, 2, 3});
+        auto E_x = it0.meshes["E"]["x"];
+        E_x.resetDataset({Datatype::DOUBLE, {2, 3}});
+        E_x.storeChunk(data, {0, 0}, {2, 3});
+        auto E_y = it0.meshes["E"]["y"];
+        E_y.resetDataset({Datatype::CDOUBLE, {2}});
+        std::vector<std::complex<double> > complexData{{1., 2.}, {3., 4.}};
+        E_y.storeChunk(complexData, {0}, {2});
+        write.flush();
+    }
+
+    {
+        Series read(readFilename, Access::READ_ONLY, config);
+        Iteration it0 = read.iterations[0];
+        REQUIRE(it0.getAttribute("some_string").get<std::string>() == "hello");
+        REQUIRE(
+            it0.getAttribute("some_vector").get<std::vector<int> >() ==
+            std::vector<int>{1, 2, 3});
+        auto E_x = it0.meshes["E"]["x"];
+        REQUIRE(E_x.getDatatype() == Datatype::DOUBLE);
+        REQUIRE(E_x.getExtent() == Extent{2, 3});
+        auto chunk = E_x.loadChunk<double>();
+        auto E_y = it0.meshes["E"]["y"];
+        REQUIRE(E_y.getDatatype() == Datatype::CDOUBLE);
+        auto complexChunk = E_y.loadChunk<std::complex<double> >();
+        read.flush();
+        for (size_t i = 0; i < data.size(); ++i)
+        {
+            if (std::isnan(data[i]))
+            {
+                REQUIRE(std::isnan(chunk.get()[i]));
+            }
+            else
+            {
+                REQUIRE(chunk.get()[i] == data[i]);
+            }
+        }
+        REQUIRE(complexChunk.get()[1] == std::complex<double>{3., 4.});
+    }
+}
+
+TEST_CASE("json_binary_encodings", "[serial][json]")
+{
+    // encoding chosen by the filename extension
+    for (auto const &ext : {"cbor", "msgpack", "ubjson", "bson"})
+    {
+        std::string filename =
+            std::string("../samples/json_binary/by_extension.") + ext;
+        json_binary_encoding(filename, filename);
+        REQUIRE(auxiliary::file_exists(filename));
+    }
+    // encoding chosen by the JSON config, extension is picked from it
+    json_binary_encoding(
+        "../samples/json_binary/by_config_%T",
+        "../samples/json_binary/by_config_%T.msgpack",
+        R"({"backend": "json", "json": {"format": "msgpack"}})");
+    REQUIRE(
+        auxiliary::file_exists("../samples/json_binary/by_config_0.msgpack"));
+    // explicit config wins over the filename extension
+    json_binary_encoding(
+        "../samples/json_binary/cbor_in_disguise.json",
+        "../samples/json_binary/cbor_in_disguise.json",
+        R"({"json": {"format": "cbor"}})");
+    REQUIRE_THROWS(Series(
+        "../samples/json_binary/cbor_in_disguise.json", Access::READ_ONLY));
+}
+
 TEST_CASE("multiple_series_handles_test", "[serial]")
 {
     /*
@@ -1289,8 +1367,15 @@ TEST_CASE("particle_patches", "[serial]")
 
 inline void dtype_test(const std::string &backend)
 {
-    bool test_long_double = (backend != "json") || sizeof(long double) <= 8;
-    bool test_long_long = (backend != "json") || sizeof(long long) <= 8;
+    // also the binary encodings of the JSON backend
+    bool const json = backend == "json" || backend == "cbor" ||
+        backend == "msgpack" || backend == "ubjson" || backend == "bson";
+    bool test_long_double = !json || sizeof(long double) <= 8;
+    bool test_long_long = !json || sizeof(long long) <= 8;
+    // BSON has no unsigned integers beyond the signed 64-bit range
+    std::vector<uint64_t> const vecUint64 = backend == "bson"
+        ? std::vector<uint64_t>({9223372036854775806u, 9223372036854775807u})
+        : std::vector<uint64_t>({18446744073709551614u, 18446744073709551615u});
     {
         Series s = Series("../samples/dtype_test." + backend, Access::CREATE);
         bool adios1 = s.backend() == "ADIOS1" || s.backend() == "MPI_ADIOS1";
@@ -1342,10 +1427,7 @@ inline void dtype_test(const std::string &backend)
         s.setAttribute("vecUint16", std::vector<uint16_t>({65534u, 65535u}));
         s.setAttribute(
             "vecUint32", std::vector<uint32_t>({4294967294u, 4294967295u}));
-        s.setAttribute(
-            "vecUint64",
-            std::vector<uint64_t>(
-                {18446744073709551614u, 18446744073709551615u}));
+        s.setAttribute("vecUint64", vecUint64);
         s.setAttribute("vecFloat", std::vector<float>({0.f, 3.40282e+38f}));
         s.setAttribute("vecDouble", std::vector<double>({0., 1.79769e+308}));
         if (test_long_double)
@@ -1470,8 +1552,7 @@ inline void dtype_test(const std::string &backend)
         s.getAttribute("vecUint32").get<std::vector<uint32_t> >() ==
         std::vector<uint32_t>({4294967294u, 4294967295u}));
     REQUIRE(
-        s.getAttribute("vecUint64").get<std::vector<uint64_t> >() ==
-        std::vector<uint64_t>({18446744073709551614u, 18446744073709551615u}));
+        s.getAttribute("vecUint64").get<std::vector<uint64_t> >() == vecUint64);
     REQUIRE(
         s.getAttribute("vecFloat").get<std::vector<float> >() ==
         std::vector<float>({0.f, 3.40282e+38f}));
@@ -2626,6 +2707,920 @@ TEST_CASE("available_chunks_test_hdf5", "[serial][json]")
     }
 }
 
+TEST_CASE("hdf5_chunking_config", "[serial][hdf5]")
+{
+    std::string name = "../samples/hdf5_chunking_config.h5";
+    constexpr unsigned height = 16;
+    std::vector<int> data(4 * 8);
+    std::iota(data.begin(), data.end(), 0);
+    {
+        Series write(
+            name,
+            Access::CREATE,
+            R"({"hdf5": {"dataset": {"target_chunk_size": 4096}}})");
+        Iteration it0 = write.iterations[0];
+
+        Dataset explicitShape{Datatype::INT, {height, 8}};
+        explicitShape.options =
+            R"({"hdf5": {"dataset": {"chunks": [4, 100]}}})";
+        auto E_x = it0.meshes["E"]["x"];
+        E_x.resetDataset(explicitShape);
+
+        Dataset wrongDimensionality{Datatype::INT, {height, 8}};
+        wrongDimensionality.options =
+            R"({"hdf5": {"dataset": {"chunks": [4]}}})";
+        auto E_y = it0.meshes["E"]["y"];
+        E_y.resetDataset(wrongDimensionality);
+
+        Dataset alignedWithWrites{Datatype::INT, {height, 8}};
+        alignedWithWrites.options =
+            R"({"hdf5": {"dataset": {"chunks": "store_chunk"}}})";
+        auto E_z = it0.meshes["E"]["z"];
+        E_z.resetDataset(alignedWithWrites);
+
+        Dataset resizable{Datatype::INT, {height / 2, 8}};
+        resizable.options = R"({
+            "resizable": true,
+            "hdf5": {"dataset": {"chunks": [2, 8]}}})";
+        auto rho = it0.meshes["rho"][RecordComponent::SCALAR];
+        rho.resetDataset(resizable);
+
+        for (unsigned offset = 0; offset < height; offset += 4)
+        {
+            E_x.storeChunk(data, {offset, 0}, {4, 8});
+            E_y.storeChunk(data, {offset, 0}, {4, 8});
+            E_z.storeChunk(data, {offset, 0}, {4, 8});
+        }
+        rho.storeChunk(data, {0, 0}, {4, 8});
+        write.flush();
+
+        rho.resetDataset(Dataset({height, 8}));
+        rho.storeChunk(data, {4, 0}, {4, 8});
+        write.flush();
+    }
+
+    {
+        Series write("../samples/hdf5_chunking_invalid.h5", Access::CREATE);
+        Dataset invalid{Datatype::INT, {height, 8}};
+        invalid.options = R"({"hdf5": {"dataset": {"chunks": [4, -1]}}})";
+        auto E_x = write.iterations[0].meshes["E"]["x"];
+        E_x.resetDataset(invalid);
+        E_x.storeChunk(data, {0, 0}, {4, 8});
+        REQUIRE_THROWS_AS(write.flush(), error::BackendConfigSchema);
+    }
+
+    {
+        Series read(name, Access::READ_ONLY);
+        Iteration it0 = read.iterations[0];
+        std::vector<std::shared_ptr<int> > chunks;
+        for (auto const &component : {"x", "y", "z"})
+        {
+            auto E = it0.meshes["E"][component];
+            REQUIRE(E.getExtent() == Extent{height, 8});
+            chunks.push_back(E.loadChunk<int>());
+        }
+        auto rho = it0.meshes["rho"][RecordComponent::SCALAR];
+        REQUIRE(rho.getExtent() == Extent{height, 8});
+        auto rhoChunk = rho.loadChunk<int>({0, 0}, {8, 8});
+        read.flush();
+        for (auto const &chunk : chunks)
+        {
+            for (size_t i = 0; i < height * 8; ++i)
+            {
+                REQUIRE(chunk.get()[i] == data[i % data.size()]);
+            }
+        }
+        for (size_t i = 0; i < 8 * 8; ++i)
+        {
+            REQUIRE(rhoChunk.get()[i] == data[i % data.size()]);
+        }
+    }
+}
+
+TEST_CASE("hdf5_filters_config", "[serial][hdf5]")
+{
+    std::string name = "../samples/hdf5_filters_config.h5";
+    std::vector<double> data(64 * 64);
+    for (size_t i = 0; i < data.size(); ++i)
+    {
+        data[i] = std::sin(0.01 * double(i));
+    }
+    {
+        Series write(name, Access::CREATE, R"(
+            {
+              "hdf5": {
+                "dataset": {
+                  "filters": [
+                    {"type": "shuffle"},
+                    {"type": "deflate", "parameters": {"level": 9}}
+                  ]
+                }
+              }
+            })");
+        Iteration it0 = write.iterations[0];
+        auto E_x = it0.meshes["E"]["x"];
+        E_x.resetDataset({Datatype::DOUBLE, {64, 64}});
+        E_x.storeChunk(data, {0, 0}, {64, 64});
+
+        // per-dataset override, including a possibly unavailable plugin
+        Dataset overridden{Datatype::DOUBLE, {64, 64}};
+        overridden.options = R"(
+            {
+              "hdf5": {
+                "dataset": {
+                  "chunks": "none",
+                  "filters": [
+                    {"type": "fletcher32"},
+                    {"type": 32001, "parameters": {"cd_values": [0, 0, 0]}}
+                  ]
+                }
+              }
+            })";
+        auto E_y = it0.meshes["E"]["y"];
+        E_y.resetDataset(overridden);
+        E_y.storeChunk(data, {0, 0}, {64, 64});
+
+        Dataset unfiltered{Datatype::DOUBLE, {64, 64}};
+        unfiltered.options = R"({"hdf5": {"dataset": {"filters": []}}})";
+        auto E_z = it0.meshes["E"]["z"];
+        E_z.resetDataset(unfiltered);
+        E_z.storeChunk(data, {0, 0}, {64, 64});
+        write.flush();
+    }
+
+    for (auto const &invalidFilters :
+         {R"([{"type": "unknown_filter"}])",
+          R"([{"type": "deflate", "parameters": {"level": 10}}])",
+          R"({"type": "deflate"})"})
+    {
+        Series write("../samples/hdf5_filters_invalid.h5", Access::CREATE);
+        Dataset invalid{Datatype::DOUBLE, {64, 64}};
+        invalid.options = std::string(R"({"hdf5": {"dataset": {"filters": )") +
+            invalidFilters + "}}}";
+        auto E_x = write.iterations[0].meshes["E"]["x"];
+        E_x.resetDataset(invalid);
+        E_x.storeChunk(data, {0, 0}, {64, 64});
+        REQUIRE_THROWS_AS(write.flush(), error::BackendConfigSchema);
+    }
+
+    {
+        Series read(name, Access::READ_ONLY);
+        Iteration it0 = read.iterations[0];
+        std::vector<std::shared_ptr<double> > chunks;
+        for (auto const &component : {"x", "y", "z"})
+        {
+            chunks.push_back(it0.meshes["E"][component].loadChunk<double>());
+        }
+        read.flush();
+        for (auto const &chunk : chunks)
+        {
+            for (size_t i = 0; i < data.size(); ++i)
+            {
+                REQUIRE(chunk.get()[i] == data[i]);
+            }
+        }
+    }
+}
+
+TEST_CASE("hdf5_cache_config", "[serial][hdf5]")
+{
+    std::vector<float> data(128 * 128);
+    std::iota(data.begin(), data.end(), 0.f);
+    std::string const config = R"(
+        {
+          "hdf5": {
+            "file": {
+              "chunk_cache": {"slots": 12421, "size": 16777216, "w0": 1},
+              "metadata_cache": {"initial_size": 67108864, "evictions": false},
+              "alignment": {"threshold": 1024, "boundary": 4096}
+            },
+            "dataset": {
+              "chunks": [1, 128],
+              "chunk_cache": {"size": 0}
+            }
+          }
+        })";
+    std::string const pagedConfig = R"(
+        {
+          "hdf5": {
+            "file": {
+              "page_buffer_size": 1048576
+            }
+          }
+        })";
+
+    for (auto const &[name, writeConfig] :
+         {std::make_pair("../samples/hdf5_cache_config.h5", config),
+          std::make_pair("../samples/hdf5_cache_config_paged.h5", pagedConfig)})
+    {
+        Series write(name, Access::CREATE, writeConfig);
+        auto rho = write.iterations[0].meshes["rho"][RecordComponent::SCALAR];
+        rho.resetDataset({Datatype::FLOAT, {128, 128}});
+        rho.storeChunk(data, {0, 0}, {128, 128});
+
+        // per-dataset override of the chunk cache
+        Dataset cached{Datatype::FLOAT, {128, 128}};
+        cached.options = R"(
+            {"hdf5": {"dataset": {"chunk_cache": {"size": 1048576}}}})";
+        auto E_x = write.iterations[0].meshes["E"]["x"];
+        E_x.resetDataset(cached);
+        E_x.storeChunk(data, {0, 0}, {128, 128});
+        write.flush();
+    }
+
+    for (auto const &invalidConfig :
+         {R"({"hdf5": {"file": {"chunk_cache": {"w0": 2}}}})",
+          R"({"hdf5": {"file": {"alignment": {"boundary": 0}}}})",
+          R"({"hdf5": {"file": {"metadata_cache": {"initial_size": -1}}}})",
+          R"({"hdf5": {"dataset": {"chunk_cache": 1048576}}})"})
+    {
+        REQUIRE_THROWS_AS(
+            Series(
+                "../samples/hdf5_cache_config_invalid.h5",
+                Access::CREATE,
+                invalidConfig),
+            error::BackendConfigSchema);
+    }
+
+    // strided reads, also reading a non-paged file with page buffering
+    for (auto const &[name, readConfig] :
+         {std::make_pair("../samples/hdf5_cache_config.h5", config),
+          std::make_pair("../samples/hdf5_cache_config.h5", pagedConfig),
+          std::make_pair("../samples/hdf5_cache_config_paged.h5", pagedConfig)})
+    {
+        Series read(name, Access::READ_ONLY, readConfig);
+        auto rho = read.iterations[0].meshes["rho"][RecordComponent::SCALAR];
+        auto E_x = read.iterations[0].meshes["E"]["x"];
+        auto rhoColumn = rho.loadChunk<float>({0, 7}, {128, 1});
+        auto E_xColumn = E_x.loadChunk<float>({0, 42}, {128, 1});
+        read.flush();
+        for (size_t i = 0; i < 128; ++i)
+        {
+            REQUIRE(rhoColumn.get()[i] == data[i * 128 + 7]);
+            REQUIRE(E_xColumn.get()[i] == data[i * 128 + 42]);
+        }
+    }
+}
+
+TEST_CASE("hdf5_file_space_config", "[serial][hdf5]")
+{
+    std::string const name = "../samples/hdf5_file_space_config.h5";
+    // config, whether the file is allocated in pages of 64KiB
+    for (auto const &[config, paged] :
+         {std::make_pair(
+              R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                                   "page_size": 65536}}}})",
+              true),
+          std::make_pair(
+              R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                                   "page_size": 65536,
+                                                   "persist": true,
+                                                   "threshold": 16},
+                                    "page_buffer_size": 1048576}}})",
+              true),
+          std::make_pair(
+              R"({"hdf5": {"file": {"file_space": {"strategy": "aggr"}}}})",
+              false),
+          std::make_pair(
+              R"({"hdf5": {"file": {"file_space": {"strategy": "none"}}}})",
+              false)})
+    {
+        {
+            Series write(name, Access::CREATE, config);
+            auto &it = write.iterations[0];
+            for (size_t i = 0; i < 50; ++i)
+            {
+                auto rc = it.meshes["E" + std::to_string(i)]["x"];
+                rc.resetDataset({Datatype::INT, {10}});
+                rc.makeConstant(int(i));
+                rc.setAttribute("index", i);
+            }
+            write.flush();
+        }
+        if (paged)
+        {
+            std::ifstream file(name, std::ios::binary | std::ios::ate);
+            REQUIRE(file.tellg() % 65536 == 0);
+        }
+        Series read(name, Access::READ_ONLY, config);
+        auto &it = read.iterations[0];
+        REQUIRE(it.meshes.size() == 50);
+        for (size_t i = 0; i < 50; ++i)
+        {
+            auto rc = it.meshes["E" + std::to_string(i)]["x"];
+            REQUIRE(rc.getAttribute("index").get<size_t>() == i);
+        }
+    }
+
+    for (auto const &invalidConfig :
+         {R"({"hdf5": {"file": {"file_space": {"strategy": "paged"}}}})",
+          R"({"hdf5": {"file": {"file_space": {"page_size": 65536}}}})",
+          R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                               "page_size": 100}}}})",
+          R"({"hdf5": {"file": {"file_space": {"strategy": "aggr"},
+                                "page_buffer_size": 1048576}}})",
+          R"({"hdf5": {"file": {"file_space": {"strategy": "page",
+                                               "page_size": 65536},
+                                "page_buffer_size": 4096}}})"})
+    {
+        REQUIRE_THROWS_AS(
+            Series(
+                "../samples/hdf5_file_space_invalid.h5",
+                Access::CREATE,
+                invalidConfig),
+            error::BackendConfigSchema);
+    }
+}
+
+TEST_CASE("hdf5_dataset_handle_cache", "[serial][hdf5]")
+{
+    // fewer cached handles than datasets, so handles get evicted
+    for (auto const &config :
+         {R"({"hdf5": {"dataset_handle_cache": 0}})",
+          R"({"hdf5": {"dataset_handle_cache": 2}})",
+          R"({"hdf5": {"dataset_handle_cache": 64}})"})
+    {
+        std::string const name = "../samples/hdf5_dataset_handle_cache_%T.h5";
+        constexpr size_t chunks = 100;
+        {
+            Series write(name, Access::CREATE, config);
+            for (size_t step = 0; step < 2; ++step)
+            {
+                auto it = write.iterations[step];
+                auto &electrons = it.particles["e"];
+                for (auto const &component : {"x", "y", "z"})
+                {
+                    electrons["position"][component].resetDataset(
+                        {Datatype::DOUBLE, {chunks}});
+                }
+                // many small, interleaved chunks
+                for (size_t i = 0; i < chunks; ++i)
+                {
+                    for (auto const &component : {"x", "y", "z"})
+                    {
+                        electrons["position"][component].storeChunk(
+                            std::make_shared<double>(double(step * chunks + i)),
+                            {i},
+                            {1});
+                    }
+                }
+                it.close();
+            }
+        }
+        Series read(name, Access::READ_ONLY, config);
+        for (auto &[step, it] : read.iterations)
+        {
+            for (auto const &component : {"x", "y", "z"})
+            {
+                auto rc = it.particles["e"]["position"][component];
+                auto data = rc.loadChunk<double>();
+                auto firstHalf = rc.loadChunk<double>({0}, {chunks / 2});
+                it.seriesFlush();
+                for (size_t i = 0; i < chunks; ++i)
+                {
+                    REQUIRE(data.get()[i] == double(step * chunks + i));
+                }
+                REQUIRE(firstHalf.get()[7] == double(step * chunks + 7));
+            }
+            it.close();
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            "../samples/hdf5_dataset_handle_cache_invalid.h5",
+            Access::CREATE,
+            R"({"hdf5": {"dataset_handle_cache": -1}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("hdf5_coalesce_writes", "[serial][hdf5]")
+{
+    for (auto const &config :
+         {R"({"hdf5": {"coalesce_writes": true}})",
+          R"({"hdf5": {"coalesce_writes": false}})"})
+    {
+        std::string const name = "../samples/hdf5_coalesce_writes.h5";
+        constexpr size_t chunks = 100;
+        {
+            Series write(name, Access::CREATE, config);
+            auto it = write.iterations[0];
+            auto &electrons = it.particles["e"];
+            for (auto const &component : {"x", "y"})
+            {
+                electrons["position"][component].resetDataset(
+                    {Datatype::INT, {chunks}});
+            }
+            // interleaved chunks, in reverse order for y
+            for (size_t i = 0; i < chunks; ++i)
+            {
+                electrons["position"]["x"].storeChunk(
+                    std::make_shared<int>(int(i)), {i}, {1});
+                size_t const j = chunks - 1 - i;
+                electrons["position"]["y"].storeChunk(
+                    std::make_shared<int>(int(j)), {j}, {1});
+            }
+            // overlapping writes, the last one wins
+            electrons["position"]["x"].storeChunk(
+                std::shared_ptr<int>{
+                    new int[4]{-1, -1, -1, -1}, [](int *p) { delete[] p; }},
+                {10},
+                {4});
+            electrons["position"]["x"].storeChunk(
+                std::make_shared<int>(-2), {12}, {1});
+
+            // blocks of rows of a 2D mesh
+            auto E = it.meshes["E"][MeshRecordComponent::SCALAR];
+            E.resetDataset({Datatype::INT, {10, 3}});
+            for (size_t row : {4, 0, 2, 6, 8})
+            {
+                std::shared_ptr<int> block{
+                    new int[6], [](int *p) { delete[] p; }};
+                for (int k = 0; k < 6; ++k)
+                {
+                    block.get()[k] = int(row * 3) + k;
+                }
+                E.storeChunk(block, {row, 0}, {2, 3});
+            }
+            it.close();
+        }
+        Series read(name, Access::READ_ONLY, config);
+        auto it = read.iterations[0];
+        auto x = it.particles["e"]["position"]["x"].loadChunk<int>();
+        auto y = it.particles["e"]["position"]["y"].loadChunk<int>();
+        auto E = it.meshes["E"][MeshRecordComponent::SCALAR].loadChunk<int>();
+        it.seriesFlush();
+        for (size_t i = 0; i < chunks; ++i)
+        {
+            int expected = int(i);
+            if (i >= 10 && i < 14)
+            {
+                expected = i == 12 ? -2 : -1;
+            }
+            REQUIRE(x.get()[i] == expected);
+            REQUIRE(y.get()[i] == int(i));
+        }
+        for (int k = 0; k < 30; ++k)
+        {
+            REQUIRE(E.get()[k] == k);
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            "../samples/hdf5_coalesce_writes_invalid.h5",
+            Access::CREATE,
+            R"({"hdf5": {"coalesce_writes": "yes"}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("hdf5_direct_chunk_io", "[serial][hdf5]")
+{
+    for (auto const &config :
+         {R"({"hdf5": {"direct_chunk_io": true, "direct_chunk_threads": 3}})",
+          R"({"hdf5": {"direct_chunk_io": false}})"})
+    {
+        std::string const name = "../samples/hdf5_direct_chunk_io.h5";
+        // chunks of 4x3, the last row and column of chunks are partial
+        std::string const options = R"({"hdf5": {"dataset": {
+            "chunks": [4, 3],
+            "filters": [{"type": "shuffle"}, {"type": "deflate"}]}}})";
+        auto value = [](size_t i, size_t j) { return double(i * 7 + j); };
+        auto block = [&value](Offset const &offset, Extent const &extent) {
+            std::vector<double> data(extent[0] * extent[1]);
+            for (size_t i = 0; i < extent[0]; ++i)
+            {
+                for (size_t j = 0; j < extent[1]; ++j)
+                {
+                    data[i * extent[1] + j] =
+                        value(offset[0] + i, offset[1] + j);
+                }
+            }
+            return data;
+        };
+        {
+            Series write(name, Access::CREATE, config);
+            auto it = write.iterations[0];
+            Dataset dataset{Datatype::DOUBLE, {10, 7}};
+            dataset.options = options;
+            auto E = it.meshes["E"][MeshRecordComponent::SCALAR];
+            E.resetDataset(dataset);
+            // chunk-aligned blocks, including the partial edge chunks
+            auto top = block({0, 0}, {4, 6});
+            auto edge = block({0, 6}, {4, 1});
+            auto bottom = block({4, 0}, {6, 7});
+            E.storeChunk(top, {0, 0}, {4, 6});
+            E.storeChunk(edge, {0, 6}, {4, 1});
+            E.storeChunk(bottom, {4, 0}, {6, 7});
+            // unaligned, read-modify-write of a directly written chunk
+            std::vector<double> unaligned(4, -1.);
+            E.storeChunk(unaligned, {1, 1}, {2, 2});
+
+            // only the first chunk is allocated
+            auto B = it.meshes["B"][MeshRecordComponent::SCALAR];
+            B.resetDataset(dataset);
+            auto partial = block({0, 0}, {4, 3});
+            B.storeChunk(partial, {0, 0}, {4, 3});
+            it.close();
+        }
+        Series read(name, Access::READ_ONLY, config);
+        auto it = read.iterations[0];
+        auto E = it.meshes["E"][MeshRecordComponent::SCALAR];
+        auto full = E.loadChunk<double>();
+        auto aligned = E.loadChunk<double>({4, 3}, {4, 3});
+        auto unaligned = E.loadChunk<double>({1, 1}, {3, 3});
+        auto B =
+            it.meshes["B"][MeshRecordComponent::SCALAR].loadChunk<double>();
+        it.seriesFlush();
+        auto expected = [&value](size_t i, size_t j) {
+            return i >= 1 && i < 3 && j >= 1 && j < 3 ? -1. : value(i, j);
+        };
+        for (size_t i = 0; i < 10; ++i)
+        {
+            for (size_t j = 0; j < 7; ++j)
+            {
+                REQUIRE(full.get()[i * 7 + j] == expected(i, j));
+                // unallocated chunks are read without fill value
+                if (i < 4 && j < 3)
+                {
+                    REQUIRE(B.get()[i * 7 + j] == value(i, j));
+                }
+            }
+        }
+        for (size_t i = 0; i < 3; ++i)
+        {
+            for (size_t j = 0; j < 3; ++j)
+            {
+                REQUIRE(aligned.get()[i * 3 + j] == value(4 + i, 3 + j));
+                REQUIRE(unaligned.get()[i * 3 + j] == expected(1 + i, 1 + j));
+            }
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            "../samples/hdf5_direct_chunk_io_invalid.h5",
+            Access::CREATE,
+            R"({"hdf5": {"direct_chunk_threads": -1}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("hdf5_async_write", "[serial][hdf5]")
+{
+    std::string const name = "../samples/hdf5_async_write.h5";
+    {
+        Series write(
+            name, Access::CREATE, R"({"hdf5": {"async_write": true}})");
+        std::vector<double> buffer(100);
+        for (uint64_t i = 0; i < 3; ++i)
+        {
+            auto E = write.iterations[i].meshes["E"][RecordComponent::SCALAR];
+            E.resetDataset({Datatype::DOUBLE, {2, 100}});
+            // the buffer is reused right after each flush
+            std::iota(buffer.begin(), buffer.end(), double(i * 1000));
+            E.storeChunk(buffer, {0, 0}, {1, 100});
+            UniquePtrWithLambda<double> owned(
+                new double[100], [](double *ptr) { delete[] ptr; });
+            std::fill_n(owned.get(), 100, double(i));
+            E.storeChunk(std::move(owned), {1, 0}, {1, 100});
+            write.flush();
+            std::fill(buffer.begin(), buffer.end(), -1.);
+            // other Series use HDF5 while the writes are in flight
+            Series other(
+                "../samples/hdf5_async_write_other.h5", Access::CREATE);
+            other.iterations[i].setAttribute("written", true);
+            other.flush();
+        }
+    }
+
+    Series read(name, Access::READ_ONLY);
+    for (uint64_t i = 0; i < 3; ++i)
+    {
+        auto E = read.iterations[i].meshes["E"][RecordComponent::SCALAR];
+        auto data = E.loadChunk<double>();
+        read.flush();
+        for (size_t j = 0; j < 100; ++j)
+        {
+            REQUIRE(data.get()[j] == double(i * 1000 + j));
+            REQUIRE(data.get()[100 + j] == double(i));
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            "../samples/hdf5_async_write_invalid.h5",
+            Access::CREATE,
+            R"({"hdf5": {"async_write": 1}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("hdf5_span_write", "[serial][hdf5]")
+{
+    for (auto const &config :
+         {R"({"hdf5": {"async_write": false}})",
+          R"({"hdf5": {"async_write": true}})"})
+    {
+        std::string const name = "../samples/hdf5_span_write.h5";
+        {
+            Series write(name, Access::CREATE, config);
+            for (uint64_t i = 0; i < 2; ++i)
+            {
+                auto E = write.iterations[i].meshes["E"]["x"];
+                E.resetDataset({Datatype::DOUBLE, {2, 10}});
+                bool fallback = false;
+                auto view = E.storeChunk<double>(
+                    {0, 0}, {2, 10}, [&fallback](size_t size) {
+                        fallback = true;
+                        return std::shared_ptr<double>{
+                            new double[size], [](auto *ptr) { delete[] ptr; }};
+                    });
+                REQUIRE(!fallback);
+                auto span = view.currentBuffer();
+                REQUIRE(span.size() == 20);
+                for (size_t j = 0; j < span.size(); ++j)
+                {
+                    span[j] = double(i * 100 + j);
+                }
+                if (i == 0)
+                {
+                    write.flush();
+                    // written in the flush, the view is stale now
+                    REQUIRE_THROWS(view.currentBuffer());
+                }
+                else
+                {
+                    // written before closing the file
+                    write.iterations[i].close();
+                }
+            }
+        }
+
+        Series read(name, Access::READ_ONLY);
+        for (uint64_t i = 0; i < 2; ++i)
+        {
+            auto data = read.iterations[i].meshes["E"]["x"].loadChunk<double>();
+            read.flush();
+            for (size_t j = 0; j < 20; ++j)
+            {
+                REQUIRE(data.get()[j] == double(i * 100 + j));
+            }
+        }
+    }
+
+    {
+        // pending spans of deleted objects are dropped, not written
+        Series write("../samples/hdf5_span_write_delete.h5", Access::CREATE);
+        auto E = write.iterations[0].meshes["E"]["x"];
+        auto B = write.iterations[1].meshes["B"]["x"];
+        for (auto component : {&E, &B})
+        {
+            component->resetDataset({Datatype::DOUBLE, {10}});
+        }
+        write.flush();
+        for (auto component : {&E, &B})
+        {
+            auto view = component->storeChunk<double>({0}, {10});
+            std::fill_n(view.currentBuffer().data(), 10, 1.);
+        }
+        write.iterations[0].meshes.erase("E");
+        write.iterations.erase(1);
+        REQUIRE_NOTHROW(write.flush());
+    }
+
+    {
+        // opting out uses a buffer allocated by openPMD-api
+        Series write(
+            "../samples/hdf5_span_write_fallback.h5",
+            Access::CREATE,
+            R"({"hdf5": {"use_span_based_put": false}})");
+        auto E = write.iterations[0].meshes["E"]["x"];
+        E.resetDataset({Datatype::INT, {10}});
+        bool fallback = false;
+        E.storeChunk<int>({0}, {10}, [&fallback](size_t size) {
+            fallback = true;
+            return std::shared_ptr<int>{
+                new int[size]{}, [](auto *ptr) { delete[] ptr; }};
+        });
+        REQUIRE(fallback);
+    }
+}
+
+TEST_CASE("hdf5_mmap_read", "[serial][hdf5]")
+{
+    std::string const name = "../samples/hdf5_mmap_read.h5";
+    std::vector<double> data(8 * 10);
+    std::iota(data.begin(), data.end(), 0.);
+    {
+        Series write(name, Access::CREATE);
+        auto E = write.iterations[0].meshes["E"];
+        // contiguous layout, can be mapped into memory
+        Dataset contiguous{Datatype::DOUBLE, {8, 10}};
+        contiguous.options = R"({"hdf5": {"dataset": {"chunks": "none"}}})";
+        E["x"].resetDataset(contiguous);
+        E["x"].storeChunk(data, {0, 0}, {8, 10});
+        // chunked layout, falls back to loadChunk()
+        Dataset chunked{Datatype::DOUBLE, {8, 10}};
+        chunked.options = R"({"hdf5": {"dataset": {"chunks": [4, 5]}}})";
+        E["y"].resetDataset(chunked);
+        E["y"].storeChunk(data, {0, 0}, {8, 10});
+        write.flush();
+    }
+
+    Series read(name, Access::READ_ONLY);
+    auto E = read.iterations[0].meshes["E"];
+    for (auto const &component : {"x", "y"})
+    {
+        auto full = E[component].loadChunkView<double>();
+        // consecutive rows, contiguous in the file
+        auto rows = E[component].loadChunkView<double>({2, 0}, {3, 10});
+        // part of a row, contiguous in the file
+        auto row = E[component].loadChunkView<double>({5, 3}, {1, 4});
+        // columns, not contiguous in the file
+        auto columns = E[component].loadChunkView<double>({1, 2}, {6, 4});
+        read.flush();
+        for (size_t i = 0; i < 8 * 10; ++i)
+        {
+            REQUIRE(full.get()[i] == data[i]);
+        }
+        for (size_t i = 0; i < 3 * 10; ++i)
+        {
+            REQUIRE(rows.get()[i] == data[20 + i]);
+        }
+        for (size_t i = 0; i < 4; ++i)
+        {
+            REQUIRE(row.get()[i] == data[53 + i]);
+        }
+        for (size_t i = 0; i < 6; ++i)
+        {
+            for (size_t j = 0; j < 4; ++j)
+            {
+                REQUIRE(columns.get()[i * 4 + j] == data[(i + 1) * 10 + j + 2]);
+            }
+        }
+    }
+    // errors are reported as by loadChunk()
+    REQUIRE_THROWS(E["x"].loadChunkView<float>());
+    REQUIRE_THROWS(E["x"].loadChunkView<double>({4, 0}, {5, 10}));
+}
+
+TEST_CASE("hdf5_read_all_attributes", "[serial][hdf5]")
+{
+    // attributes are read with a single READ_ALL_ATTS task per object
+    std::string const name = "../samples/hdf5_read_all_attributes.h5";
+    {
+        Series write(name, Access::CREATE);
+        write.setAttribute("comment", std::string("all attributes"));
+        auto it = write.iterations[0];
+        it.setAttribute("flag", true);
+        it.setAttribute("count", 42u);
+        it.setAttribute("values", std::vector<double>{1., 2., 3.});
+        it.setAttribute("names", std::vector<std::string>{"a", "bc"});
+        it.setAttribute("phase", std::complex<double>(1., -1.));
+        auto E = it.meshes["E"];
+        E.setUnitDimension({{UnitDimension::I, 1.}});
+        auto E_x = E["x"];
+        E_x.resetDataset({Datatype::FLOAT, {1}});
+        E_x.makeConstant(1.f);
+        it.close();
+    }
+
+    Series read(name, Access::READ_ONLY);
+    REQUIRE(
+        read.getAttribute("comment").get<std::string>() == "all attributes");
+    auto it = read.iterations[0];
+    REQUIRE(it.getAttribute("flag").get<bool>());
+    REQUIRE(it.getAttribute("count").get<unsigned int>() == 42u);
+    REQUIRE(
+        it.getAttribute("values").get<std::vector<double> >() ==
+        std::vector<double>{1., 2., 3.});
+    REQUIRE(
+        it.getAttribute("names").get<std::vector<std::string> >() ==
+        std::vector<std::string>{"a", "bc"});
+    REQUIRE(
+        it.getAttribute("phase").get<std::complex<double> >() ==
+        std::complex<double>(1., -1.));
+    auto E = it.meshes["E"];
+    REQUIRE(E.unitDimension()[static_cast<size_t>(UnitDimension::I)] == 1.);
+    REQUIRE(E["x"].getAttribute("value").get<float>() == 1.f);
+}
+
+TEST_CASE("hdf5_transfer_config", "[serial][hdf5]")
+{
+    // transfer modes and MPI-IO hints only take effect in parallel HDF5
+    std::string const name = "../samples/hdf5_transfer_config.h5";
+    {
+        Series write(
+            name,
+            Access::CREATE,
+            R"({"hdf5": {
+                  "dataset": {"transfer": "collective"},
+                  "mpi_info": {"cb_nodes": 4,
+                               "cb_buffer_size": 16777216,
+                               "romio_cb_write": "enable"}}})");
+        auto it = write.iterations[0];
+        auto E_x = it.meshes["E"]["x"];
+        Dataset dataset{Datatype::INT, {10}};
+        dataset.options =
+            R"({"hdf5": {"dataset": {"transfer": "independent"}}})";
+        E_x.resetDataset(dataset);
+        std::vector<int> data(10, 42);
+        E_x.storeChunk(data, {0}, {10});
+        write.flush(R"({"hdf5": {"dataset": {"transfer": "collective"}}})");
+        REQUIRE_THROWS_AS(
+            write.flush(R"({"hdf5": {"dataset": {"transfer": "both"}}})"),
+            error::BackendConfigSchema);
+    }
+    {
+        Series read(name, Access::READ_ONLY);
+        auto data = read.iterations[0].meshes["E"]["x"].loadChunk<int>();
+        read.flush(R"({"hdf5": {"dataset": {"transfer": "independent"}}})");
+        REQUIRE(data.get()[9] == 42);
+    }
+
+    for (auto const &invalidConfig :
+         {R"({"hdf5": {"dataset": {"transfer": 1}}})",
+          R"({"hdf5": {"mpi_info": ["cb_nodes", 4]}})",
+          R"({"hdf5": {"mpi_info": {"cb_nodes": [4]}}})"})
+    {
+        REQUIRE_THROWS_AS(
+            Series(
+                "../samples/hdf5_transfer_config_invalid.h5",
+                Access::CREATE,
+                invalidConfig),
+            error::BackendConfigSchema);
+    }
+}
+
+TEST_CASE("hdf5_merge_series", "[serial][hdf5]")
+{
+    std::string const directory = "../samples/hdf5_merge_series/";
+    {
+        Series write(directory + "data_%03T.h5", Access::CREATE);
+        write.setAuthor("openPMD-api merge test");
+        for (Series::IterationIndex_t i : {0, 10, 20})
+        {
+            auto it = write.iterations[i];
+            it.setTime(double(i));
+            auto E_x = it.meshes["E"]["x"];
+            E_x.resetDataset({Datatype::DOUBLE, {5}});
+            std::vector<double> data(5, double(i));
+            E_x.storeChunk(data, {0}, {5});
+            it.close();
+        }
+    }
+
+    helper::mergeSeries(directory + "data_%T.h5", directory + "merged.h5");
+
+    Series read(directory + "merged.h5", Access::READ_ONLY);
+    REQUIRE(read.iterationEncoding() == IterationEncoding::groupBased);
+    REQUIRE(read.author() == "openPMD-api merge test");
+    REQUIRE(read.iterations.size() == 3);
+    for (auto &[index, it] : read.iterations)
+    {
+        REQUIRE(it.time<double>() == double(index));
+        auto data = it.meshes["E"]["x"].loadChunk<double>();
+        it.seriesFlush();
+        REQUIRE(data.get()[4] == double(index));
+    }
+
+    // sources other than file-based HDF5 series are rejected
+    REQUIRE_THROWS_AS(
+        helper::mergeSeries(
+            directory + "merged.h5", directory + "merged_twice.h5"),
+        error::WrongAPIUsage);
+
+    // source and target in different directories
+    helper::mergeSeries(
+        directory + "data_%T.h5", directory + "merged/merged.h5");
+#ifdef __unix__
+    // links must not depend on the working directory of the merge
+    struct RestoreWorkingDirectory
+    {
+        char cwd[4096];
+        bool saved = getcwd(cwd, sizeof(cwd)) != nullptr;
+        ~RestoreWorkingDirectory()
+        {
+            if (saved)
+            {
+                (void)chdir(cwd);
+            }
+        }
+    } restore;
+    REQUIRE(restore.saved);
+    REQUIRE(chdir((directory + "merged").c_str()) == 0);
+    Series merged("merged.h5", Access::READ_ONLY);
+#else
+    Series merged(directory + "merged/merged.h5", Access::READ_ONLY);
+#endif
+    REQUIRE(merged.iterations.size() == 3);
+    for (auto &[index, it] : merged.iterations)
+    {
+        auto data = it.meshes["E"]["x"].loadChunk<double>();
+        it.seriesFlush();
+        REQUIRE(data.get()[4] == double(index));
+    }
+}
+
 TEST_CASE("optional_paths_110_test", "[serial]")
 {
     optional_paths_110_test("h5"); // samples only present for hdf5
@@ -5841,9 +6836,10 @@ void iterate_nonstreaming_series(
                     return std::shared_ptr<int>{
                         new int[size], [](auto *ptr) { delete[] ptr; }};
                 });
-            if (writeSeries.backend() == "ADIOS2")
+            if (writeSeries.backend() == "ADIOS2" ||
+                writeSeries.backend() == "HDF5")
             {
-                // that backend must support span creation
+                // those backends must support span creation
                 REQUIRE(taskSupportedByBackend);
             }
             auto span = memoryView.currentBuffer();
@@ -6054,6 +7050,699 @@ TEST_CASE("adios2_bp5_no_steps", "[serial][adios2]")
 }
 #endif
 
+#if openPMD_HAVE_ADIOS2
+TEST_CASE("adios2_read_buffer_view", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_read_buffer_view.bp";
+    std::vector<double> data(8 * 10);
+    {
+        Series write(name, Access::CREATE);
+        for (unsigned step = 0; step < 3; ++step)
+        {
+            std::iota(data.begin(), data.end(), 100. * step);
+            auto it = write.writeIterations()[step];
+            auto E_x = it.meshes["E"]["x"];
+            E_x.resetDataset({Datatype::DOUBLE, {8, 10}});
+            E_x.storeChunk(data, {0, 0}, {8, 10});
+            it.close();
+        }
+    }
+
+    Series read(name, Access::READ_LINEAR);
+    double const *previous = nullptr;
+    for (auto it : read.readIterations())
+    {
+        std::iota(data.begin(), data.end(), 100. * it.iterationIndex);
+        auto E_x = it.meshes["E"]["x"];
+        auto rows = E_x.loadChunkView<double>({2, 0}, {3, 10});
+        auto columns = E_x.loadChunkView<double>({1, 2}, {6, 4});
+        // views are ready without flushing
+        for (size_t i = 0; i < 3 * 10; ++i)
+        {
+            REQUIRE(rows.get()[i] == data[20 + i]);
+        }
+        for (size_t i = 0; i < 6; ++i)
+        {
+            for (size_t j = 0; j < 4; ++j)
+            {
+                REQUIRE(columns.get()[i * 4 + j] == data[(i + 1) * 10 + j + 2]);
+            }
+        }
+        // released buffers are reused in the next step
+        if (previous)
+        {
+            REQUIRE(rows.get() == previous);
+        }
+        previous = rows.get();
+        rows.reset();
+        columns.reset();
+        it.close();
+    }
+    REQUIRE(previous != nullptr);
+
+    // without steps, released buffers do not pile up
+    Series randomAccess(name, Access::READ_ONLY);
+    auto E_x = randomAccess.iterations[2].meshes["E"]["x"];
+    std::iota(data.begin(), data.end(), 200.);
+    std::vector<std::weak_ptr<double const> > released;
+    for (size_t rows = 1; rows <= 8; ++rows)
+    {
+        auto view = E_x.loadChunkView<double>({0, 0}, {rows, 10});
+        REQUIRE(view.get()[rows * 10 - 1] == data[rows * 10 - 1]);
+        released.push_back(view);
+    }
+    randomAccess.flush();
+    for (auto const &buffer : released)
+    {
+        REQUIRE(buffer.expired());
+    }
+    {
+        auto full = E_x.loadChunkView<double>();
+        double const *fullBuffer = full.get();
+        full.reset();
+        // same size: reused
+        full = E_x.loadChunkView<double>();
+        REQUIRE(full.get() == fullBuffer);
+        full.reset();
+        // more than twice smaller: not reused
+        auto row = E_x.loadChunkView<double>({0, 0}, {1, 10});
+        REQUIRE(row.get() != fullBuffer);
+        REQUIRE(row.get()[9] == data[9]);
+    }
+}
+#endif
+
+#if openPMD_HAVE_ADIOS2
+TEST_CASE("adios2_read_by_blocks", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_read_by_blocks.bp";
+    // 3x4 blocks of shape 4x5
+    auto value = [](size_t step, size_t row, size_t col) {
+        return double(step * 1000 + row * 20 + col);
+    };
+    {
+        Series write(name, Access::CREATE);
+        for (size_t step = 0; step < 2; ++step)
+        {
+            auto it = write.writeIterations()[step];
+            auto E_x = it.meshes["E"]["x"];
+            E_x.resetDataset({Datatype::DOUBLE, {12, 20}});
+            for (size_t row = 0; row < 12; row += 4)
+            {
+                for (size_t col = 0; col < 20; col += 5)
+                {
+                    std::shared_ptr<double> block{
+                        new double[4 * 5], [](double *p) { delete[] p; }};
+                    for (size_t i = 0; i < 4; ++i)
+                    {
+                        for (size_t j = 0; j < 5; ++j)
+                        {
+                            block.get()[i * 5 + j] =
+                                value(step, row + i, col + j);
+                        }
+                    }
+                    E_x.storeChunk(block, {row, col}, {4, 5});
+                }
+            }
+            it.close();
+        }
+    }
+
+    auto check = [&value](
+                     RecordComponent &rc,
+                     size_t step,
+                     Offset const &offset,
+                     Extent const &extent) {
+        auto chunk = rc.loadChunk<double>(offset, extent);
+        rc.seriesFlush();
+        for (size_t i = 0; i < extent[0]; ++i)
+        {
+            for (size_t j = 0; j < extent[1]; ++j)
+            {
+                REQUIRE(
+                    chunk.get()[i * extent[1] + j] ==
+                    value(step, offset[0] + i, offset[1] + j));
+            }
+        }
+    };
+
+    // default cache size, room for a single block (160 bytes), no cache,
+    // copies from blocks on multiple threads
+    std::string const configs[] = {
+        R"({"adios2": {"read_by_blocks": true}})",
+        R"({"adios2": {"read_by_blocks": true, "block_cache_size": 200}})",
+        R"({"adios2": {"read_by_blocks": true, "block_cache_size": 0}})",
+        R"({"adios2": {"read_by_blocks": true, "read_threads": 3}})"};
+    for (auto const &config : configs)
+    {
+        for (auto access : {Access::READ_ONLY, Access::READ_LINEAR})
+        {
+            Series read(name, access, config);
+            for (auto it : read.readIterations())
+            {
+                auto E_x = it.meshes["E"]["x"];
+                // whole dataset, a single block, parts of several blocks
+                check(E_x, it.iterationIndex, {0, 0}, {12, 20});
+                check(E_x, it.iterationIndex, {4, 5}, {4, 5});
+                check(E_x, it.iterationIndex, {3, 2}, {6, 14});
+                check(E_x, it.iterationIndex, {11, 0}, {1, 20});
+                check(E_x, it.iterationIndex, {0, 19}, {12, 1});
+                // several loads before a flush, sharing blocks
+                auto first = E_x.loadChunk<double>({1, 1}, {2, 7});
+                auto second = E_x.loadChunk<double>({2, 3}, {2, 7});
+                it.seriesFlush();
+                for (size_t i = 0; i < 2; ++i)
+                {
+                    for (size_t j = 0; j < 7; ++j)
+                    {
+                        REQUIRE(
+                            first.get()[i * 7 + j] ==
+                            value(it.iterationIndex, 1 + i, 1 + j));
+                        REQUIRE(
+                            second.get()[i * 7 + j] ==
+                            value(it.iterationIndex, 2 + i, 3 + j));
+                    }
+                }
+                it.close();
+            }
+        }
+    }
+
+    /*
+     * Overlapping blocks, the one written last wins as with a plain Get.
+     * A large first block, so copying it concurrently would finish after
+     * the small ones.
+     */
+    std::string const overlapName =
+        "../samples/adios2_read_by_blocks_overlap.bp";
+    constexpr size_t rows = 500, cols = 1000;
+    {
+        Series write(overlapName, Access::CREATE);
+        auto E_x = write.iterations[0].meshes["E"]["x"];
+        E_x.resetDataset({Datatype::DOUBLE, {rows, cols}});
+        std::shared_ptr<double> first{
+            new double[rows * cols], [](double *p) { delete[] p; }};
+        std::fill_n(first.get(), rows * cols, 0.);
+        E_x.storeChunk(first, {0, 0}, {rows, cols});
+        for (size_t block = 1; block < 8; ++block)
+        {
+            std::shared_ptr<double> data{
+                new double[8 * 10], [](double *p) { delete[] p; }};
+            std::fill_n(data.get(), 8 * 10, double(block));
+            E_x.storeChunk(data, {block / 2, block}, {8, 10});
+        }
+        write.flush();
+    }
+    auto overlapValue = [](size_t row, size_t col) {
+        double res = 0.;
+        for (size_t block = 1; block < 8; ++block)
+        {
+            if (row >= block / 2 && row < block / 2 + 8 && col >= block &&
+                col < block + 10)
+            {
+                res = double(block);
+            }
+        }
+        return res;
+    };
+    for (auto const &config : configs)
+    {
+        Series read(overlapName, Access::READ_ONLY, config);
+        auto E_x = read.iterations[0].meshes["E"]["x"];
+        auto chunk = E_x.loadChunk<double>();
+        read.flush();
+        size_t mismatches = 0;
+        for (size_t i = 0; i < rows; ++i)
+        {
+            for (size_t j = 0; j < cols; ++j)
+            {
+                mismatches += chunk.get()[i * cols + j] != overlapValue(i, j);
+            }
+        }
+        REQUIRE(mismatches == 0);
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            name,
+            Access::READ_ONLY,
+            R"({"adios2": {"block_cache_size": "1GB"}})"),
+        error::BackendConfigSchema);
+    REQUIRE_THROWS_AS(
+        Series(name, Access::READ_ONLY, R"({"adios2": {"read_threads": -1}})"),
+        error::BackendConfigSchema);
+    REQUIRE_THROWS_AS(
+        Series(name, Access::READ_ONLY, R"({"adios2": {"read_by_blocks": 1}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("adios2_auto_buffer_size", "[serial][adios2]")
+{
+    std::string const config = R"(
+    {
+      "adios2": {
+        "engine": {
+          "auto_buffer_size": true
+        }
+      }
+    })";
+    // growing, then shrinking iterations, each one opening a new engine
+    std::vector<size_t> const sizes{10, 1000, 100000, 100, 50000};
+    for (auto const &[encoding, name] :
+         {std::pair{
+              IterationEncoding::fileBased,
+              "../samples/adios2_auto_buffer_size_%T.bp"},
+          std::pair{
+              IterationEncoding::variableBased,
+              "../samples/adios2_auto_buffer_size.bp"}})
+    {
+        {
+            Series write(name, Access::CREATE, config);
+            write.setIterationEncoding(encoding);
+            for (size_t i = 0; i < sizes.size(); ++i)
+            {
+                auto it = write.writeIterations()[i];
+                auto E_x = it.meshes["E"]["x"];
+                E_x.resetDataset({Datatype::INT, {sizes[i]}});
+                std::vector<int> data(sizes[i]);
+                std::iota(data.begin(), data.end(), int(i));
+                E_x.storeChunk(data, {0}, {sizes[i]});
+                it.close();
+            }
+        }
+        Series read(name, Access::READ_LINEAR);
+        for (auto it : read.readIterations())
+        {
+            auto idx = it.iterationIndex;
+            auto E_x = it.meshes["E"]["x"];
+            REQUIRE(E_x.getExtent() == Extent{sizes[idx]});
+            auto chunk = E_x.loadChunk<int>();
+            it.close();
+            for (size_t j = 0; j < sizes[idx]; ++j)
+            {
+                REQUIRE(chunk.get()[j] == int(idx + j));
+            }
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            "../samples/adios2_auto_buffer_size_invalid.bp",
+            Access::CREATE,
+            R"({"adios2": {"engine": {"auto_buffer_size": "yes"}}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("adios2_attribute_index", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_attribute_index.bp";
+    {
+        Series write(name, Access::CREATE);
+        write.setAttribute("rootAttribute", 1);
+        for (size_t i = 0; i < 3; ++i)
+        {
+            auto it = write.writeIterations()[i];
+            it.setAttribute("iterationAttribute", int(i));
+            // same prefix as the mesh "E"
+            it.meshes.setAttribute("E_", "not a mesh");
+            for (auto const &mesh : {"E", "E_x", "B"})
+            {
+                auto component = it.meshes[mesh]["x"];
+                component.setAttribute("componentAttribute", int(i));
+                component.resetDataset({Datatype::INT, {1}});
+                component.makeConstant(int(i));
+            }
+            it.close();
+        }
+    }
+
+    for (auto access : {Access::READ_ONLY, Access::READ_LINEAR})
+    {
+        Series read(name, access);
+        for (auto it : read.readIterations())
+        {
+            REQUIRE(read.containsAttribute("rootAttribute"));
+            REQUIRE(
+                it.getAttribute("iterationAttribute").get<int>() ==
+                int(it.iterationIndex));
+            REQUIRE(
+                it.meshes.getAttribute("E_").get<std::string>() ==
+                "not a mesh");
+            REQUIRE(it.meshes.size() == 3);
+            for (auto const &mesh : {"E", "E_x", "B"})
+            {
+                auto component = it.meshes[mesh]["x"];
+                auto attributes = component.attributes();
+                REQUIRE(
+                    std::find(
+                        attributes.begin(),
+                        attributes.end(),
+                        "componentAttribute") != attributes.end());
+                REQUIRE(
+                    component.getAttribute("componentAttribute").get<int>() ==
+                    int(it.iterationIndex));
+                REQUIRE(
+                    component.getAttribute("value").get<int>() ==
+                    int(it.iterationIndex));
+            }
+            it.close();
+        }
+    }
+}
+
+TEST_CASE("adios2_path_index", "[serial][adios2]")
+{
+    // both attribute layouts: by ADIOS2 attributes and by ADIOS2 variables
+    for (auto const &config : {"{}", R"({"adios2": {"schema": 20210209}})"})
+    {
+        std::string const name = "../samples/adios2_path_index.bp";
+        {
+            Series write(name, Access::CREATE, config);
+            write.setIterationEncoding(IterationEncoding::groupBased);
+            for (size_t i = 0; i < 3; ++i)
+            {
+                auto it = write.writeIterations()[i];
+                // "E" is a prefix of "E_x", scalar and vector meshes
+                for (auto const &mesh : {"E", "E_x"})
+                {
+                    for (auto const &dim : {"x", "y"})
+                    {
+                        auto component = it.meshes[mesh][dim];
+                        component.resetDataset({Datatype::INT, {1}});
+                        component.storeChunk(
+                            std::make_unique<int>(int(i)), {0}, {1});
+                    }
+                }
+                auto rho = it.meshes["rho"][MeshRecordComponent::SCALAR];
+                rho.resetDataset({Datatype::INT, {1}});
+                rho.storeChunk(std::make_unique<int>(int(i)), {0}, {1});
+                auto charge =
+                    it.particles["e"]["charge"][RecordComponent::SCALAR];
+                charge.resetDataset({Datatype::INT, {1}});
+                charge.makeConstant(int(i));
+                it.close();
+            }
+        }
+
+        for (auto access : {Access::READ_ONLY, Access::READ_LINEAR})
+        {
+            Series read(name, access, config);
+            for (auto it : read.readIterations())
+            {
+                int const expected = int(it.iterationIndex);
+                REQUIRE(it.meshes.size() == 3);
+                for (auto const &mesh : {"E", "E_x"})
+                {
+                    REQUIRE(it.meshes[mesh].size() == 2);
+                    REQUIRE(!it.meshes[mesh].scalar());
+                }
+                auto E_x_y = it.meshes["E_x"]["y"].loadChunk<int>();
+                REQUIRE(it.meshes["rho"].scalar());
+                auto rho = it.meshes["rho"][MeshRecordComponent::SCALAR]
+                               .loadChunk<int>();
+                REQUIRE(it.particles.size() == 1);
+                REQUIRE(it.particles["e"].size() == 1);
+                REQUIRE(it.particles["e"]["charge"][RecordComponent::SCALAR]
+                            .constant());
+                it.close();
+                REQUIRE(E_x_y.get()[0] == expected);
+                REQUIRE(rho.get()[0] == expected);
+            }
+        }
+    }
+}
+
+TEST_CASE("adios2_prefetch", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_prefetch.bp";
+    constexpr size_t steps = 5;
+    constexpr size_t extent = 100;
+    {
+        Series write(name, Access::CREATE);
+        write.setIterationEncoding(IterationEncoding::variableBased);
+        for (size_t step = 0; step < steps; ++step)
+        {
+            auto it = write.writeIterations()[step];
+            for (auto const &component : {"x", "y"})
+            {
+                std::vector<double> data(extent);
+                std::iota(data.begin(), data.end(), double(step));
+                auto E = it.meshes["E"][component];
+                E.resetDataset({Datatype::DOUBLE, {extent}});
+                E.storeChunk(data, {0}, {extent});
+                it.seriesFlush();
+            }
+            it.close();
+        }
+    }
+
+    // all variables prefetched, only the first one, none
+    std::string const configs[] = {
+        R"({"adios2": {"prefetch_memory": 1048576}})",
+        R"({"adios2": {"prefetch_memory": 1000}})",
+        R"({"adios2": {"prefetch_memory": 10}})"};
+    for (auto const &config : configs)
+    {
+        Series read(name, Access::READ_LINEAR, config);
+        size_t step = 0;
+        for (auto it : read.readIterations())
+        {
+            auto E_x = it.meshes["E"]["x"].loadChunk<double>({10}, {20});
+            auto E_y = it.meshes["E"]["y"].loadChunk<double>();
+            it.close();
+            for (size_t i = 0; i < 20; ++i)
+            {
+                REQUIRE(E_x.get()[i] == double(step + 10 + i));
+            }
+            for (size_t i = 0; i < extent; ++i)
+            {
+                REQUIRE(E_y.get()[i] == double(step + i));
+            }
+            ++step;
+        }
+        REQUIRE(step == steps);
+    }
+
+    // stop reading while the next step is being prefetched
+    {
+        Series read(name, Access::READ_LINEAR, configs[0]);
+        for (auto it : read.readIterations())
+        {
+            it.close();
+            break;
+        }
+    }
+
+    REQUIRE_THROWS_AS(
+        Series(
+            name,
+            Access::READ_LINEAR,
+            R"({"adios2": {"prefetch_memory": "1MB"}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("adios2_aggregate_puts", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_aggregate_puts.bp";
+    constexpr size_t chunks = 100;
+    constexpr size_t chunkSize = 10;
+    constexpr size_t extent = chunks * chunkSize;
+    for (bool aggregate : {false, true})
+    {
+        {
+            Series write(
+                name,
+                Access::CREATE,
+                aggregate ? R"({"adios2": {"aggregate_puts": true}})" : "{}");
+            auto it = write.writeIterations()[0];
+            auto x = it.particles["e"]["position"]["x"];
+            auto y = it.particles["e"]["position"]["y"];
+            x.resetDataset({Datatype::DOUBLE, {extent}});
+            y.resetDataset({Datatype::DOUBLE, {extent}});
+            // backwards, so the stores need to be sorted before merging
+            for (size_t chunk = chunks; chunk-- > 0;)
+            {
+                std::shared_ptr<double[]> xData(new double[chunkSize]);
+                std::unique_ptr<double[]> yData(new double[chunkSize]);
+                for (size_t i = 0; i < chunkSize; ++i)
+                {
+                    xData[i] = double(chunk * chunkSize + i);
+                    yData[i] = -double(chunk * chunkSize + i);
+                }
+                x.storeChunk(xData, {chunk * chunkSize}, {chunkSize});
+                // leave a gap in y
+                if (chunk != chunks / 2)
+                {
+                    y.storeChunk(
+                        std::move(yData), {chunk * chunkSize}, {chunkSize});
+                }
+            }
+            it.close();
+        }
+
+        Series read(name, Access::READ_ONLY);
+        auto it = read.iterations[0];
+        auto x = it.particles["e"]["position"]["x"];
+        auto y = it.particles["e"]["position"]["y"];
+        REQUIRE(x.availableChunks().size() == (aggregate ? 1 : chunks));
+        REQUIRE(y.availableChunks().size() == (aggregate ? 2 : chunks - 1));
+        auto xData = x.loadChunk<double>();
+        auto yData = y.loadChunk<double>({0}, {chunks / 2 * chunkSize});
+        it.close();
+        for (size_t i = 0; i < extent; ++i)
+        {
+            REQUIRE(xData.get()[i] == double(i));
+        }
+        for (size_t i = 0; i < chunks / 2 * chunkSize; ++i)
+        {
+            REQUIRE(yData.get()[i] == -double(i));
+        }
+    }
+    REQUIRE_THROWS_AS(
+        Series(
+            name, Access::CREATE, R"({"adios2": {"aggregate_puts": "true"}})"),
+        error::BackendConfigSchema);
+}
+
+TEST_CASE("adios2_auto_operators", "[serial][adios2]")
+{
+    std::string const name = "../samples/adios2_auto_operators.bp";
+    constexpr size_t extent = 100000;
+    {
+        Series write(
+            name,
+            Access::CREATE,
+            R"({"adios2": {"dataset": {"operators": [{
+                "type": "auto",
+                "parameters": {"min_throughput": 0, "time_budget": 10}
+            }]}}})");
+        auto it = write.writeIterations()[0];
+        auto id = it.particles["e"]["id"][RecordComponent::SCALAR];
+        auto x = it.particles["e"]["position"]["x"];
+        auto y = it.particles["e"]["position"]["y"];
+        id.resetDataset({determineDatatype<uint64_t>(), {extent}});
+        x.resetDataset({Datatype::DOUBLE, {extent}});
+        // per-dataset configuration takes precedence
+        y.resetDataset(
+            {Datatype::DOUBLE,
+             {extent},
+             R"({"adios2": {"dataset": {"operators": []}}})"});
+        std::vector<uint64_t> idData(extent);
+        std::iota(idData.begin(), idData.end(), 0);
+        std::vector<double> xData(extent);
+        std::mt19937 engine(0);
+        std::uniform_real_distribution<double> dist(0., 1.);
+        std::generate(
+            xData.begin(), xData.end(), [&]() { return dist(engine); });
+        id.storeChunk(idData, {0}, {extent});
+        x.storeChunk(xData, {0}, {extent});
+        y.storeChunk(xData, {0}, {extent});
+        it.close();
+    }
+
+    {
+        Series read(name, Access::READ_ONLY);
+        auto it = read.iterations[0];
+        auto id = it.particles["e"]["id"][RecordComponent::SCALAR];
+        auto x = it.particles["e"]["position"]["x"];
+        // the recorded choice is backend-internal, not an openPMD attribute
+        REQUIRE(!id.containsAttribute("__openPMD_internal"));
+        auto idData = id.loadChunk<uint64_t>();
+        auto xData = x.loadChunk<double>();
+        it.close();
+        for (size_t i = 0; i < extent; ++i)
+        {
+            REQUIRE(idData.get()[i] == i);
+        }
+    }
+
+    adios2::ADIOS adios;
+    auto IO = adios.DeclareIO("IO");
+    auto engine = IO.Open(name, adios2::Mode::Read);
+    engine.BeginStep();
+    auto chosen = [&IO](std::string const &dataset) {
+        auto attr = IO.InquireAttribute<std::string>(
+            dataset + "/__openPMD_internal/operator");
+        return attr ? std::make_optional(attr.Data().at(0)) : std::nullopt;
+    };
+    auto idOperator = chosen("/data/0/particles/e/id");
+    REQUIRE(idOperator.has_value());
+#if defined(ADIOS2_HAVE_BLOSC2) || defined(ADIOS2_HAVE_BLOSC) ||               \
+    defined(ADIOS2_HAVE_BZIP2)
+    // consecutive integers compress well with any candidate
+    REQUIRE(*idOperator != "none");
+#else
+    REQUIRE(*idOperator == "none");
+#endif
+    REQUIRE(chosen("/data/0/particles/e/position/x").has_value());
+    REQUIRE(!chosen("/data/0/particles/e/position/y").has_value());
+    engine.EndStep();
+    engine.Close();
+
+    // file-based encoding: the choice from the first iteration carries over
+    std::string const fileBased = "../samples/adios2_auto_operators_%T.bp";
+    {
+        Series write(
+            fileBased,
+            Access::CREATE,
+            R"({"adios2": {"dataset": {"operators": [{
+                "type": "auto",
+                "parameters": {"min_throughput": 0, "time_budget": 10}
+            }]}}})");
+        std::vector<uint64_t> idData(extent);
+        std::iota(idData.begin(), idData.end(), 0);
+        for (uint64_t i = 0; i < 2; ++i)
+        {
+            if (i == 1)
+            {
+                std::reverse(idData.begin(), idData.end());
+            }
+            auto it = write.writeIterations()[i];
+            auto id = it.particles["e"]["id"][RecordComponent::SCALAR];
+            id.resetDataset({determineDatatype<uint64_t>(), {extent}});
+            id.storeChunk(idData, {0}, {extent});
+            it.close();
+        }
+    }
+    std::vector<std::string> fileBasedChoices;
+    for (char const *file :
+         {"../samples/adios2_auto_operators_0.bp",
+          "../samples/adios2_auto_operators_1.bp"})
+    {
+        auto fileIO = adios.DeclareIO(file);
+        auto fileEngine = fileIO.Open(file, adios2::Mode::Read);
+        fileEngine.BeginStep();
+        std::string const iteration = fileBasedChoices.empty() ? "0" : "1";
+        auto attr = fileIO.InquireAttribute<std::string>(
+            "/data/" + iteration +
+            "/particles/e/id/__openPMD_internal/operator");
+        REQUIRE(attr);
+        fileBasedChoices.push_back(attr.Data().at(0));
+        fileEngine.EndStep();
+        fileEngine.Close();
+    }
+    REQUIRE(fileBasedChoices.at(0) == *idOperator);
+    REQUIRE(fileBasedChoices.at(1) == *idOperator);
+
+    REQUIRE_THROWS_AS(
+        Series(
+            name,
+            Access::CREATE,
+            R"({"adios2": {"dataset": {"operators": [
+                {"type": "auto"}, {"type": "bzip2"}
+            ]}}})"),
+        error::BackendConfigSchema);
+    REQUIRE_THROWS_AS(
+        Series(
+            name,
+            Access::CREATE,
+            R"({"adios2": {"dataset": {"operators": [{
+                "type": "auto", "parameters": {"time_budget": -1}
+            }]}}})"),
+        error::BackendConfigSchema);
+}
+#endif
+
 void extendDataset(std::string const &ext, std::string const &jsonConfig)
 {
     std::string filename = "../samples/extendDataset." + ext;
@@ -359,7 +359,8 @@ class APITest(unittest.TestCase):
         # c_types
         self.assertEqual(series.get_attribute("byte_c"), 30)
         self.assertEqual(series.get_attribute("ubyte_c"), 50)
-        if file_ending != "json":  # TODO: returns [100] instead of 100 in json
+        # TODO: returns [100] instead of 100 in json
+        if file_ending not in ["json", "cbor", "msgpack", "ubjson", "bson"]:
             self.assertEqual(chr(series.get_attribute("char_c")), 'd')
         self.assertEqual(series.get_attribute("int16_c"), 2)
         self.assertEqual(series.get_attribute("int32_c"), 3)
@@ -1745,6 +1746,44 @@ class APITest(unittest.TestCase):
         for ext in tested_file_extensions:
             self.makeCloseIterationRoundTrip(ext)
 
+    def makeLoadChunkViewRoundTrip(self, file_ending):
+        # write
+        series = io.Series(
+            "../samples/unittest_loadChunkView." + file_ending,
+            io.Access_Type.create
+        )
+        data = np.arange(20, dtype=np.double).reshape(4, 5)
+        E_x = series.iterations[0].meshes["E"]["x"]
+        DS = io.Dataset(data.dtype, data.shape)
+        DS.options = '{"hdf5": {"dataset": {"chunks": "none"}}}'
+        E_x.reset_dataset(DS)
+        E_x.store_chunk(data)
+        series.close()
+
+        # read
+        read = io.Series(
+            "../samples/unittest_loadChunkView." + file_ending,
+            io.Access_Type.read_only
+        )
+        E_x = read.iterations[0].meshes["E"]["x"]
+        full = E_x.load_chunk_view()
+        rows = E_x.load_chunk_view([1, 0], [2, 5])
+        read.flush()
+
+        self.assertFalse(full.flags.writeable)
+        self.assertEqual(full.shape, (4, 5))
+        self.assertEqual(rows.shape, (2, 5))
+        np.testing.assert_array_equal(full, data)
+        np.testing.assert_array_equal(rows, data[1:3])
+        # the array keeps the data alive beyond the Series
+        read.close()
+        del read
+        np.testing.assert_array_equal(full, data)
+
+    def testLoadChunkView(self):
+        for ext in tested_file_extensions:
+            self.makeLoadChunkViewRoundTrip(ext)
+
     def makeIteratorRoundTrip(self, backend, file_ending):
         # write
         jsonConfig = """